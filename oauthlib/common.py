@@ -10,10 +10,14 @@ from __future__ import absolute_import, unicode_literals
 
 import collections
 import datetime
+import hashlib
+import json
 import logging
+import os
 import random
 import re
 import sys
+import threading
 import time
 
 try:
@@ -111,16 +115,21 @@ def decode_params_utf8(params):
 
 urlencoded = set(always_safe) | set('=&;:%+~,*@!()/?')
 
+# Matches a complete x-www-form-urlencoded string in a single scan. Only
+# characters from the urlencoded set are allowed and every % must be followed
+# by two hex digits, unless it is too close to the end of the string to be an
+# escape at all (such a trailing % is left as is, like parse_qsl does).
+URLENCODED_PATTERN = re.compile(
+    r'(?:[%s]|%%[0-9A-Fa-f]{2})*(?:%%[0-9A-Fa-f]?)?\Z' % ''.join(
+        re.escape(c) for c in sorted(urlencoded - set('%'))))
 
-def urldecode(query):
-    """Decode a query string in x-www-form-urlencoded format into a sequence
-    of two-element tuples.
+# Python 3.9.2 and later no longer split query strings on ';', see
+# https://bugs.python.org/issue42967. Follow what parse_qsl does.
+PAIR_SEPARATOR_PATTERN = (
+    re.compile('[&;]') if len(urlparse.parse_qsl('a=1;b=2')) == 2 else None)
 
-    Unlike urlparse.parse_qsl(..., strict_parsing=True) urldecode will enforce
-    correct formatting of the query string by validation. If validation fails
-    a ValueError will be raised. urllib.parse_qsl will only raise errors if
-    any of name-value pairs omits the equals sign.
-    """
+
+def _raise_urldecode_error(query):
     # Check if query contains invalid characters
     if query and not set(query) <= urlencoded:
         error = ("Error trying to decode a non urlencoded string. "
@@ -137,28 +146,53 @@ def urldecode(query):
     if INVALID_HEX_PATTERN.search(query):
         raise ValueError('Invalid hex encoding in query string.')
 
-    # We encode to utf-8 prior to parsing because parse_qsl behaves
-    # differently on unicode input in python 2 and 3.
-    # Python 2.7
-    # >>> urlparse.parse_qsl(u'%E5%95%A6%E5%95%A6')
-    # u'\xe5\x95\xa6\xe5\x95\xa6'
-    # Python 2.7, non unicode input gives the same
-    # >>> urlparse.parse_qsl('%E5%95%A6%E5%95%A6')
-    # '\xe5\x95\xa6\xe5\x95\xa6'
-    # but now we can decode it to unicode
-    # >>> urlparse.parse_qsl('%E5%95%A6%E5%95%A6').decode('utf-8')
-    # u'\u5566\u5566'
-    # Python 3.3 however
-    # >>> urllib.parse.parse_qsl(u'%E5%95%A6%E5%95%A6')
-    # u'\u5566\u5566'
-    query = query.encode(
-        'utf-8') if not PY3 and isinstance(query, unicode_type) else query
+
+def _unquote_plus(s):
+    # Decode a name or value the way parse_qsl does, skipping the work
+    # entirely for the common case of nothing to decode.
+    if '+' in s:
+        s = s.replace('+', ' ')
+    if '%' in s:
+        if PY3:
+            return _unquote(s)
+        # unquote percent-decodes to bytes on Python 2, decode them as UTF-8
+        # rather than as latin-1 code points.
+        return _unquote(s.encode('utf-8')).decode('utf-8')
+    if isinstance(s, bytes_type):
+        s = s.decode('utf-8')
+    return s
+
+
+def urldecode(query):
+    """Decode a query string in x-www-form-urlencoded format into a sequence
+    of two-element tuples.
+
+    Unlike urlparse.parse_qsl(..., strict_parsing=True) urldecode will enforce
+    correct formatting of the query string by validation. If validation fails
+    a ValueError will be raised. urllib.parse_qsl will only raise errors if
+    any of name-value pairs omits the equals sign.
+
+    The query is validated by a single regular expression scan and then split
+    and unquoted in place, yielding the same result as parse_qsl with blank
+    values kept, decoded to unicode.
+    """
+    if (PY3 and isinstance(query, bytes_type)) or not URLENCODED_PATTERN.match(query):
+        _raise_urldecode_error(query)
+
+    if PAIR_SEPARATOR_PATTERN is not None:
+        pairs = PAIR_SEPARATOR_PATTERN.split(query)
+    else:
+        pairs = query.split('&')
+
     # We want to allow queries such as "c2" whereas urlparse.parse_qsl
     # with the strict_parsing flag will not.
-    params = urlparse.parse_qsl(query, keep_blank_values=True)
-
-    # unicode all the things
-    return decode_params_utf8(params)
+    params = []
+    for pair in pairs:
+        if not pair:
+            continue
+        name, _, value = pair.partition('=')
+        params.append((_unquote_plus(name), _unquote_plus(value)))
+    return params
 
 
 def extract_params(raw):
@@ -223,13 +257,100 @@ def generate_token(length=30, chars=UNICODE_ASCII_CHARACTER_SET):
     OAuth (1 and 2) does not specify the format of tokens except that they
     should be strings of random characters. Tokens should not be guessable
     and entropy when generating the random characters is important. Which is
-    why SystemRandom is used instead of the default random.choice method.
+    why the characters are drawn from os.urandom, see TokenGenerator.
+
+    Character sets a TokenGenerator cannot use, such as unhashable sequences
+    or ones of more than 256 characters, are drawn from with SystemRandom.
+    """
+    try:
+        generator = _token_generators.get(chars)
+    except TypeError:
+        generator = None
+        cacheable = False
+    else:
+        cacheable = 1 < len(chars) <= 256
+    if generator is None:
+        if not cacheable:
+            rand = random.SystemRandom()
+            return ''.join(rand.choice(chars) for x in range(length))
+        generator = TokenGenerator(chars=chars)
+        _token_generators[chars] = generator
+    return generator.generate(length)
+
+
+class TokenGenerator(object):
+
+    """Generates tokens of characters drawn from os.urandom.
+
+    Random bytes are read buffer_size at a time rather than once per
+    character. Bytes are mapped to chars by rejection sampling, discarding
+    those beyond the largest multiple of len(chars) so that all characters
+    are equally likely. The buffer is discarded in forked processes.
+
+    Instances may be used as the token_generator of the OAuth 1 endpoints
+    and of BearerToken, the arguments they are called with being ignored::
+
+        generator = TokenGenerator(length=40)
+        bearer = BearerToken(validator, token_generator=generator)
     """
-    rand = random.SystemRandom()
-    return ''.join(rand.choice(chars) for x in range(length))
+
+    def __init__(self, length=30, chars=UNICODE_ASCII_CHARACTER_SET,
+                 buffer_size=4096):
+        if not 1 < len(chars) <= 256:
+            raise ValueError('Between 2 and 256 characters are required.')
+        self.length = length
+        self.chars = chars
+        self.buffer_size = buffer_size
+        self._limit = 256 - 256 % len(chars)
+        self._buffer = bytearray()
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        return self.generate()
+
+    def _read(self, size):
+        with self._lock:
+            if self._pid != os.getpid():
+                # Never share random bytes with the parent process.
+                self._pid = os.getpid()
+                self._buffer = bytearray()
+            if len(self._buffer) < size:
+                self._buffer += os.urandom(max(size, self.buffer_size))
+            data = self._buffer[:size]
+            del self._buffer[:size]
+        return data
+
+    def _characters(self, count):
+        chars, limit, size = self.chars, self._limit, len(self.chars)
+        result = []
+        while len(result) < count:
+            missing = count - len(result)
+            # Read enough bytes for the expected number of rejections.
+            data = self._read(missing * 256 // limit + 1)
+            result.extend(chars[b % size] for b in data if b < limit)
+        return result[:count]
+
+    def generate(self, length=None):
+        """Return a token of length characters, self.length by default."""
+        length = self.length if length is None else length
+        return ''.join(self._characters(length))
+
+    def generate_many(self, count, length=None):
+        """Return a list of count tokens of length characters."""
+        length = self.length if length is None else length
+        characters = self._characters(count * length)
+        return [''.join(characters[i:i + length])
+                for i in range(0, count * length, length)]
 
 
 def generate_signed_token(private_pem, request):
+    """Generate a RS256 JWT token from request.scope, request.expires_in and
+    request.claims.
+
+    private_pem is either a PEM encoded private key or a KeyRing, signing with
+    its active key.
+    """
     import jwt
 
     now = datetime.datetime.utcnow()
@@ -241,16 +362,51 @@ def generate_signed_token(private_pem, request):
 
     claims.update(request.claims)
 
-    token = jwt.encode(claims, private_pem, 'RS256')
+    if isinstance(private_pem, KeyRing):
+        return private_pem.sign(claims)
+
+    token = jwt.encode(claims, load_rsa_key(private_pem), 'RS256')
     token = to_unicode(token, "UTF-8")
 
     return token
 
 
 def verify_signed_token(public_pem, token):
+    """Verify a RS256 JWT token and return its claims.
+
+    public_pem is either a PEM encoded public key or a KeyRing, verifying with
+    the key named by the kid of the token header.
+    """
     import jwt
 
-    return jwt.decode(token, public_pem, algorithms=['RS256'])
+    if isinstance(public_pem, KeyRing):
+        return public_pem.verify(token)
+
+    return jwt.decode(token, load_rsa_key(public_pem), algorithms=['RS256'])
+
+
+def load_rsa_key(pem, key_cache=None):
+    """Load a PEM encoded RSA key, caching the key object.
+
+    Keys are cached in key_cache, an LRUCache which defaults to one shared
+    by oauthlib, under the SHA-256 digest of the PEM so that private keys
+    are not kept as cache keys. Key objects are returned as is.
+    """
+    if isinstance(pem, bytes_type):
+        pem = pem.decode('utf-8')
+    if not isinstance(pem, unicode_type):
+        return pem
+
+    if key_cache is None:
+        key_cache = _rsa_keys
+    fingerprint = hashlib.sha256(pem.encode('utf-8')).digest()
+    key = key_cache.get(fingerprint)
+    if key is None:
+        from jwt.algorithms import RSAAlgorithm
+
+        key = RSAAlgorithm(RSAAlgorithm.SHA256).prepare_key(pem)
+        key_cache[fingerprint] = key
+    return key
 
 
 def generate_client_id(length=30, chars=CLIENT_ID_CHARACTER_SET):
@@ -300,13 +456,28 @@ def safe_string_equals(a, b):
 
 
 def to_unicode(data, encoding='UTF-8'):
-    """Convert a number of different types of objects to unicode."""
+    """Convert a number of different types of objects to unicode.
+
+    Bytes-like objects (bytes, bytearray and memoryview) are decoded directly
+    from their buffer. Dicts whose keys and values are all unicode already are
+    returned as is rather than copied.
+    """
     if isinstance(data, unicode_type):
         return data
 
-    if isinstance(data, bytes_type):
+    if isinstance(data, memoryview) and not PY3:
+        data = data.tobytes()
+
+    if isinstance(data, (bytes_type, bytearray, memoryview)):
         return unicode_type(data, encoding=encoding)
 
+    if isinstance(data, dict):
+        if all(isinstance(k, unicode_type) and isinstance(v, unicode_type)
+               for k, v in data.items()):
+            return data
+        return dict(((to_unicode(k, encoding), to_unicode(v, encoding))
+                     for k, v in data.items()))
+
     if hasattr(data, '__iter__'):
         try:
             dict(data)
@@ -326,12 +497,17 @@ def to_unicode(data, encoding='UTF-8'):
 
 class CaseInsensitiveDict(dict):
 
-    """Basic case insensitive dict with strings only keys."""
+    """Basic case insensitive dict with strings only keys.
 
-    proxy = {}
+    Items are stored under the key they were last set with, the proxy maps
+    each lowercased key to that key. Keys which are already lowercase are
+    shared by both rather than duplicated.
+    """
+
+    __slots__ = ('proxy',)
 
     def __init__(self, data):
-        self.proxy = dict((k.lower(), k) for k in data)
+        self.proxy = {}
         for k in data:
             self[k] = data[k]
 
@@ -339,20 +515,252 @@ class CaseInsensitiveDict(dict):
         return k.lower() in self.proxy
 
     def __delitem__(self, k):
-        key = self.proxy[k.lower()]
-        super(CaseInsensitiveDict, self).__delitem__(key)
-        del self.proxy[k.lower()]
+        lower = k.lower()
+        super(CaseInsensitiveDict, self).__delitem__(self.proxy[lower])
+        del self.proxy[lower]
 
     def __getitem__(self, k):
         key = self.proxy[k.lower()]
         return super(CaseInsensitiveDict, self).__getitem__(key)
 
     def get(self, k, default=None):
-        return self[k] if k in self else default
+        key = self.proxy.get(k.lower())
+        if key is None:
+            return default
+        return super(CaseInsensitiveDict, self).__getitem__(key)
 
     def __setitem__(self, k, v):
+        lower = k.lower()
+        key = self.proxy.get(lower)
+        if key is not None and key != k:
+            super(CaseInsensitiveDict, self).__delitem__(key)
         super(CaseInsensitiveDict, self).__setitem__(k, v)
-        self.proxy[k.lower()] = k
+        self.proxy[k if lower == k else lower] = k
+
+
+class LRUCache(object):
+
+    """Thread safe mapping of at most maxsize items.
+
+    Once full, storing a new item evicts the least recently used one. Items
+    expire ttl seconds after being stored if a ttl is given, either for the
+    whole cache or per item through set.
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, expires = self._items.pop(key)
+            except KeyError:
+                return default
+            if expires is not None and expires <= time.time():
+                return default
+            self._items[key] = value, expires
+            return value
+
+    def set(self, key, value, ttl=None):
+        """Store an item, expiring after ttl seconds rather than the default
+        ttl of the cache if given."""
+        if ttl is None:
+            ttl = self.ttl
+        expires = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value, expires
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            value, expires = self._items.pop(key, (default, None))
+            if expires is not None and expires <= time.time():
+                return default
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+# Marks an item missing from a LRUCache, None being a valid cached value.
+_MISSING = object()
+
+
+# TokenGenerators of generate_token, by character set.
+_token_generators = LRUCache(maxsize=16)
+
+
+# RSA key objects loaded from PEM strings, keyed by the SHA-256 digest of the
+# PEM. Loading a key costs more than the signature operation itself.
+_rsa_keys = LRUCache(maxsize=128)
+
+
+class KeyRing(object):
+
+    """RSA keys of signed tokens, indexed by key id (kid).
+
+    Tokens are signed with the active key, its kid being set in the token
+    header, and verified with the key named by their kid. Keys are parsed
+    once when added. To rotate keys, add the new key as the active one and
+    remove the previous key once the tokens it signed have expired.
+
+    Resource servers may load the public keys from a local JWKS file. Given
+    jwks_file, the file is read again on verification once reload_interval
+    seconds have passed, so that keys published or withdrawn by the
+    authorization server are picked up without a restart. Keys added with
+    add_key are kept across reloads. Should the file be unreadable, the
+    current keys are kept until the next reload.
+    """
+
+    def __init__(self, jwks_file=None, reload_interval=60):
+        self.jwks_file = jwks_file
+        self.reload_interval = reload_interval
+        self.active_kid = None
+        # Maps kid to (private key, public key), replaced on updates.
+        self._keys = {}
+        # The keys added with add_key, which reloads do not drop.
+        self._added = {}
+        self._loaded = None
+        if jwks_file is not None:
+            self.load_jwks(jwks_file)
+
+    def __contains__(self, kid):
+        return kid in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add_key(self, kid, private_pem=None, public_pem=None, active=False):
+        """Add a key from its PEM encoded private or public key.
+
+        The key becomes the active signing key if active is true, which
+        requires its private key.
+        """
+        from jwt.algorithms import RSAAlgorithm
+
+        algorithm = RSAAlgorithm(RSAAlgorithm.SHA256)
+        private_key = public_key = None
+        if private_pem is not None:
+            private_key = algorithm.prepare_key(private_pem)
+            public_key = private_key.public_key()
+        if public_pem is not None:
+            public_key = algorithm.prepare_key(public_pem)
+        if public_key is None:
+            raise ValueError('A private or public key is required.')
+        if active and private_key is None:
+            raise ValueError('The active key requires a private key.')
+        self._added = dict(self._added)
+        self._added[kid] = private_key, public_key
+        keys = dict(self._keys)
+        keys[kid] = private_key, public_key
+        self._keys = keys
+        if active:
+            self.active_kid = kid
+
+    def remove_key(self, kid):
+        added = dict(self._added)
+        added.pop(kid, None)
+        self._added = added
+        keys = dict(self._keys)
+        keys.pop(kid, None)
+        self._keys = keys
+        if kid == self.active_kid:
+            self.active_kid = None
+
+    def load_jwks(self, jwks_file):
+        """Replace the keys of a previously loaded JWKS file with the RSA
+        keys of jwks_file, other keys are ignored.
+        """
+        from jwt.algorithms import RSAAlgorithm
+
+        with open(jwks_file) as f:
+            jwks = json.load(f)
+        keys = {}
+        for jwk in jwks.get('keys', []):
+            if jwk.get('kty') != 'RSA' or 'kid' not in jwk:
+                continue
+            key = RSAAlgorithm.from_jwk(json.dumps(jwk))
+            if 'd' in jwk:
+                keys[jwk['kid']] = key, key.public_key()
+            else:
+                keys[jwk['kid']] = None, key
+        keys.update(self._added)
+        self._keys = keys
+        self._loaded = time.time()
+
+    def jwks(self):
+        """Return the public keys as a JWKS dict, to be published."""
+        from jwt.algorithms import RSAAlgorithm
+
+        keys = []
+        for kid, (_, public_key) in sorted(self._keys.items()):
+            jwk = json.loads(RSAAlgorithm.to_jwk(public_key))
+            jwk.update(kid=kid, use='sig', alg='RS256')
+            keys.append(jwk)
+        return {'keys': keys}
+
+    def sign(self, claims):
+        """Return a RS256 JWT token of claims signed with the active key."""
+        import jwt
+
+        if self.active_kid is None:
+            raise ValueError('No active key to sign tokens with.')
+        private_key, _ = self._keys[self.active_kid]
+        token = jwt.encode(claims, private_key, 'RS256',
+                           headers={'kid': self.active_kid})
+        return to_unicode(token, 'UTF-8')
+
+    def verify(self, token):
+        """Verify a RS256 JWT token with the key of its kid, return its
+        claims.
+
+        Raises jwt.InvalidTokenError if the token is invalid or names an
+        unknown kid.
+        """
+        import jwt
+
+        kid = jwt.get_unverified_header(token).get('kid')
+        if self._should_reload():
+            self._reload()
+        keys = self._keys.get(kid)
+        if keys is None:
+            raise jwt.InvalidTokenError('Unknown key id %r.' % kid)
+        return jwt.decode(token, keys[1], algorithms=['RS256'])
+
+    def _should_reload(self):
+        return (self.jwks_file is not None and
+                time.time() - self._loaded >= self.reload_interval)
+
+    def _reload(self):
+        # A missing or half written file keeps the current keys until the
+        # next attempt, rather than failing every verification.
+        from jwt.exceptions import InvalidKeyError
+
+        try:
+            self.load_jwks(self.jwks_file)
+        except (IOError, OSError, ValueError, InvalidKeyError) as e:
+            log.warning('Failed to reload JWKS file %s, %s.',
+                        self.jwks_file, e)
+            self._loaded = time.time()
+
+
+# Marks a lazily decoded Request attribute which has not been computed yet.
+_UNPARSED = object()
 
 
 class Request(object):
@@ -368,8 +776,75 @@ class Request(object):
 
     Anything else will be treated as raw body data to be passed through
     unmolested.
+
+    Parsing is lazy: the body is only decoded, and the query and body
+    parameters only merged with the headers, once ``decoded_body`` or one of
+    the request parameters (``client_id``, ``scope``, ...) is first read. The
+    result is cached for the lifetime of the request. As a consequence a
+    malformed query string raises ``ValueError`` on first access rather than
+    on construction.
+
+    Likewise the uri is split by urlparse at most once, see ``parsed_uri``,
+    ``decoded_query`` and ``uri_query_params``. The cached components are
+    discarded if the uri attribute is reassigned.
+
+    The well-known request parameters are slots. A parameter which has not
+    been set reads as the value supplied in the headers, body or query, or
+    None. Any other attribute, such as those set by endpoints while
+    processing a request, goes to an instance dict which is only allocated
+    once such an attribute is set.
+
+    Input which is unicode already is used as is. A bytes, bytearray or
+    memoryview body is kept undecoded until ``body`` (or ``decoded_body``, or
+    a body parameter) is first read, so requests which are verified from their
+    headers alone never decode or copy the body.
     """
 
+    # Parameters which read as None unless set or supplied with the request.
+    well_known_params = (
+        "access_token",
+        "client",
+        "client_id",
+        "client_secret",
+        "code",
+        "extra_credentials",
+        "grant_type",
+        "redirect_uri",
+        "refresh_token",
+        "request_token",
+        "response_type",
+        "scope",
+        "scopes",
+        "state",
+        "token",
+        "user",
+        "token_type_hint",
+
+        # OpenID Connect
+        "response_mode",
+        "nonce",
+        "display",
+        "prompt",
+        "claims",
+        "max_age",
+        "ui_locales",
+        "id_token_hint",
+        "login_hint",
+        "acr_values",
+    )
+
+    __slots__ = well_known_params + (
+        # Request data and lazily computed caches
+        '_uri', 'http_method', 'headers', '_body', '_body_encoding',
+        'oauth_params',
+        'validator_log', '_decoded_body', '_parsed_params', '_parsed_uri',
+        '_decoded_query', '_uri_query_params',
+
+        '__dict__', '__weakref__',
+    )
+
+    _well_known_params = frozenset(well_known_params)
+
     def __init__(self, uri, http_method='GET', body=None, headers=None,
                  encoding='utf-8'):
         # Convert to unicode using encoding if given, else assume unicode
@@ -378,52 +853,73 @@ class Request(object):
         self.uri = encode(uri)
         self.http_method = encode(http_method)
         self.headers = CaseInsensitiveDict(encode(headers or {}))
-        self.body = encode(body)
-        self.decoded_body = extract_params(self.body)
+        if encoding and isinstance(body, (bytes_type, bytearray, memoryview)):
+            # Decoded on first access, see body.
+            self._body = body
+            self._body_encoding = encoding
+        else:
+            self.body = encode(body)
         self.oauth_params = []
         self.validator_log = {}
 
-        self._params = {
-            "access_token": None,
-            "client": None,
-            "client_id": None,
-            "client_secret": None,
-            "code": None,
-            "extra_credentials": None,
-            "grant_type": None,
-            "redirect_uri": None,
-            "refresh_token": None,
-            "request_token": None,
-            "response_type": None,
-            "scope": None,
-            "scopes": None,
-            "state": None,
-            "token": None,
-            "user": None,
-            "token_type_hint": None,
-
-            # OpenID Connect
-            "response_mode": None,
-            "nonce": None,
-            "display": None,
-            "prompt": None,
-            "claims": None,
-            "max_age": None,
-            "ui_locales": None,
-            "id_token_hint": None,
-            "login_hint": None,
-            "acr_values": None
-        }
-        self._params.update(dict(urldecode(self.uri_query)))
-        self._params.update(dict(self.decoded_body or []))
-        self._params.update(self.headers)
+        # Body decoding, query parsing and parameter merging are deferred
+        # until a parameter is first read, see decoded_body and _params.
+        self._decoded_body = _UNPARSED
+        self._parsed_params = None
+
+    @property
+    def uri(self):
+        return self._uri
+
+    @uri.setter
+    def uri(self, uri):
+        self._uri = uri
+        self._parsed_uri = None
+        self._decoded_query = None
+        self._uri_query_params = None
+
+    @property
+    def body(self):
+        if self._body_encoding is not None:
+            self._body = to_unicode(self._body, self._body_encoding)
+            self._body_encoding = None
+        return self._body
+
+    @body.setter
+    def body(self, body):
+        self._body = body
+        self._body_encoding = None
 
     def __getattr__(self, name):
-        if name in self._params:
-            return self._params[name]
+        # Only reached for attributes which have not been set, including
+        # unset slots.
+        params = self._params
+        if name in params:
+            return params[name]
+        elif name in self._well_known_params:
+            return None
         else:
             raise AttributeError(name)
 
+    @property
+    def decoded_body(self):
+        if self._decoded_body is _UNPARSED:
+            self._decoded_body = extract_params(self.body)
+        return self._decoded_body
+
+    @decoded_body.setter
+    def decoded_body(self, decoded_body):
+        self._decoded_body = decoded_body
+
+    @property
+    def _params(self):
+        if self._parsed_params is None:
+            params = dict(self.decoded_query)
+            params.update(self.decoded_body or [])
+            params.update(self.headers)
+            self._parsed_params = params
+        return self._parsed_params
+
     def __repr__(self):
         body = self.body
         headers = self.headers.copy()
@@ -434,16 +930,35 @@ class Request(object):
         return '<oauthlib.Request url="%s", http_method="%s", headers="%s", body="%s">' % (
             self.uri, self.http_method, headers, body)
 
+    @property
+    def parsed_uri(self):
+        """The uri as a 6-tuple from urlparse, parsed once and cached."""
+        if self._parsed_uri is None:
+            self._parsed_uri = urlparse.urlparse(self.uri)
+        return self._parsed_uri
+
     @property
     def uri_query(self):
-        return urlparse.urlparse(self.uri).query
+        return self.parsed_uri.query
+
+    @property
+    def decoded_query(self):
+        """The query component decoded by urldecode, decoded once and cached.
+        """
+        if self._decoded_query is None:
+            self._decoded_query = urldecode(self.uri_query)
+        return self._decoded_query
 
     @property
     def uri_query_params(self):
-        if not self.uri_query:
-            return []
-        return urlparse.parse_qsl(self.uri_query, keep_blank_values=True,
-                                  strict_parsing=True)
+        if self._uri_query_params is None:
+            if not self.uri_query:
+                self._uri_query_params = []
+            else:
+                self._uri_query_params = urlparse.parse_qsl(
+                    self.uri_query, keep_blank_values=True,
+                    strict_parsing=True)
+        return self._uri_query_params
 
     @property
     def duplicate_params(self):
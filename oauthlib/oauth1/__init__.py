@@ -12,7 +12,8 @@ from .rfc5849 import Client
 from .rfc5849 import SIGNATURE_HMAC, SIGNATURE_RSA, SIGNATURE_PLAINTEXT
 from .rfc5849 import SIGNATURE_TYPE_AUTH_HEADER, SIGNATURE_TYPE_QUERY
 from .rfc5849 import SIGNATURE_TYPE_BODY
-from .rfc5849.request_validator import RequestValidator
+from .rfc5849.request_validator import RequestValidator, CachingRequestValidator
+from .rfc5849.nonces import NonceStore, SharedNonceStore, BloomNonceStore
 from .rfc5849.endpoints import RequestTokenEndpoint, AuthorizationEndpoint
 from .rfc5849.endpoints import AccessTokenEndpoint, ResourceEndpoint
 from .rfc5849.endpoints import SignatureOnlyEndpoint, WebApplicationServer
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+"""
+oauthlib.oauth1.rfc5849.endpoints.aio
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module provides asyncio variants of the OAuth 1.0 RFC 5849 endpoints,
+to be used with request validators whose methods are coroutines. Validator
+methods may be coroutines or plain functions, the result is awaited whenever
+it is awaitable.
+
+As with the synchronous endpoints, the client key and then the token are
+validated first, and replaced by the validator dummies when invalid. The
+lookups depending on them, such as realms and the signature secrets, are then
+run concurrently.
+
+The module requires Python 3.5 or later, it is not imported by the endpoints
+package and must be imported explicitly::
+
+    from oauthlib.oauth1.rfc5849.endpoints.aio import AsyncResourceEndpoint
+"""
+from __future__ import absolute_import, unicode_literals
+
+import asyncio
+import inspect
+import logging
+
+from oauthlib.common import urlencode
+
+from .base import BaseEndpoint
+from .. import errors
+from .. import SIGNATURE_RSA
+
+log = logging.getLogger(__name__)
+
+
+async def _call(method, *args, **kwargs):
+    """Call a validator method, awaiting its result if needed."""
+    result = method(*args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+class AsyncBaseEndpoint(BaseEndpoint):
+
+    async def _check_signature(self, request, is_token_request=False):
+        signature_key = await self._get_signature_key(
+            request, is_token_request)
+        return self._verify_signature(request, signature_key)
+
+    async def _get_signature_key(self, request, is_token_request=False):
+        """Fetch the key needed to verify the request signature.
+
+        The client and resource owner secrets are fetched concurrently.
+        """
+        if request.signature_method == SIGNATURE_RSA:
+            return await _call(self.request_validator.get_rsa_key,
+                               request.client_key, request)
+
+        lookups = [_call(self.request_validator.get_client_secret,
+                         request.client_key, request)]
+        if request.resource_owner_key:
+            if is_token_request:
+                get_token_secret = self.request_validator.get_request_token_secret
+            else:
+                get_token_secret = self.request_validator.get_access_token_secret
+            lookups.append(_call(get_token_secret, request.client_key,
+                                 request.resource_owner_key, request))
+        secrets = await asyncio.gather(*lookups)
+        if len(secrets) == 1:
+            return secrets[0], None
+        return tuple(secrets)
+
+
+class AsyncRequestTokenEndpoint(AsyncBaseEndpoint):
+
+    """Asyncio variant of the RequestTokenEndpoint.
+
+    The requested realms, callback URI and signature are validated
+    concurrently once the client key is.
+    """
+
+    async def create_request_token(self, request, credentials):
+        """Create and save a new request token.
+
+        :param request: An oauthlib.common.Request object.
+        :param credentials: A dict of extra token credentials.
+        :returns: The token as an urlencoded string.
+        """
+        token = {
+            'oauth_token': self.token_generator(),
+            'oauth_token_secret': self.token_generator(),
+            'oauth_callback_confirmed': 'true'
+        }
+        token.update(credentials)
+        await _call(self.request_validator.save_request_token, token, request)
+        return urlencode(token.items())
+
+    async def create_request_token_response(self, uri, http_method='GET',
+                                            body=None, headers=None,
+                                            credentials=None):
+        """Create a request token response, with a new request token if valid.
+
+        See RequestTokenEndpoint.create_request_token_response.
+        """
+        resp_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        try:
+            request = self._create_request(uri, http_method, body, headers)
+            valid, processed_request = await self.validate_request_token_request(
+                request)
+            if valid:
+                token = await self.create_request_token(
+                    request, credentials or {})
+                return resp_headers, token, 200
+            else:
+                return {}, None, 401
+        except errors.OAuth1Error as e:
+            return resp_headers, e.urlencoded, e.status_code
+
+    async def validate_request_token_request(self, request):
+        """Validate a request token request.
+
+        See RequestTokenEndpoint.validate_request_token_request.
+        """
+        self._check_transport_security(request)
+        self._check_mandatory_parameters(request)
+
+        if request.realm:
+            request.realms = request.realm.split(' ')
+        else:
+            request.realms = await _call(
+                self.request_validator.get_default_realms,
+                request.client_key, request)
+        if not self.request_validator.check_realms(request.realms):
+            raise errors.InvalidRequestError(
+                description='Invalid realm %s. Allowed are %r.' % (
+                    request.realms, self.request_validator.realms))
+
+        if not request.redirect_uri:
+            raise errors.InvalidRequestError(
+                description='Missing callback URI.')
+
+        if not await _call(self.request_validator.validate_timestamp_and_nonce,
+                           request.client_key, request.timestamp,
+                           request.nonce, request,
+                           request_token=request.resource_owner_key):
+            return False, request
+
+        valid_client = await _call(self.request_validator.validate_client_key,
+                                   request.client_key, request)
+        if not valid_client:
+            request.client_key = self.request_validator.dummy_client
+
+        valid_realm, valid_redirect, valid_signature = await asyncio.gather(
+            _call(self.request_validator.validate_requested_realms,
+                  request.client_key, request.realms, request),
+            _call(self.request_validator.validate_redirect_uri,
+                  request.client_key, request.redirect_uri, request),
+            self._check_signature(request))
+        if not request.redirect_uri:
+            raise NotImplementedError('Redirect URI must either be provided '
+                                      'or set to a default during validation.')
+
+        request.validator_log['client'] = valid_client
+        request.validator_log['realm'] = valid_realm
+        request.validator_log['callback'] = valid_redirect
+        request.validator_log['signature'] = valid_signature
+
+        v = all((valid_client, valid_realm, valid_redirect, valid_signature))
+        if not v:
+            log.info("[Failure] request verification failed.")
+            log.info("Valid client: %s.", valid_client)
+            log.info("Valid realm: %s.", valid_realm)
+            log.info("Valid callback: %s.", valid_redirect)
+            log.info("Valid signature: %s.", valid_signature)
+        return v, request
+
+
+class AsyncAccessTokenEndpoint(AsyncBaseEndpoint):
+
+    """Asyncio variant of the AccessTokenEndpoint.
+
+    The verifier and signature are validated concurrently once the client
+    key and request token are.
+    """
+
+    async def create_access_token(self, request, credentials):
+        """Create and save a new access token.
+
+        :param request: An oauthlib.common.Request object.
+        :returns: The token as an urlencoded string.
+        """
+        request.realms = await _call(self.request_validator.get_realms,
+                                     request.resource_owner_key, request)
+        token = {
+            'oauth_token': self.token_generator(),
+            'oauth_token_secret': self.token_generator(),
+            # Backport the authorized scopes indication used in OAuth2
+            'oauth_authorized_realms': ' '.join(request.realms)
+        }
+        token.update(credentials)
+        await _call(self.request_validator.save_access_token, token, request)
+        return urlencode(token.items())
+
+    async def create_access_token_response(self, uri, http_method='GET',
+                                           body=None, headers=None,
+                                           credentials=None):
+        """Create an access token response, with a new request token if valid.
+
+        See AccessTokenEndpoint.create_access_token_response.
+        """
+        resp_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        try:
+            request = self._create_request(uri, http_method, body, headers)
+            valid, processed_request = await self.validate_access_token_request(
+                request)
+            if valid:
+                token = await self.create_access_token(
+                    request, credentials or {})
+                await _call(self.request_validator.invalidate_request_token,
+                            request.client_key,
+                            request.resource_owner_key,
+                            request)
+                return resp_headers, token, 200
+            else:
+                return {}, None, 401
+        except errors.OAuth1Error as e:
+            return resp_headers, e.urlencoded, e.status_code
+
+    async def validate_access_token_request(self, request):
+        """Validate an access token request.
+
+        See AccessTokenEndpoint.validate_access_token_request.
+        """
+        self._check_transport_security(request)
+        self._check_mandatory_parameters(request)
+
+        if not request.resource_owner_key:
+            raise errors.InvalidRequestError(
+                description='Missing resource owner.')
+
+        if not self.request_validator.check_request_token(
+                request.resource_owner_key):
+            raise errors.InvalidRequestError(
+                description='Invalid resource owner key format.')
+
+        if not request.verifier:
+            raise errors.InvalidRequestError(
+                description='Missing verifier.')
+
+        if not self.request_validator.check_verifier(request.verifier):
+            raise errors.InvalidRequestError(
+                description='Invalid verifier format.')
+
+        if not await _call(self.request_validator.validate_timestamp_and_nonce,
+                           request.client_key, request.timestamp,
+                           request.nonce, request,
+                           request_token=request.resource_owner_key):
+            return False, request
+
+        valid_client = await _call(self.request_validator.validate_client_key,
+                                   request.client_key, request)
+        if not valid_client:
+            request.client_key = self.request_validator.dummy_client
+
+        valid_resource_owner = await _call(
+            self.request_validator.validate_request_token,
+            request.client_key, request.resource_owner_key, request)
+        if not valid_resource_owner:
+            request.resource_owner_key = self.request_validator.dummy_request_token
+
+        valid_verifier, valid_signature = await asyncio.gather(
+            _call(self.request_validator.validate_verifier,
+                  request.client_key, request.resource_owner_key,
+                  request.verifier, request),
+            self._check_signature(request, is_token_request=True))
+
+        request.validator_log['client'] = valid_client
+        request.validator_log['resource_owner'] = valid_resource_owner
+        request.validator_log['verifier'] = valid_verifier
+        request.validator_log['signature'] = valid_signature
+
+        v = all((valid_client, valid_resource_owner, valid_verifier,
+                 valid_signature))
+        if not v:
+            log.info("[Failure] request verification failed.")
+            log.info("Valid client:, %s", valid_client)
+            log.info("Valid token:, %s", valid_resource_owner)
+            log.info("Valid verifier:, %s", valid_verifier)
+            log.info("Valid signature:, %s", valid_signature)
+        return v, request
+
+
+class AsyncResourceEndpoint(AsyncBaseEndpoint):
+
+    """Asyncio variant of the ResourceEndpoint.
+
+    The realms and signature are validated concurrently once the client key
+    and access token are.
+    """
+
+    async def validate_protected_resource_request(self, uri, http_method='GET',
+                                                  body=None, headers=None,
+                                                  realms=None):
+        """Validate a request to a protected resource.
+
+        See ResourceEndpoint.validate_protected_resource_request.
+        """
+        try:
+            request = self._create_request(uri, http_method, body, headers)
+        except errors.OAuth1Error:
+            return False, None
+
+        try:
+            self._check_transport_security(request)
+            self._check_mandatory_parameters(request)
+        except errors.OAuth1Error:
+            return False, request
+
+        if not request.resource_owner_key:
+            return False, request
+
+        if not self.request_validator.check_access_token(
+                request.resource_owner_key):
+            return False, request
+
+        if not await _call(self.request_validator.validate_timestamp_and_nonce,
+                           request.client_key, request.timestamp,
+                           request.nonce, request,
+                           access_token=request.resource_owner_key):
+            return False, request
+
+        valid_client = await _call(self.request_validator.validate_client_key,
+                                   request.client_key, request)
+        if not valid_client:
+            request.client_key = self.request_validator.dummy_client
+
+        valid_resource_owner = await _call(
+            self.request_validator.validate_access_token,
+            request.client_key, request.resource_owner_key, request)
+        if not valid_resource_owner:
+            request.resource_owner_key = self.request_validator.dummy_access_token
+
+        valid_realm, valid_signature = await asyncio.gather(
+            _call(self.request_validator.validate_realms,
+                  request.client_key, request.resource_owner_key, request,
+                  uri=request.uri, realms=realms),
+            self._check_signature(request))
+
+        request.validator_log['client'] = valid_client
+        request.validator_log['resource_owner'] = valid_resource_owner
+        request.validator_log['realm'] = valid_realm
+        request.validator_log['signature'] = valid_signature
+
+        v = all((valid_client, valid_resource_owner, valid_realm,
+                 valid_signature))
+        if not v:
+            log.info("[Failure] request verification failed.")
+            log.info("Valid client: %s", valid_client)
+            log.info("Valid token: %s", valid_resource_owner)
+            log.info("Valid realm: %s", valid_realm)
+            log.info("Valid signature: %s", valid_signature)
+        return v, request
+
+
+class AsyncSignatureOnlyEndpoint(AsyncBaseEndpoint):
+
+    """Asyncio variant of the SignatureOnlyEndpoint."""
+
+    async def validate_request(self, uri, http_method='GET',
+                               body=None, headers=None):
+        """Validate a signed OAuth request.
+
+        See SignatureOnlyEndpoint.validate_request.
+        """
+        try:
+            request = self._create_request(uri, http_method, body, headers)
+        except errors.OAuth1Error:
+            return False, None
+
+        try:
+            self._check_transport_security(request)
+            self._check_mandatory_parameters(request)
+        except errors.OAuth1Error:
+            return False, request
+
+        if not await _call(self.request_validator.validate_timestamp_and_nonce,
+                           request.client_key, request.timestamp,
+                           request.nonce, request):
+            return False, request
+
+        valid_client = await _call(self.request_validator.validate_client_key,
+                                   request.client_key, request)
+        if not valid_client:
+            request.client_key = self.request_validator.dummy_client
+
+        valid_signature = await self._check_signature(request)
+
+        request.validator_log['client'] = valid_client
+        request.validator_log['signature'] = valid_signature
+
+        v = all((valid_client, valid_signature))
+        if not v:
+            log.info("[Failure] request verification failed.")
+            log.info("Valid client: %s", valid_client)
+            log.info("Valid signature: %s", valid_signature)
+        return v, request
@@ -22,35 +22,54 @@ from .. import SIGNATURE_TYPE_BODY
 
 class BaseEndpoint(object):
 
-    def __init__(self, request_validator, token_generator=None):
+    def __init__(self, request_validator, token_generator=None,
+                 rsa_key_cache=None):
+        """
+        :param request_validator: An oauthlib.oauth1.RequestValidator.
+        :param token_generator: Function generating tokens, defaults to
+                                oauthlib.common.generate_token.
+        :param rsa_key_cache: An oauthlib.common.LRUCache holding the RSA key
+                              objects loaded from the PEM strings returned by
+                              get_rsa_key. Defaults to a cache shared by all
+                              endpoints, pass LRUCache(maxsize=0) to disable.
+        """
         self.request_validator = request_validator
         self.token_generator = token_generator or generate_token
+        self.rsa_key_cache = rsa_key_cache
 
     def _get_signature_type_and_params(self, request):
         """Extracts parameters from query, headers and body. Signature type
         is set to the source in which parameters were found.
+
+        Each source is parsed only once: body and query are the ones already
+        decoded by the request, and oauth_ parameters are unescaped and
+        picked out per source in the same pass.
         """
         # Per RFC5849, only the Authorization header may contain the 'realm'
         # optional parameter.
-        header_params = signature.collect_parameters(headers=request.headers,
-                                                     exclude_oauth_signature=False, with_realm=True)
-        body_params = signature.collect_parameters(body=request.body,
-                                                   exclude_oauth_signature=False)
-        query_params = signature.collect_parameters(uri_query=request.uri_query,
-                                                    exclude_oauth_signature=False)
+        authorization_header = request.headers.get('Authorization')
+        if authorization_header is not None:
+            header_params = utils.parse_authorization_header(
+                authorization_header)
+        else:
+            header_params = []
 
         params = []
-        params.extend(header_params)
-        params.extend(body_params)
-        params.extend(query_params)
-        signature_types_with_oauth_params = list(filter(lambda s: s[2], (
-            (SIGNATURE_TYPE_AUTH_HEADER, params,
-                utils.filter_oauth_params(header_params)),
-            (SIGNATURE_TYPE_BODY, params,
-                utils.filter_oauth_params(body_params)),
-            (SIGNATURE_TYPE_QUERY, params,
-                utils.filter_oauth_params(query_params))
-        )))
+        signature_types_with_oauth_params = []
+        for signature_type, source_params in (
+                (SIGNATURE_TYPE_AUTH_HEADER, header_params),
+                (SIGNATURE_TYPE_BODY, request.decoded_body or []),
+                (SIGNATURE_TYPE_QUERY, request.decoded_query)):
+            oauth_params = []
+            for k, v in source_params:
+                # ensure all oauth params are unescaped
+                if k.startswith('oauth_'):
+                    v = utils.unescape(v)
+                    oauth_params.append((k, v))
+                params.append((k, v))
+            if oauth_params:
+                signature_types_with_oauth_params.append(
+                    (signature_type, params, oauth_params))
 
         if len(signature_types_with_oauth_params) > 1:
             found_types = [s[0] for s in signature_types_with_oauth_params]
@@ -95,16 +114,22 @@ class BaseEndpoint(object):
         request.redirect_uri = oauth_params.get('oauth_callback')
         request.verifier = oauth_params.get('oauth_verifier')
         request.signature_method = oauth_params.get('oauth_signature_method')
-        request.realm = dict(params).get('realm')
+        request.signature_type = signature_type
         request.oauth_params = oauth_params
 
         # Parameters to Client depend on signature method which may vary
         # for each request. Note that HMAC-SHA1 and PLAINTEXT share parameters
-        request.params = [(k, v) for k, v in params if k != "oauth_signature"]
-
-        if 'realm' in request.headers.get('Authorization', ''):
-            request.params = [(k, v)
-                              for k, v in request.params if k != "realm"]
+        exclude_realm = 'realm' in request.headers.get('Authorization', '')
+        request.realm = None
+        request.params = []
+        for k, v in params:
+            if k == 'realm':
+                request.realm = v
+                if exclude_realm:
+                    continue
+            elif k == 'oauth_signature':
+                continue
+            request.params.append((k, v))
 
         return request
 
@@ -181,13 +206,38 @@ class BaseEndpoint(object):
                 description='Invalid nonce format.')
 
     def _check_signature(self, request, is_token_request=False):
+        signature_key = self._get_signature_key(request, is_token_request)
+        return self._verify_signature(request, signature_key)
+
+    def _get_signature_key(self, request, is_token_request=False):
+        """Fetch the key needed to verify the request signature.
+
+        Returns the client's rsa key for RSA-SHA1 and a tuple of the client
+        and resource owner secrets for HMAC-SHA1 and PLAINTEXT.
+        """
+        if request.signature_method == SIGNATURE_RSA:
+            return self.request_validator.get_rsa_key(
+                request.client_key, request)
+
+        client_secret = self.request_validator.get_client_secret(
+            request.client_key, request)
+        resource_owner_secret = None
+        if request.resource_owner_key:
+            if is_token_request:
+                resource_owner_secret = self.request_validator.get_request_token_secret(
+                    request.client_key, request.resource_owner_key, request)
+            else:
+                resource_owner_secret = self.request_validator.get_access_token_secret(
+                    request.client_key, request.resource_owner_key, request)
+        return client_secret, resource_owner_secret
+
+    def _verify_signature(self, request, signature_key):
         # ---- RSA Signature verification ----
         if request.signature_method == SIGNATURE_RSA:
             # The server verifies the signature per `[RFC3447] section 8.2.2`_
             # .. _`[RFC3447] section 8.2.2`: http://tools.ietf.org/html/rfc3447#section-8.2.1
-            rsa_key = self.request_validator.get_rsa_key(
-                request.client_key, request)
-            valid_signature = signature.verify_rsa_sha1(request, rsa_key)
+            valid_signature = signature.verify_rsa_sha1(
+                request, signature_key, key_cache=self.rsa_key_cache)
 
         # ---- HMAC or Plaintext Signature verification ----
         else:
@@ -196,17 +246,7 @@ class BaseEndpoint(object):
             #   `Section 3.4`_ and comparing it to the value received from the
             #   client via the "oauth_signature" parameter.
             # .. _`Section 3.4`: http://tools.ietf.org/html/rfc5849#section-3.4
-            client_secret = self.request_validator.get_client_secret(
-                request.client_key, request)
-            resource_owner_secret = None
-            if request.resource_owner_key:
-                if is_token_request:
-                    resource_owner_secret = self.request_validator.get_request_token_secret(
-                        request.client_key, request.resource_owner_key, request)
-                else:
-                    resource_owner_secret = self.request_validator.get_access_token_secret(
-                        request.client_key, request.resource_owner_key, request)
-
+            client_secret, resource_owner_secret = signature_key
             if request.signature_method == SIGNATURE_HMAC:
                 valid_signature = signature.verify_hmac_sha1(request,
                                                              client_secret, resource_owner_secret)
@@ -10,8 +10,14 @@ from __future__ import absolute_import, unicode_literals
 
 import logging
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # Python 2 without the futures backport
+    ThreadPoolExecutor = None
+
 from .base import BaseEndpoint
 from .. import errors
+from .. import SIGNATURE_RSA
 
 log = logging.getLogger(__name__)
 
@@ -32,20 +38,99 @@ class SignatureOnlyEndpoint(BaseEndpoint):
                   1. True if valid, False otherwise.
                   2. An oauthlib.common.Request object.
         """
+        checked, request, valid_client = self._check_request(
+            uri, http_method, body, headers)
+        if not checked:
+            return False, request
+
+        valid_signature = self._check_signature(request)
+        return self._check_result(request, valid_client, valid_signature), request
+
+    def validate_requests(self, requests, max_workers=None):
+        """Validate a batch of signed OAuth requests.
+
+        :param requests: An iterable of (uri, http_method, body, headers)
+                         tuples, trailing elements may be left out just as
+                         with the arguments of validate_request.
+        :param max_workers: The maximum number of threads verifying RSA-SHA1
+                            signatures concurrently, one per signature up to
+                            32 by default.
+        :returns: A list of (valid, request) tuples, as returned by
+                  validate_request, in the order of the requests.
+
+        Each request goes through the same checks as with validate_request,
+        in order. The secrets (or RSA key) needed to verify the signatures
+        are however only fetched once per client and token in the batch,
+        get_client_secret and friends receive the first request of each
+        group. HMAC-SHA1 and PLAINTEXT signatures are verified as their
+        requests are checked, with the secrets of their group. RSA-SHA1
+        signatures are verified concurrently on a thread pool, the
+        cryptography library releases the GIL while doing so. Without
+        concurrent.futures (i.e. on Python 2 without the futures backport)
+        they are verified in turn.
+        """
+        results = []
+        signature_keys = {}
+        rsa_checks = []
+        for args in requests:
+            checked, request, valid_client = self._check_request(*args)
+            if not checked:
+                results.append((False, request))
+                continue
+
+            is_rsa = request.signature_method == SIGNATURE_RSA
+            group = (is_rsa, request.client_key,
+                     None if is_rsa else request.resource_owner_key)
+            if group not in signature_keys:
+                signature_keys[group] = self._get_signature_key(request)
+            signature_key = signature_keys[group]
+
+            if is_rsa:
+                rsa_checks.append((len(results), request, valid_client,
+                                   signature_key))
+                results.append(None)
+            else:
+                valid_signature = self._verify_signature(request, signature_key)
+                results.append((self._check_result(
+                    request, valid_client, valid_signature), request))
+
+        def verify(check):
+            return self._verify_signature(check[1], check[3])
+
+        if len(rsa_checks) > 1 and ThreadPoolExecutor is not None:
+            # Python < 3.5 requires max_workers.
+            max_workers = max_workers or min(32, len(rsa_checks))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                valid_signatures = list(executor.map(verify, rsa_checks))
+        else:
+            valid_signatures = [verify(check) for check in rsa_checks]
+
+        for check, valid_signature in zip(rsa_checks, valid_signatures):
+            index, request, valid_client, _ = check
+            results[index] = (self._check_result(
+                request, valid_client, valid_signature), request)
+        return results
+
+    def _check_request(self, uri, http_method='GET', body=None, headers=None):
+        """Run every check of validate_request but the signature check.
+
+        Returns a tuple of whether those checks passed, the request (None if
+        it could not be created) and whether the client is valid.
+        """
         try:
             request = self._create_request(uri, http_method, body, headers)
         except errors.OAuth1Error:
-            return False, None
+            return False, None, None
 
         try:
             self._check_transport_security(request)
             self._check_mandatory_parameters(request)
         except errors.OAuth1Error:
-            return False, request
+            return False, request, None
 
         if not self.request_validator.validate_timestamp_and_nonce(
                 request.client_key, request.timestamp, request.nonce, request):
-            return False, request
+            return False, request, None
 
         # The server SHOULD return a 401 (Unauthorized) status code when
         # receiving a request with invalid client credentials.
@@ -59,8 +144,9 @@ class SignatureOnlyEndpoint(BaseEndpoint):
         if not valid_client:
             request.client_key = self.request_validator.dummy_client
 
-        valid_signature = self._check_signature(request)
+        return True, request, valid_client
 
+    def _check_result(self, request, valid_client, valid_signature):
         # log the results to the validator_log
         # this lets us handle internal reporting and analysis
         request.validator_log['client'] = valid_client
@@ -76,4 +162,4 @@ class SignatureOnlyEndpoint(BaseEndpoint):
             log.info("[Failure] request verification failed.")
             log.info("Valid client: %s", valid_client)
             log.info("Valid signature: %s", valid_signature)
-        return v, request
+        return v
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+oauthlib.oauth1.rfc5849.nonces
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module contains nonce stores which may back an implementation of
+RequestValidator.validate_timestamp_and_nonce, remembering the nonces used
+within the timestamp lifetime to detect replayed requests.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import hashlib
+import math
+import mmap
+import multiprocessing
+import struct
+import threading
+import time
+
+
+def _nonce_digest(client_key, timestamp, nonce, token):
+    """Hash what makes a nonce unique into 16 bytes."""
+    key = '\x00'.join('' if v is None else v for v in
+                      (client_key, str(timestamp), nonce, token))
+    return hashlib.sha256(key.encode('utf-8')).digest()[:16]
+
+
+class NonceStore(object):
+
+    """In-memory store of the nonces used within the timestamp lifetime.
+
+    Nonces are grouped in buckets spanning ``timestamp_lifetime`` seconds of
+    ``oauth_timestamp`` values. A bucket is dropped as a whole once none of
+    its timestamps can be accepted anymore, so expiring nonces never requires
+    looking at them one by one. Nonces are spread over ``stripes`` partitions,
+    each guarded by its own lock, to keep threads from contending on a single
+    lock.
+
+    The nonces are only remembered within a single process, share a
+    SharedNonceStore between pre-forked workers instead, or bound memory
+    with a BloomNonceStore. Any of these stores is meant to be plugged into a
+    request validator::
+
+        class MyValidator(RequestValidator):
+
+            nonce_store = NonceStore()
+
+            def validate_timestamp_and_nonce(self, client_key, timestamp,
+                    nonce, request, request_token=None, access_token=None):
+                return self.nonce_store.add(client_key, timestamp, nonce,
+                                            request_token or access_token)
+
+    Its timestamp lifetime should be the one of the validator, which defaults
+    to 600 seconds.
+    """
+
+    def __init__(self, timestamp_lifetime=600, stripes=16):
+        self.timestamp_lifetime = timestamp_lifetime
+        self._stripes = [(threading.Lock(), {}) for _ in range(stripes)]
+
+    def __len__(self):
+        return sum(len(nonces) for _, buckets in self._stripes
+                   for nonces in buckets.values())
+
+    def add(self, client_key, timestamp, nonce, token=None):
+        """Record a nonce as used.
+
+        :param client_key: The client/consumer key.
+        :param timestamp: The ``oauth_timestamp`` parameter.
+        :param nonce: The ``oauth_nonce`` parameter.
+        :param token: The request or access token, if any.
+        :returns: True if the nonce was not used before with the same
+                  timestamp, client and token, False otherwise. Timestamps
+                  out of the lifetime are rejected as they could not be
+                  remembered for long enough.
+        """
+        try:
+            timestamp = int(timestamp)
+        except (TypeError, ValueError):
+            return False
+
+        now = int(time.time())
+        if abs(now - timestamp) > self.timestamp_lifetime:
+            return False
+
+        key = (client_key, timestamp, nonce, token)
+        bucket = timestamp // self.timestamp_lifetime
+        oldest = (now - self.timestamp_lifetime) // self.timestamp_lifetime
+        lock, buckets = self._stripes[hash(key) % len(self._stripes)]
+        with lock:
+            for expired in [b for b in buckets if b < oldest]:
+                del buckets[expired]
+            nonces = buckets.setdefault(bucket, set())
+            if key in nonces:
+                return False
+            nonces.add(key)
+            return True
+
+    def clear(self):
+        for lock, buckets in self._stripes:
+            with lock:
+                buckets.clear()
+
+
+class SharedNonceStore(object):
+
+    """Fixed size store of nonces shared by forked processes.
+
+    Nonces are kept in an open addressing hash table laid out in an anonymous
+    shared memory map, so that a store created before forking worker
+    processes detects nonces replayed against any of them. Each slot holds a
+    digest of the client key, timestamp, nonce and token together with the
+    timestamp. Slots whose timestamp is out of the lifetime are reused as
+    new nonces come in, the table never needs to be swept.
+
+    A nonce is looked for at most ``max_probes`` slots away from its hashed
+    position. If all of those slots are in use the nonce is rejected, as it
+    could not be remembered, capacity should therefore be well above the
+    number of requests expected within twice the timestamp lifetime.
+
+    It is used just like a NonceStore, access is serialized by a lock shared
+    by the processes.
+    """
+
+    _slot = struct.Struct(str('<16sq'))
+
+    def __init__(self, capacity=2 ** 20, timestamp_lifetime=600,
+                 max_probes=32):
+        self.capacity = capacity
+        self.timestamp_lifetime = timestamp_lifetime
+        self.max_probes = min(max_probes, capacity)
+        self._table = mmap.mmap(-1, capacity * self._slot.size)
+        self._lock = multiprocessing.Lock()
+
+    def __len__(self):
+        oldest = int(time.time()) - self.timestamp_lifetime
+        with self._lock:
+            return sum(1 for i in range(self.capacity)
+                       if self._slot.unpack_from(
+                           self._table, i * self._slot.size)[1] >= oldest)
+
+    def add(self, client_key, timestamp, nonce, token=None):
+        """Record a nonce as used.
+
+        :param client_key: The client/consumer key.
+        :param timestamp: The ``oauth_timestamp`` parameter.
+        :param nonce: The ``oauth_nonce`` parameter.
+        :param token: The request or access token, if any.
+        :returns: True if the nonce was not used before with the same
+                  timestamp, client and token, False otherwise. Timestamps
+                  out of the lifetime are rejected, as are nonces once the
+                  slots they may be stored in are all in use.
+        """
+        try:
+            timestamp = int(timestamp)
+        except (TypeError, ValueError):
+            return False
+
+        now = int(time.time())
+        if abs(now - timestamp) > self.timestamp_lifetime:
+            return False
+
+        digest = _nonce_digest(client_key, timestamp, nonce, token)
+        home = struct.unpack(str('<Q'), digest[:8])[0] % self.capacity
+        oldest = now - self.timestamp_lifetime
+        with self._lock:
+            free = None
+            for probe in range(self.max_probes):
+                offset = ((home + probe) % self.capacity) * self._slot.size
+                slot_digest, slot_timestamp = self._slot.unpack_from(
+                    self._table, offset)
+                if slot_timestamp < oldest:
+                    if free is None:
+                        free = offset
+                    # Nonces are stored in the first slot available, none
+                    # can be past a slot which was never used. A live copy
+                    # of the nonce may however be past an expired one.
+                    if slot_timestamp == 0:
+                        break
+                elif slot_digest == digest:
+                    return False
+            if free is None:
+                return False
+            self._slot.pack_into(self._table, free, digest, timestamp)
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._table.seek(0)
+            self._table.write(b'\x00' * len(self._table))
+
+
+class BloomNonceStore(object):
+
+    """Probabilistic store of nonces using a fixed amount of memory.
+
+    Nonces are recorded in Bloom filters, one per ``timestamp_lifetime``
+    seconds of ``oauth_timestamp`` values. Three filters cover every
+    timestamp which may be accepted, from one lifetime in the past to one in
+    the future, and the filter of an expired window is cleared and reused
+    for the next one.
+
+    Each filter is sized for ``capacity`` nonces at the given
+    ``false_positive_rate``. A false positive rejects a legitimate request as
+    a replay, a replayed request is never accepted. Past ``capacity`` nonces
+    within a window the false positive rate rises, memory use does not.
+
+    It is used just like a NonceStore.
+    """
+
+    _windows = 3
+
+    def __init__(self, capacity=10 ** 6, false_positive_rate=0.001,
+                 timestamp_lifetime=600):
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.timestamp_lifetime = timestamp_lifetime
+        bits = -capacity * math.log(false_positive_rate) / math.log(2) ** 2
+        self.num_bits = max(8, int(math.ceil(bits / 8)) * 8)
+        self.num_hashes = max(1, int(round(
+            self.num_bits / float(capacity) * math.log(2))))
+        self._filters = [bytearray(self.num_bits // 8)
+                         for _ in range(self._windows)]
+        self._filter_windows = [None] * self._windows
+        self._lock = threading.Lock()
+
+    def add(self, client_key, timestamp, nonce, token=None):
+        """Record a nonce as used.
+
+        :param client_key: The client/consumer key.
+        :param timestamp: The ``oauth_timestamp`` parameter.
+        :param nonce: The ``oauth_nonce`` parameter.
+        :param token: The request or access token, if any.
+        :returns: True if the nonce was not used before with the same
+                  timestamp, client and token, False if it was or, with
+                  a probability of about false_positive_rate, if it was
+                  not. Timestamps out of the lifetime are rejected.
+        """
+        try:
+            timestamp = int(timestamp)
+        except (TypeError, ValueError):
+            return False
+
+        now = int(time.time())
+        if abs(now - timestamp) > self.timestamp_lifetime:
+            return False
+
+        digest = _nonce_digest(client_key, timestamp, nonce, token)
+        h1, h2 = struct.unpack(str('<QQ'), digest[:16])
+        positions = [(h1 + i * h2) % self.num_bits
+                     for i in range(self.num_hashes)]
+
+        window = timestamp // self.timestamp_lifetime
+        index = window % self._windows
+        with self._lock:
+            bloom = self._filters[index]
+            if self._filter_windows[index] != window:
+                bloom[:] = bytearray(len(bloom))
+                self._filter_windows[index] = window
+            seen = True
+            for position in positions:
+                byte, bit = divmod(position, 8)
+                if not bloom[byte] & (1 << bit):
+                    seen = False
+                    bloom[byte] |= 1 << bit
+            return not seen
+
+    def clear(self):
+        with self._lock:
+            self._filter_windows = [None] * self._windows
@@ -8,6 +8,8 @@ for signing and checking OAuth 1.0 RFC 5849 requests.
 """
 from __future__ import absolute_import, unicode_literals
 
+from oauthlib.common import LRUCache
+
 from . import SIGNATURE_METHODS, utils
 
 
@@ -411,7 +413,10 @@ class RequestValidator(object):
         as fetching a key for a valid client. The dummy key must also be of
         the same bit length as client keys.
 
-        Note that the key must be returned in plaintext.
+        Note that the key must be returned in plaintext. The endpoints load
+        each key once and keep the loaded key object in their rsa_key_cache.
+        Alternatively an RSA public key object from the cryptography library
+        may be returned, which is then used as is.
 
         This method is used by
 
@@ -593,6 +598,18 @@ class RequestValidator(object):
               return ((client_key, timestamp, nonce, request_token or access_token)
                        not in self.nonces_and_timestamps_database)
 
+        Rather than querying a database on every request, the nonces may be
+        kept in an oauthlib.oauth1.NonceStore, which forgets them once their
+        timestamp is out of the timestamp lifetime.::
+
+           nonce_store = NonceStore(timestamp_lifetime=600)
+
+           def validate_timestamp_and_nonce(self, client_key, timestamp, nonce,
+              request, request_token=None, access_token=None):
+
+              return self.nonce_store.add(client_key, timestamp, nonce,
+                                          request_token or access_token)
+
         This method is used by
 
         * AccessTokenEndpoint
@@ -821,3 +838,102 @@ class RequestValidator(object):
         * AuthorizationEndpoint
         """
         raise NotImplementedError("Subclasses must implement this function.")
+
+
+# Marks a lookup missing from the cache, None being a valid cached value.
+_MISSING = object()
+
+
+class CachingRequestValidator(object):
+
+    """Wraps a RequestValidator, caching client and token lookups.
+
+    Signature verification looks up the client secret (or RSA key) and the
+    token secret on every request, after validating the client key and the
+    token. These lookups are cached for ``ttl`` seconds, keeping at most
+    ``maxsize`` entries, the least recently used ones being evicted first.
+    Client keys and tokens found invalid are cached as well, for
+    ``negative_ttl`` seconds. Every other attribute is looked up on the
+    wrapped validator::
+
+        endpoint = ResourceEndpoint(CachingRequestValidator(MyValidator()))
+
+    Invalid clients and tokens keep being replaced by the dummy client and
+    tokens of the wrapped validator, whose secrets get cached as any other.
+    Requests with unknown keys therefore go through the same cached lookups
+    as requests with valid ones.
+
+    The wrapped validator is not asked again before an entry expires,
+    including for the request attributes it may set. Revoked clients and
+    tokens must be evicted through invalidate_client and invalidate_token,
+    invalidate_request_token does so for the request token it is given.
+    """
+
+    def __init__(self, request_validator, ttl=300, negative_ttl=60,
+                 maxsize=4096):
+        self.request_validator = request_validator
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def __getattr__(self, name):
+        return getattr(self.request_validator, name)
+
+    def _cached(self, key, lookup, *args):
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = lookup(*args)
+            self.cache.set(key, value,
+                           None if value else self.negative_ttl)
+        return value
+
+    def validate_client_key(self, client_key, request):
+        return self._cached(('client', client_key),
+                            self.request_validator.validate_client_key,
+                            client_key, request)
+
+    def get_client_secret(self, client_key, request):
+        return self._cached(('client_secret', client_key),
+                            self.request_validator.get_client_secret,
+                            client_key, request)
+
+    def get_rsa_key(self, client_key, request):
+        return self._cached(('rsa_key', client_key),
+                            self.request_validator.get_rsa_key,
+                            client_key, request)
+
+    def validate_request_token(self, client_key, token, request):
+        return self._cached(('request_token', client_key, token),
+                            self.request_validator.validate_request_token,
+                            client_key, token, request)
+
+    def get_request_token_secret(self, client_key, token, request):
+        return self._cached(('request_token_secret', client_key, token),
+                            self.request_validator.get_request_token_secret,
+                            client_key, token, request)
+
+    def validate_access_token(self, client_key, token, request):
+        return self._cached(('access_token', client_key, token),
+                            self.request_validator.validate_access_token,
+                            client_key, token, request)
+
+    def get_access_token_secret(self, client_key, token, request):
+        return self._cached(('access_token_secret', client_key, token),
+                            self.request_validator.get_access_token_secret,
+                            client_key, token, request)
+
+    def invalidate_request_token(self, client_key, request_token, request):
+        self.request_validator.invalidate_request_token(
+            client_key, request_token, request)
+        self.invalidate_token(client_key, request_token)
+
+    def invalidate_client(self, client_key):
+        """Evict the cached lookups of a client."""
+        for kind in ('client', 'client_secret', 'rsa_key'):
+            self.cache.pop((kind, client_key))
+
+    def invalidate_token(self, client_key, token):
+        """Evict the cached lookups of a request or access token."""
+        for kind in ('request_token', 'request_token_secret',
+                     'access_token', 'access_token_secret'):
+            self.cache.pop((kind, client_key, token))
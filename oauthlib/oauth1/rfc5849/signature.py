@@ -32,7 +32,8 @@ except ImportError:
     import urllib.parse as urlparse
 from . import utils
 from oauthlib.common import urldecode, extract_params, safe_string_equals
-from oauthlib.common import bytes_type, unicode_type
+from oauthlib.common import bytes_type, unicode_type, LRUCache
+from oauthlib.common import load_rsa_key
 
 
 def construct_base_string(http_method, base_string_uri,
@@ -100,7 +101,7 @@ def construct_base_string(http_method, base_string_uri,
     return base_string
 
 
-def normalize_base_string_uri(uri, host=None):
+def normalize_base_string_uri(uri, host=None, parsed_uri=None):
     """**Base String URI**
     Per `section 3.4.1.2`_ of the spec.
 
@@ -121,12 +122,17 @@ def normalize_base_string_uri(uri, host=None):
     .. _`section 3.4.1.2`: http://tools.ietf.org/html/rfc5849#section-3.4.1.2
 
     The host argument overrides the netloc part of the uri argument.
+
+    If the uri has already been split by urlparse, such as the cached
+    parsed_uri of an oauthlib.common.Request, it may be passed as parsed_uri
+    to avoid parsing it again.
     """
     if not isinstance(uri, unicode_type):
         raise ValueError('uri must be a unicode object.')
 
     # FIXME: urlparse does not support unicode
-    scheme, netloc, path, params, query, fragment = urlparse.urlparse(uri)
+    scheme, netloc, path, params, query, fragment = (
+        parsed_uri or urlparse.urlparse(uri))
 
     # The scheme, authority, and path of the request resource URI `RFC3986`
     # are included by constructing an "http" or "https" URI representing
@@ -196,6 +202,9 @@ def collect_parameters(uri_query='', body=[], headers=None,
     Body parameters must be supplied as a dict, a list of 2-tuples, or a
     formencoded query string.
 
+    The uri query may be supplied as a formencoded query string or, if it has
+    already been decoded, as a list of 2-tuples.
+
     Headers must be supplied as a dict.
 
     Per `section 3.4.1.3.1`_ of the spec.
@@ -262,7 +271,9 @@ def collect_parameters(uri_query='', body=[], headers=None,
     # .. _`RFC3986, Section 3.4`: http://tools.ietf.org/html/rfc3986#section-3.4
     # .. _`W3C.REC-html40-19980424`: http://tools.ietf.org/html/rfc5849#ref-W3C.REC-html40-19980424
     if uri_query:
-        params.extend(urldecode(uri_query))
+        if isinstance(uri_query, (bytes_type, unicode_type)):
+            uri_query = urldecode(uri_query)
+        params.extend(uri_query)
 
     # *  The OAuth HTTP "Authorization" header field (`Section 3.5.1`_) if
     #    present.  The header's content is parsed into a list of name/value
@@ -415,6 +426,42 @@ def sign_hmac_sha1_with_client(base_string, client):
                           )
 
 
+# HMAC-SHA1 objects keyed with a (client_secret, resource_owner_secret) pair,
+# copied for each signature rather than keyed anew. Clients and servers tend
+# to sign many requests with the same few pairs of secrets.
+_hmac_sha1_keys = LRUCache(maxsize=256)
+
+
+def _hmac_sha1_key(client_secret, resource_owner_secret):
+    # key is set to the concatenated values of:
+    # 1.  The client shared-secret, after being encoded (`Section 3.6`_).
+    #
+    # .. _`Section 3.6`: http://tools.ietf.org/html/rfc5849#section-3.6
+    key = utils.escape(client_secret or '')
+
+    # 2.  An "&" character (ASCII code 38), which MUST be included
+    #     even when either secret is empty.
+    key += '&'
+
+    # 3.  The token shared-secret, after being encoded (`Section 3.6`_).
+    #
+    # .. _`Section 3.6`: http://tools.ietf.org/html/rfc5849#section-3.6
+    key += utils.escape(resource_owner_secret or '')
+
+    # FIXME: HMAC does not support unicode!
+    return key.encode('utf-8')
+
+
+def _keyed_hmac_sha1(client_secret, resource_owner_secret):
+    cache_key = (client_secret or '', resource_owner_secret or '')
+    keyed = _hmac_sha1_keys.get(cache_key)
+    if keyed is None:
+        keyed = hmac.new(_hmac_sha1_key(client_secret, resource_owner_secret),
+                         digestmod=hashlib.sha1)
+        _hmac_sha1_keys[cache_key] = keyed
+    return keyed.copy()
+
+
 def sign_hmac_sha1(base_string, client_secret, resource_owner_secret):
     """**HMAC-SHA1**
 
@@ -425,6 +472,9 @@ def sign_hmac_sha1(base_string, client_secret, resource_owner_secret):
 
     Per `section 3.4.2`_ of the spec.
 
+    The HMAC keyed with the two secrets is cached, for a bounded number of
+    pairs of secrets, and copied for each signature.
+
     .. _`RFC2104`: http://tools.ietf.org/html/rfc2104
     .. _`section 3.4.2`: http://tools.ietf.org/html/rfc5849#section-3.4.2
     """
@@ -437,25 +487,10 @@ def sign_hmac_sha1(base_string, client_secret, resource_owner_secret):
     # .. _`Section 3.4.1.1`: http://tools.ietf.org/html/rfc5849#section-3.4.1.1
     text = base_string
 
-    # key is set to the concatenated values of:
-    # 1.  The client shared-secret, after being encoded (`Section 3.6`_).
-    #
-    # .. _`Section 3.6`: http://tools.ietf.org/html/rfc5849#section-3.6
-    key = utils.escape(client_secret or '')
-
-    # 2.  An "&" character (ASCII code 38), which MUST be included
-    #     even when either secret is empty.
-    key += '&'
-
-    # 3.  The token shared-secret, after being encoded (`Section 3.6`_).
-    #
-    # .. _`Section 3.6`: http://tools.ietf.org/html/rfc5849#section-3.6
-    key += utils.escape(resource_owner_secret or '')
-
-    # FIXME: HMAC does not support unicode!
-    key_utf8 = key.encode('utf-8')
-    text_utf8 = text.encode('utf-8')
-    signature = hmac.new(key_utf8, text_utf8, hashlib.sha1)
+    # key is set to the concatenated values of the client shared-secret and
+    # the token shared-secret, see _hmac_sha1_key.
+    signature = _keyed_hmac_sha1(client_secret, resource_owner_secret)
+    signature.update(text.encode('utf-8'))
 
     # digest  is used to set the value of the "oauth_signature" protocol
     #         parameter, after the result octet string is base64-encoded
@@ -474,7 +509,7 @@ def _jwt_rs1_signing_algorithm():
         _jwtrs1 = jwtalgo.RSAAlgorithm(jwtalgo.hashes.SHA1)
     return _jwtrs1
 
-def sign_rsa_sha1(base_string, rsa_private_key):
+def sign_rsa_sha1(base_string, rsa_private_key, key_cache=None):
     """**RSA-SHA1**
 
     Per `section 3.4.3`_ of the spec.
@@ -489,12 +524,15 @@ def sign_rsa_sha1(base_string, rsa_private_key):
     .. _`section 3.4.3`: http://tools.ietf.org/html/rfc5849#section-3.4.3
     .. _`RFC3447, Section 8.2`: http://tools.ietf.org/html/rfc3447#section-8.2
 
+    The rsa_private_key may be a PEM string or an already loaded key object.
+    Keys loaded from PEM are cached in key_cache, an oauthlib.common.LRUCache
+    which defaults to one shared by oauthlib.
     """
     if isinstance(base_string, unicode_type):
         base_string = base_string.encode('utf-8')
     # TODO: finish RSA documentation
     alg = _jwt_rs1_signing_algorithm()
-    key = _prepare_key_plus(alg, rsa_private_key)
+    key = _prepare_key_plus(alg, rsa_private_key, key_cache)
     s=alg.sign(base_string, key)
     return binascii.b2a_base64(s)[:-1].decode('utf-8')
 
@@ -562,18 +600,23 @@ def verify_hmac_sha1(request, client_secret=None,
 
     """
     norm_params = normalize_parameters(request.params)
-    uri = normalize_base_string_uri(request.uri)
+    uri = _request_base_string_uri(request)
     base_string = construct_base_string(request.http_method, uri, norm_params)
     signature = sign_hmac_sha1(base_string, client_secret,
                                resource_owner_secret)
     return safe_string_equals(signature, request.signature)
 
-def _prepare_key_plus(alg, keystr):
-    if isinstance(keystr, bytes_type):
-        keystr = keystr.decode('utf-8')
-    return alg.prepare_key(keystr)
+def _request_base_string_uri(request):
+    # Reuse the uri components cached on oauthlib.common.Request, if any.
+    parsed_uri = getattr(request, 'parsed_uri', None)
+    return normalize_base_string_uri(request.uri, parsed_uri=parsed_uri)
 
-def verify_rsa_sha1(request, rsa_public_key):
+def _prepare_key_plus(alg, keystr, key_cache=None):
+    key = load_rsa_key(keystr, key_cache)
+    # Let the algorithm check key objects given by the caller.
+    return alg.prepare_key(key)
+
+def verify_rsa_sha1(request, rsa_public_key, key_cache=None):
     """Verify a RSASSA-PKCS #1 v1.5 base64 encoded signature.
 
     Per `section 3.4.3`_ of the spec.
@@ -589,14 +632,18 @@ def verify_rsa_sha1(request, rsa_public_key):
     ignored.
 
     .. _`RFC2616 section 5.2`: http://tools.ietf.org/html/rfc2616#section-5.2
+
+    The rsa_public_key may be a PEM string or an already loaded key object.
+    Keys loaded from PEM are cached in key_cache, an oauthlib.common.LRUCache
+    which defaults to one shared by oauthlib.
     """
     norm_params = normalize_parameters(request.params)
-    uri = normalize_base_string_uri(request.uri)
+    uri = _request_base_string_uri(request)
     message = construct_base_string(request.http_method, uri, norm_params).encode('utf-8')
     sig = binascii.a2b_base64(request.signature.encode('utf-8'))
 
     alg = _jwt_rs1_signing_algorithm()
-    key = _prepare_key_plus(alg, rsa_public_key)
+    key = _prepare_key_plus(alg, rsa_public_key, key_cache)
     return alg.verify(message, key, sig)
 
 
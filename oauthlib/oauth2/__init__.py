@@ -30,5 +30,8 @@ from .rfc6749.grant_types import ResourceOwnerPasswordCredentialsGrant
 from .rfc6749.grant_types import ClientCredentialsGrant
 from .rfc6749.grant_types import RefreshTokenGrant
 from .rfc6749.request_validator import RequestValidator
-from .rfc6749.tokens import BearerToken, OAuth2Token
+from .rfc6749.request_validator import MemoizingRequestValidator
+from .rfc6749.request_validator import WriteBehindRequestValidator
+from .rfc6749.tokens import BearerToken, BearerTokenCache, OAuth2Token
+from .rfc6749.tokens import ChecksummedTokenFormat
 from .rfc6749.utils import is_secure_transport
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+oauthlib.oauth2.rfc6749.aio
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This package mirrors the OAuth 2.0 RFC6749 endpoints, grant types and bearer
+tokens for asyncio, to be used with request validators whose methods are
+coroutines. Validator methods may be coroutines or plain functions, their
+result is awaited whenever it is awaitable, and the responses are the same
+as those of the synchronous classes.
+
+The package requires Python 3.5 or later, it is not imported by
+oauthlib.oauth2 and must be imported explicitly::
+
+    from oauthlib.oauth2.rfc6749.aio import AsyncServer
+"""
+from __future__ import absolute_import, unicode_literals
+
+from .tokens import AsyncBearerToken
+from .grant_types import AsyncAuthorizationCodeGrant
+from .grant_types import AsyncImplicitGrant
+from .grant_types import AsyncResourceOwnerPasswordCredentialsGrant
+from .grant_types import AsyncClientCredentialsGrant
+from .grant_types import AsyncRefreshTokenGrant
+from .endpoints import AsyncAuthorizationEndpoint
+from .endpoints import AsyncTokenEndpoint
+from .endpoints import AsyncResourceEndpoint
+from .endpoints import AsyncRevocationEndpoint
+from .endpoints import AsyncServer
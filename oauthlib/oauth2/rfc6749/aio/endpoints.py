@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+oauthlib.oauth2.rfc6749.aio.endpoints
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Asyncio variants of the endpoints, see oauthlib.oauth2.rfc6749.endpoints.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import collections
+import functools
+import logging
+
+from oauthlib.common import Request
+
+from .. import utils
+from ..endpoints import AuthorizationEndpoint
+from ..endpoints import TokenEndpoint
+from ..endpoints import ResourceEndpoint
+from ..endpoints import RevocationEndpoint
+from ..endpoints.base import batch_responses, error_response
+from ..endpoints.base import unavailable_response
+from ..errors import OAuth2Error
+from ..errors import InvalidClientError, InvalidRequestError
+from ..errors import UnsupportedTokenTypeError
+from .grant_types import AsyncAuthorizationCodeGrant
+from .grant_types import AsyncImplicitGrant
+from .grant_types import AsyncResourceOwnerPasswordCredentialsGrant
+from .grant_types import AsyncClientCredentialsGrant
+from .grant_types import AsyncRefreshTokenGrant
+from .tokens import AsyncBearerToken
+from .utils import call
+
+log = logging.getLogger(__name__)
+
+
+def catch_errors_and_unavailability(f):
+    @functools.wraps(f)
+    async def wrapper(endpoint, uri, *args, **kwargs):
+        response = unavailable_response(endpoint, 'request %s' % uri)
+        if response is not None:
+            return response
+
+        try:
+            return await f(endpoint, uri, *args, **kwargs)
+        except Exception as e:
+            response = error_response(endpoint, e, 'request')
+            if response is None:
+                raise
+            return response
+    return wrapper
+
+
+def catch_batch_errors_and_unavailability(f):
+    @functools.wraps(f)
+    async def wrapper(endpoint, requests, *args, **kwargs):
+        response = unavailable_response(
+            endpoint, '%d requests' % len(requests))
+        if response is not None:
+            return batch_responses(response, requests)
+
+        try:
+            return await f(endpoint, requests, *args, **kwargs)
+        except Exception as e:
+            response = error_response(endpoint, e, 'requests')
+            if response is None:
+                raise
+            return batch_responses(response, requests)
+    return wrapper
+
+
+class AsyncAuthorizationEndpoint(AuthorizationEndpoint):
+
+    """Asyncio variant of the AuthorizationEndpoint.
+
+    Response types must be handled by asyncio grant types.
+    """
+
+    @catch_errors_and_unavailability
+    async def create_authorization_response(self, uri, http_method='GET',
+                                            body=None, headers=None,
+                                            scopes=None, credentials=None):
+        """Extract response_type and route to the designated handler."""
+        request = Request(
+            uri, http_method=http_method, body=body, headers=headers)
+        request.scopes = scopes
+        request.user = None
+        for k, v in (credentials or {}).items():
+            setattr(request, k, v)
+        response_type_handler = self.response_types.get(
+            request.response_type, self.default_response_type_handler)
+        log.debug('Dispatching response_type %s request to %r.',
+                  request.response_type, response_type_handler)
+        return await response_type_handler.create_authorization_response(
+            request, self.default_token_type)
+
+    @catch_errors_and_unavailability
+    async def validate_authorization_request(self, uri, http_method='GET',
+                                             body=None, headers=None):
+        """Extract response_type and route to the designated handler."""
+        request = Request(
+            uri, http_method=http_method, body=body, headers=headers)
+
+        request.scopes = utils.scope_to_list(request.scope)
+
+        response_type_handler = self.response_types.get(
+            request.response_type, self.default_response_type_handler)
+        return await response_type_handler.validate_authorization_request(
+            request)
+
+
+class AsyncTokenEndpoint(TokenEndpoint):
+
+    """Asyncio variant of the TokenEndpoint.
+
+    Grant types must be asyncio grant types.
+    """
+
+    @catch_errors_and_unavailability
+    async def create_token_response(self, uri, http_method='GET', body=None,
+                                    headers=None, credentials=None,
+                                    grant_type_for_scope=None, claims=None):
+        """Extract grant_type and route to the designated handler."""
+        request = Request(
+            uri, http_method=http_method, body=body, headers=headers)
+        request.scopes = utils.scope_to_list(request.scope)
+        request.extra_credentials = credentials
+        if grant_type_for_scope:
+            request.grant_type = grant_type_for_scope
+        if claims:
+            request.claims = claims
+
+        grant_type_handler = self.grant_types.get(request.grant_type,
+                                                  self.default_grant_type_handler)
+        log.debug('Dispatching grant_type %s request to %r.',
+                  request.grant_type, grant_type_handler)
+        return await grant_type_handler.create_token_response(
+            request, self.default_token_type)
+
+    @catch_batch_errors_and_unavailability
+    async def create_token_responses(self, requests):
+        """Issue tokens for several token requests at once.
+
+        See TokenEndpoint.create_token_responses.
+        """
+        batches = collections.OrderedDict()
+        for index, kwargs in enumerate(requests):
+            request = self._create_request(**kwargs)
+            grant_type_handler = self.grant_types.get(
+                request.grant_type, self.default_grant_type_handler)
+            batches.setdefault(grant_type_handler, []).append((index, request))
+
+        responses = [None] * len(requests)
+        for grant_type_handler, batch in batches.items():
+            log.debug('Dispatching %d grant_type %s requests to %r.',
+                      len(batch), batch[0][1].grant_type, grant_type_handler)
+            batch_requests = [request for _, request in batch]
+            if hasattr(grant_type_handler, 'create_token_responses'):
+                batch_responses = await grant_type_handler.create_token_responses(
+                    batch_requests, self.default_token_type)
+            else:
+                batch_responses = []
+                for request in batch_requests:
+                    batch_responses.append(
+                        await grant_type_handler.create_token_response(
+                            request, self.default_token_type))
+            for (index, _), response in zip(batch, batch_responses):
+                responses[index] = response
+        return responses
+
+
+class AsyncResourceEndpoint(ResourceEndpoint):
+
+    """Asyncio variant of the ResourceEndpoint.
+
+    Token types must be asyncio token types such as AsyncBearerToken.
+    """
+
+    @catch_errors_and_unavailability
+    async def verify_request(self, uri, http_method='GET', body=None,
+                             headers=None, scopes=None):
+        """Validate client, code etc, return body + headers"""
+        request = Request(uri, http_method, body, headers)
+        request.token_type = self.find_token_type(request)
+        request.scopes = scopes
+        token_type_handler = self.tokens.get(request.token_type,
+                                             self.default_token_type_handler)
+        log.debug('Dispatching token_type %s request to %r.',
+                  request.token_type, token_type_handler)
+        return await token_type_handler.validate_request(request), request
+
+
+class AsyncRevocationEndpoint(RevocationEndpoint):
+
+    """Asyncio variant of the RevocationEndpoint."""
+
+    @catch_errors_and_unavailability
+    async def create_revocation_response(self, uri, http_method='POST',
+                                         body=None, headers=None):
+        """Revoke supplied access or refresh token."""
+        request = Request(
+            uri, http_method=http_method, body=body, headers=headers)
+        try:
+            await self.validate_revocation_request(request)
+            log.debug('Token revocation valid for %r.', request)
+        except OAuth2Error as e:
+            log.debug('Client error during validation of %r. %r.', request, e)
+            response_body = e.json
+            if self.enable_jsonp and request.callback:
+                response_body = '%s(%s);' % (request.callback, response_body)
+            return {}, response_body, e.status_code
+
+        if (self.token_format is not None and
+                not self.token_format.check(request.token)):
+            log.debug('Ignoring malformed token in %r.', request)
+        else:
+            await call(self.request_validator.revoke_token, request.token,
+                       request.token_type_hint, request)
+            if self.on_revoke is not None:
+                await call(self.on_revoke, request.token,
+                           request.token_type_hint, request)
+
+        response_body = ''
+        if self.enable_jsonp and request.callback:
+            response_body = request.callback + '();'
+        return {}, response_body, 200
+
+    async def validate_revocation_request(self, request):
+        """Ensure the request is valid.
+
+        See RevocationEndpoint.validate_revocation_request.
+        """
+        if not request.token:
+            raise InvalidRequestError(request=request,
+                                      description='Missing token parameter.')
+
+        if await call(self.request_validator.client_authentication_required,
+                      request):
+            if not await call(self.request_validator.authenticate_client,
+                              request):
+                raise InvalidClientError(request=request)
+
+        if (request.token_type_hint and
+                request.token_type_hint in self.valid_token_types and
+                request.token_type_hint not in self.supported_token_types):
+            raise UnsupportedTokenTypeError(request=request)
+
+
+class AsyncServer(AsyncAuthorizationEndpoint, AsyncTokenEndpoint,
+                  AsyncResourceEndpoint, AsyncRevocationEndpoint):
+
+    """Asyncio variant of the all-in-one Server, for OAuth 2.0 grants.
+
+    OpenID Connect response and grant types are not included.
+    """
+
+    def __init__(self, request_validator, token_expires_in=None,
+                 token_generator=None, refresh_token_generator=None,
+                 *args, **kwargs):
+        """Construct a new all-grants-in-one server.
+
+        See oauthlib.oauth2.Server, the request validator methods may be
+        coroutines.
+        """
+        auth_grant = AsyncAuthorizationCodeGrant(request_validator)
+        implicit_grant = AsyncImplicitGrant(request_validator)
+        password_grant = AsyncResourceOwnerPasswordCredentialsGrant(
+            request_validator)
+        credentials_grant = AsyncClientCredentialsGrant(request_validator)
+        refresh_grant = AsyncRefreshTokenGrant(request_validator)
+
+        bearer = AsyncBearerToken(request_validator, token_generator,
+                                  token_expires_in, refresh_token_generator)
+
+        AuthorizationEndpoint.__init__(self, default_response_type='code',
+                                       response_types={
+                                           'code': auth_grant,
+                                           'token': implicit_grant,
+                                           'none': auth_grant
+                                       },
+                                       default_token_type=bearer)
+        TokenEndpoint.__init__(self, default_grant_type='authorization_code',
+                               grant_types={
+                                   'authorization_code': auth_grant,
+                                   'password': password_grant,
+                                   'client_credentials': credentials_grant,
+                                   'refresh_token': refresh_grant,
+                               },
+                               default_token_type=bearer)
+        ResourceEndpoint.__init__(self, default_token='Bearer',
+                                  token_types={'Bearer': bearer})
+        RevocationEndpoint.__init__(self, request_validator)
@@ -0,0 +1,524 @@
+# -*- coding: utf-8 -*-
+"""
+oauthlib.oauth2.rfc6749.aio.grant_types
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Asyncio variants of the grant types, see oauthlib.oauth2.rfc6749.grant_types
+for a description of each flow.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import json
+import logging
+
+from oauthlib import common
+from oauthlib.uri_validate import is_absolute_uri
+
+from .. import errors, utils
+from ..grant_types import AuthorizationCodeGrant
+from ..grant_types import ImplicitGrant
+from ..grant_types import ResourceOwnerPasswordCredentialsGrant
+from ..grant_types import ClientCredentialsGrant
+from ..grant_types import RefreshTokenGrant
+from .utils import call
+
+log = logging.getLogger(__name__)
+
+_TOKEN_HEADERS = {
+    'Content-Type': 'application/json',
+    'Cache-Control': 'no-store',
+    'Pragma': 'no-cache',
+}
+
+
+class AsyncGrantTypeBase(object):
+
+    """Asyncio variants of the GrantTypeBase helpers.
+
+    Registered validators and modifiers may be coroutines as well.
+    """
+
+    async def add_token(self, token, token_handler, request):
+        # Only add a hybrid access token on auth step if asked for
+        if not request.response_type in ["token", "code token", "id_token token", "code id_token token"]:
+            return token
+
+        token.update(await token_handler.create_token(
+            request, refresh_token=False))
+        return token
+
+    async def validate_grant_type(self, request):
+        client_id = getattr(request, 'client_id', None)
+        if not await call(self.request_validator.validate_grant_type,
+                          client_id, request.grant_type, request.client,
+                          request):
+            log.debug('Unauthorized from %r (%r) access to grant type %s.',
+                      request.client_id, request.client, request.grant_type)
+            raise errors.UnauthorizedClientError(request=request)
+
+    async def validate_scopes(self, request):
+        if not request.scopes:
+            request.scopes = utils.scope_to_list(request.scope) or utils.scope_to_list(
+                await call(self.request_validator.get_default_scopes,
+                           request.client_id, request))
+        log.debug('Validating access to scopes %r for client %r (%r).',
+                  request.scopes, request.client_id, request.client)
+        if not await call(self.request_validator.validate_scopes,
+                          request.client_id, request.scopes, request.client,
+                          request):
+            raise errors.InvalidScopeError(request=request)
+
+    async def _validate_client_and_redirect_uri(self, request):
+        """Check the parameters, client id and redirection URI of an
+        authorization request, which are common to the code and implicit
+        grants.
+        """
+        for param in ('client_id', 'response_type', 'redirect_uri', 'scope', 'state'):
+            try:
+                duplicate_params = request.duplicate_params
+            except ValueError:
+                raise errors.InvalidRequestFatalError(description='Unable to parse query string', request=request)
+            if param in duplicate_params:
+                raise errors.InvalidRequestFatalError(description='Duplicate %s parameter.' % param, request=request)
+
+        if not request.client_id:
+            raise errors.MissingClientIdError(request=request)
+
+        if not await call(self.request_validator.validate_client_id,
+                          request.client_id, request):
+            raise errors.InvalidClientIdError(request=request)
+
+        log.debug('Validating redirection uri %s for client %s.',
+                  request.redirect_uri, request.client_id)
+        if request.redirect_uri is not None:
+            request.using_default_redirect_uri = False
+            log.debug('Using provided redirect_uri %s', request.redirect_uri)
+            if not is_absolute_uri(request.redirect_uri):
+                raise errors.InvalidRedirectURIError(request=request)
+
+            if not await call(self.request_validator.validate_redirect_uri,
+                              request.client_id, request.redirect_uri,
+                              request):
+                raise errors.MismatchingRedirectURIError(request=request)
+        else:
+            request.redirect_uri = await call(
+                self.request_validator.get_default_redirect_uri,
+                request.client_id, request)
+            request.using_default_redirect_uri = True
+            log.debug('Using default redirect_uri %s.', request.redirect_uri)
+            if not request.redirect_uri:
+                raise errors.MissingRedirectURIError(request=request)
+
+    async def _validate_response_type(self, request):
+        if not await call(self.request_validator.validate_response_type,
+                          request.client_id, request.response_type,
+                          request.client, request):
+            log.debug('Client %s is not authorized to use response_type %s.',
+                      request.client_id, request.response_type)
+            raise errors.UnauthorizedClientError(request=request)
+
+        await self.validate_scopes(request)
+
+        request_info = {
+            'client_id': request.client_id,
+            'redirect_uri': request.redirect_uri,
+            'response_type': request.response_type,
+            'state': request.state,
+            'request': request
+        }
+
+        for validator in self._authorization_validators:
+            request_info.update(await call(validator, request))
+
+        return request.scopes, request_info
+
+    async def _authenticate_client(self, request):
+        if await call(self.request_validator.client_authentication_required,
+                      request):
+            log.debug('Authenticating client, %r.', request)
+            if not await call(self.request_validator.authenticate_client,
+                              request):
+                log.debug('Client authentication failed, %r.', request)
+                raise errors.InvalidClientError(request=request)
+        elif not await call(self.request_validator.authenticate_client_id,
+                            request.client_id, request):
+            log.debug('Client authentication failed, %r.', request)
+            raise errors.InvalidClientError(request=request)
+
+
+class AsyncAuthorizationCodeGrant(AsyncGrantTypeBase, AuthorizationCodeGrant):
+
+    """Asyncio variant of the AuthorizationCodeGrant."""
+
+    async def create_authorization_response(self, request, token_handler):
+        try:
+            if not request.scopes:
+                raise ValueError('Scopes must be set on post auth.')
+
+            await self.validate_authorization_request(request)
+            log.debug('Pre resource owner authorization validation ok for %r.',
+                      request)
+
+        except errors.FatalClientError as e:
+            log.debug('Fatal client error during validation of %r. %r.',
+                      request, e)
+            raise
+
+        except errors.OAuth2Error as e:
+            log.debug('Client error during validation of %r. %r.', request, e)
+            request.redirect_uri = request.redirect_uri or self.error_uri
+            return {'Location': common.add_params_to_uri(request.redirect_uri, e.twotuples)}, None, 302
+
+        grant = self.create_authorization_code(request)
+        for modifier in self._code_modifiers:
+            grant = await call(modifier, grant, token_handler, request)
+        log.debug('Saving grant %r for %r.', grant, request)
+        await call(self.request_validator.save_authorization_code,
+                   request.client_id, grant, request)
+        return self.prepare_authorization_response(
+            request, grant, {}, None, 302)
+
+    async def create_token_response(self, request, token_handler):
+        headers = dict(_TOKEN_HEADERS)
+        try:
+            await call(self.request_validator.prefetch, request,
+                       'authorization_code')
+            await self.validate_token_request(request)
+            log.debug('Token request validation ok for %r.', request)
+        except errors.OAuth2Error as e:
+            log.debug('Client error during validation of %r. %r.', request, e)
+            return headers, e.json, e.status_code
+
+        token = await token_handler.create_token(
+            request, refresh_token=self.refresh_token, save_token=False)
+        for modifier in self._token_modifiers:
+            token = await call(modifier, token, token_handler, request)
+        await call(self.request_validator.save_token, token, request)
+        await call(self.request_validator.invalidate_authorization_code,
+                   request.client_id, request.code, request)
+        return headers, json.dumps(token), 200
+
+    async def validate_authorization_request(self, request):
+        await self._validate_client_and_redirect_uri(request)
+
+        if request.response_type is None:
+            raise errors.MissingResponseTypeError(request=request)
+        elif not 'code' in request.response_type and request.response_type != 'none':
+            raise errors.UnsupportedResponseTypeError(request=request)
+
+        return await self._validate_response_type(request)
+
+    async def validate_token_request(self, request):
+        if request.grant_type not in ('authorization_code', 'openid'):
+            raise errors.UnsupportedGrantTypeError(request=request)
+
+        if request.code is None:
+            raise errors.InvalidRequestError(
+                description='Missing code parameter.', request=request)
+
+        for param in ('client_id', 'grant_type', 'redirect_uri'):
+            if param in request.duplicate_params:
+                raise errors.InvalidRequestError(description='Duplicate %s parameter.' % param,
+                                                 request=request)
+
+        await self._authenticate_client(request)
+
+        if not hasattr(request.client, 'client_id'):
+            raise NotImplementedError('Authenticate client must set the '
+                                      'request.client.client_id attribute '
+                                      'in authenticate_client.')
+
+        request.client_id = request.client_id or request.client.client_id
+
+        await self.validate_grant_type(request)
+
+        if not await call(self.request_validator.validate_code,
+                          request.client_id, request.code, request.client,
+                          request):
+            log.debug('Client, %r (%r), is not allowed access to scopes %r.',
+                      request.client_id, request.client, request.scopes)
+            raise errors.InvalidGrantError(request=request)
+
+        for attr in ('user', 'scopes'):
+            if getattr(request, attr, None) is None:
+                log.debug('request.%s was not set on code validation.', attr)
+
+        if not await call(self.request_validator.confirm_redirect_uri,
+                          request.client_id, request.code,
+                          request.redirect_uri, request.client):
+            log.debug('Redirect_uri (%r) invalid for client %r (%r).',
+                      request.redirect_uri, request.client_id, request.client)
+            raise errors.AccessDeniedError(request=request)
+
+        for validator in self._token_validators:
+            await call(validator, request)
+
+
+class AsyncImplicitGrant(AsyncGrantTypeBase, ImplicitGrant):
+
+    """Asyncio variant of the ImplicitGrant."""
+
+    async def create_authorization_response(self, request, token_handler):
+        return await self.create_token_response(request, token_handler)
+
+    async def create_token_response(self, request, token_handler):
+        try:
+            if not request.scopes:
+                raise ValueError('Scopes must be set on post auth.')
+
+            await self.validate_token_request(request)
+
+        except errors.FatalClientError as e:
+            log.debug('Fatal client error during validation of %r. %r.',
+                      request, e)
+            raise
+
+        except errors.OAuth2Error as e:
+            log.debug('Client error during validation of %r. %r.', request, e)
+            return {'Location': common.add_params_to_uri(request.redirect_uri, e.twotuples,
+                                                         fragment=True)}, None, 302
+
+        if "token" in request.response_type.split():
+            token = await token_handler.create_token(
+                request, refresh_token=False, save_token=False)
+        else:
+            token = {}
+
+        for modifier in self._token_modifiers:
+            token = await call(modifier, token, token_handler, request)
+        await call(self.request_validator.save_token, token, request)
+        return self.prepare_authorization_response(
+            request, token, {}, None, 302)
+
+    async def validate_authorization_request(self, request):
+        return await self.validate_token_request(request)
+
+    async def validate_token_request(self, request):
+        await self._validate_client_and_redirect_uri(request)
+        if not is_absolute_uri(request.redirect_uri):
+            raise errors.InvalidRedirectURIError(request=request)
+
+        if request.response_type is None:
+            raise errors.MissingResponseTypeError(request=request)
+        elif not set(request.response_type.split()).issubset(self.response_types):
+            raise errors.UnsupportedResponseTypeError(request=request)
+
+        log.debug('Validating use of response_type token for client %r (%r).',
+                  request.client_id, request.client)
+        return await self._validate_response_type(request)
+
+
+class AsyncResourceOwnerPasswordCredentialsGrant(
+        AsyncGrantTypeBase, ResourceOwnerPasswordCredentialsGrant):
+
+    """Asyncio variant of the ResourceOwnerPasswordCredentialsGrant."""
+
+    async def create_token_response(self, request, token_handler):
+        headers = dict(_TOKEN_HEADERS)
+        try:
+            await call(self.request_validator.prefetch, request, 'password')
+            await self._authenticate_client(request)
+            log.debug('Validating access token request, %r.', request)
+            await self.validate_token_request(request)
+        except errors.OAuth2Error as e:
+            log.debug('Client error in token request, %s.', e)
+            return headers, e.json, e.status_code
+
+        token = await token_handler.create_token(
+            request, self.refresh_token, save_token=False)
+
+        for modifier in self._token_modifiers:
+            token = await call(modifier, token)
+        await call(self.request_validator.save_token, token, request)
+
+        log.debug('Issuing token %r to client id %r (%r) and username %s.',
+                  token, request.client_id, request.client, request.username)
+        return headers, json.dumps(token), 200
+
+    async def validate_token_request(self, request):
+        for param in ('grant_type', 'username', 'password'):
+            if not getattr(request, param, None):
+                raise errors.InvalidRequestError(
+                    'Request is missing %s parameter.' % param, request=request)
+
+        for param in ('grant_type', 'username', 'password', 'scope'):
+            if param in request.duplicate_params:
+                raise errors.InvalidRequestError(description='Duplicate %s parameter.' % param, request=request)
+
+        if not request.grant_type == 'password':
+            raise errors.UnsupportedGrantTypeError(request=request)
+
+        log.debug('Validating username %s.', request.username)
+        if not await call(self.request_validator.validate_user,
+                          request.username, request.password, request.client,
+                          request):
+            raise errors.InvalidGrantError(
+                'Invalid credentials given.', request=request)
+        else:
+            if not hasattr(request.client, 'client_id'):
+                raise NotImplementedError(
+                    'Validate user must set the '
+                    'request.client.client_id attribute '
+                    'in authenticate_client.')
+        log.debug('Authorizing access to user %r.', request.user)
+
+        await self.validate_grant_type(request)
+
+        if request.client:
+            request.client_id = request.client_id or request.client.client_id
+        await self.validate_scopes(request)
+
+
+class AsyncClientCredentialsGrant(AsyncGrantTypeBase, ClientCredentialsGrant):
+
+    """Asyncio variant of the ClientCredentialsGrant."""
+
+    async def create_token_response(self, request, token_handler):
+        headers = dict(_TOKEN_HEADERS)
+        try:
+            await call(self.request_validator.prefetch, request,
+                       'client_credentials')
+            log.debug('Validating access token request, %r.', request)
+            await self.validate_token_request(request)
+        except errors.OAuth2Error as e:
+            log.debug('Client error in token request. %s.', e)
+            return headers, e.json, e.status_code
+
+        token = await token_handler.create_token(
+            request, refresh_token=False, save_token=False)
+
+        for modifier in self._token_modifiers:
+            token = await call(modifier, token)
+        await call(self.request_validator.save_token, token, request)
+
+        log.debug('Issuing token to client id %r (%r), %r.',
+                  request.client_id, request.client, token)
+        return headers, json.dumps(token), 200
+
+    async def create_token_responses(self, requests, token_handler):
+        """See ClientCredentialsGrant.create_token_responses."""
+        headers = dict(_TOKEN_HEADERS)
+        responses = [None] * len(requests)
+        valid = []
+        for index, request in enumerate(requests):
+            try:
+                await call(self.request_validator.prefetch, request,
+                           'client_credentials')
+                log.debug('Validating access token request, %r.', request)
+                await self.validate_token_request(request)
+            except errors.OAuth2Error as e:
+                log.debug('Client error in token request. %s.', e)
+                responses[index] = dict(headers), e.json, e.status_code
+                continue
+            valid.append((index, request))
+
+        valid_requests = [request for _, request in valid]
+        if hasattr(token_handler, 'create_tokens'):
+            tokens = await token_handler.create_tokens(
+                valid_requests, refresh_token=False, save_token=False)
+        else:
+            tokens = []
+            for request in valid_requests:
+                tokens.append(await token_handler.create_token(
+                    request, refresh_token=False, save_token=False))
+        issued = []
+        for (index, request), token in zip(valid, tokens):
+            for modifier in self._token_modifiers:
+                token = await call(modifier, token)
+            issued.append((index, token, request))
+
+        if issued:
+            await call(self.request_validator.save_tokens_bulk,
+                       [(token, request) for _, token, request in issued])
+        for index, token, request in issued:
+            log.debug('Issuing token to client id %r (%r), %r.',
+                      request.client_id, request.client, token)
+            responses[index] = dict(headers), json.dumps(token), 200
+        return responses
+
+    async def validate_token_request(self, request):
+        self._validate_token_params(request)
+        await self._authenticate_client_credentials(request)
+        await self._validate_client_access(request)
+
+    async def _authenticate_client_credentials(self, request):
+        log.debug('Authenticating client, %r.', request)
+        if not await call(self.request_validator.authenticate_client, request):
+            log.debug('Client authentication failed, %r.', request)
+            raise errors.InvalidClientError(request=request)
+        else:
+            if not hasattr(request.client, 'client_id'):
+                raise NotImplementedError('Authenticate client must set the '
+                                          'request.client.client_id attribute '
+                                          'in authenticate_client.')
+
+    async def _validate_client_access(self, request):
+        await self.validate_grant_type(request)
+
+        log.debug('Authorizing access to user %r.', request.user)
+        request.client_id = request.client_id or request.client.client_id
+        await self.validate_scopes(request)
+
+
+class AsyncRefreshTokenGrant(AsyncGrantTypeBase, RefreshTokenGrant):
+
+    """Asyncio variant of the RefreshTokenGrant."""
+
+    async def create_token_response(self, request, token_handler):
+        headers = dict(_TOKEN_HEADERS)
+        try:
+            await call(self.request_validator.prefetch, request,
+                       'refresh_token')
+            log.debug('Validating refresh token request, %r.', request)
+            await self.validate_token_request(request)
+        except errors.OAuth2Error as e:
+            return headers, e.json, e.status_code
+
+        token = await token_handler.create_token(
+            request, refresh_token=self.issue_new_refresh_tokens,
+            save_token=False)
+
+        for modifier in self._token_modifiers:
+            token = await call(modifier, token)
+        await call(self.request_validator.save_token, token, request)
+
+        log.debug('Issuing new token to client id %r (%r), %r.',
+                  request.client_id, request.client, token)
+        return headers, json.dumps(token), 200
+
+    async def validate_token_request(self, request):
+        if request.grant_type != 'refresh_token':
+            raise errors.UnsupportedGrantTypeError(request=request)
+
+        if request.refresh_token is None:
+            raise errors.InvalidRequestError(
+                description='Missing refresh token parameter.',
+                request=request)
+
+        await self._authenticate_client(request)
+
+        await self.validate_grant_type(request)
+
+        log.debug('Validating refresh token %s for client %r.',
+                  request.refresh_token, request.client)
+        if not await call(self.request_validator.validate_refresh_token,
+                          request.refresh_token, request.client, request):
+            log.debug('Invalid refresh token, %s, for client %r.',
+                      request.refresh_token, request.client)
+            raise errors.InvalidGrantError(request=request)
+
+        original_scopes = utils.scope_to_list(
+            await call(self.request_validator.get_original_scopes,
+                       request.refresh_token, request))
+
+        if request.scope:
+            request.scopes = utils.scope_to_list(request.scope)
+            if (not all((s in original_scopes for s in request.scopes))
+                and not await call(
+                    self.request_validator.is_within_original_scope,
+                    request.scopes, request.refresh_token, request)):
+                log.debug('Refresh token %s lack requested scopes, %r.',
+                          request.refresh_token, request.scopes)
+                raise errors.InvalidScopeError(request=request)
+        else:
+            request.scopes = original_scopes
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+oauthlib.oauth2.rfc6749.aio.tokens
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+from __future__ import absolute_import, unicode_literals
+
+from ..tokens import BearerToken, OAuth2Token
+from .utils import call
+
+
+class AsyncBearerToken(BearerToken):
+
+    """Asyncio variant of the BearerToken."""
+
+    __slots__ = ()
+
+    async def create_token(self, request, refresh_token=False, save_token=True):
+        """Create a BearerToken, by default without refresh token."""
+        return await self._create_token(request, refresh_token, save_token)
+
+    async def create_tokens(self, requests, refresh_token=False,
+                            save_token=True):
+        """See BearerToken.create_tokens."""
+        tokens = []
+        for request, access_token in zip(requests,
+                                         self._access_tokens(requests)):
+            tokens.append(await self._create_token(
+                request, refresh_token, save_token, access_token))
+        return tokens
+
+    async def _create_token(self, request, refresh_token, save_token,
+                            access_token=None):
+        token = self._new_token(request, access_token)
+        if refresh_token:
+            if (request.refresh_token and
+                    not await call(self.request_validator.rotate_refresh_token,
+                                   request)):
+                token['refresh_token'] = request.refresh_token
+            else:
+                token['refresh_token'] = self.refresh_token_generator(request)
+
+        token.update(request.extra_credentials or {})
+        token = OAuth2Token(token)
+        if save_token:
+            await call(self.request_validator.save_bearer_token, token, request)
+        return token
+
+    async def validate_request(self, request):
+        token = None
+        if 'Authorization' in request.headers:
+            token = request.headers.get('Authorization')[7:]
+        else:
+            token = request.access_token
+        if self.public_pem is not None:
+            valid = self.validate_signed_token(token, request)
+            if valid is not None:
+                return valid
+        if (self.token_format is not None and
+                not self.token_format.check(token, 'access_token')):
+            return False
+        if self.cache is None:
+            return await call(self.request_validator.validate_bearer_token,
+                              token, request.scopes, request)
+
+        scopes = request.scopes
+        valid = self.cache.get(token, scopes, request)
+        if valid is None:
+            valid = await call(self.request_validator.validate_bearer_token,
+                               token, scopes, request)
+            self.cache.set(token, scopes, valid, request)
+        return valid
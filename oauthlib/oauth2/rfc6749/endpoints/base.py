@@ -40,26 +40,73 @@ class BaseEndpoint(object):
         self._catch_errors = catch_errors
 
 
+def unavailable_response(endpoint, ignored):
+    """Return the response of an unavailable endpoint, None if available.
+
+    ignored describes what is ignored, for the log.
+    """
+    if endpoint.available:
+        return None
+    e = TemporarilyUnavailableError()
+    log.info('Endpoint unavailable, ignoring %s.' % ignored)
+    return {}, e.json, 503
+
+
+def error_response(endpoint, error, processed):
+    """Return the server error response of an exception caught while
+    processing a request, None if the exception should propagate.
+
+    processed describes what was processed, for the log.
+    """
+    if not endpoint.catch_errors:
+        return None
+    if isinstance(error, (OAuth2Error, FatalClientError)):
+        return None
+    e = ServerError()
+    log.warning('Exception caught while processing %s, %s.' % (
+        processed, error))
+    return {}, e.json, 500
+
+
+def batch_responses(response, requests):
+    """Return a copy of response for each of the requests."""
+    headers, body, status = response
+    return [(dict(headers), body, status) for _ in requests]
+
+
 def catch_errors_and_unavailability(f):
     @functools.wraps(f)
     def wrapper(endpoint, uri, *args, **kwargs):
-        if not endpoint.available:
-            e = TemporarilyUnavailableError()
-            log.info('Endpoint unavailable, ignoring request %s.' % uri)
-            return {}, e.json, 503
-
-        if endpoint.catch_errors:
-            try:
-                return f(endpoint, uri, *args, **kwargs)
-            except OAuth2Error:
+        response = unavailable_response(endpoint, 'request %s' % uri)
+        if response is not None:
+            return response
+
+        try:
+            return f(endpoint, uri, *args, **kwargs)
+        except Exception as e:
+            response = error_response(endpoint, e, 'request')
+            if response is None:
                 raise
-            except FatalClientError:
+            return response
+    return wrapper
+
+
+def catch_batch_errors_and_unavailability(f):
+    """Like catch_errors_and_unavailability, for methods handling a list of
+    requests and returning one response per request.
+    """
+    @functools.wraps(f)
+    def wrapper(endpoint, requests, *args, **kwargs):
+        response = unavailable_response(
+            endpoint, '%d requests' % len(requests))
+        if response is not None:
+            return batch_responses(response, requests)
+
+        try:
+            return f(endpoint, requests, *args, **kwargs)
+        except Exception as e:
+            response = error_response(endpoint, e, 'requests')
+            if response is None:
                 raise
-            except Exception as e:
-                error = ServerError()
-                log.warning(
-                    'Exception caught while processing request, %s.' % e)
-                return {}, error.json, 500
-        else:
-            return f(endpoint, uri, *args, **kwargs)
+            return batch_responses(response, requests)
     return wrapper
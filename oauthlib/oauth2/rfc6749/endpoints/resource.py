@@ -48,6 +48,9 @@ class ResourceEndpoint(BaseEndpoint):
         BaseEndpoint.__init__(self)
         self._tokens = token_types
         self._default_token = default_token
+        # The token types the schemes were found for, and the token type
+        # names by lower cased Authorization scheme, see _token_schemes.
+        self._schemes = (), {}
 
     @property
     def default_token(self):
@@ -81,7 +84,30 @@ class ResourceEndpoint(BaseEndpoint):
         different token types during protected resource access. We estimate
         the most likely token type (if any) by asking each known token type
         to give an estimation based on the request.
+
+        Requests with an Authorization header are first dispatched on its
+        scheme to the token type declaring it as its scheme attribute, such
+        as Bearer, without estimating.
         """
+        authorization = request.headers.get('Authorization')
+        if authorization:
+            name = self._token_schemes().get(
+                authorization.split(' ', 1)[0].lower())
+            if name is not None:
+                return name
+
         estimates = sorted(((t.estimate_type(request), n)
                             for n, t in self.tokens.items()))
         return estimates[0][1] if len(estimates) else None
+
+    def _token_schemes(self):
+        """Token type names by lower cased Authorization scheme, for token
+        types declaring their scheme, found again once tokens changes.
+        """
+        tokens = tuple(self.tokens.items())
+        found_for, schemes = self._schemes
+        if tokens != found_for:
+            schemes = dict((t.scheme.lower(), n) for n, t in tokens
+                           if getattr(t, 'scheme', None))
+            self._schemes = tokens, schemes
+        return schemes
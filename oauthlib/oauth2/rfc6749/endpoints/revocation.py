@@ -31,12 +31,22 @@ class RevocationEndpoint(BaseEndpoint):
     valid_token_types = ('access_token', 'refresh_token')
 
     def __init__(self, request_validator, supported_token_types=None,
-            enable_jsonp=False):
+            enable_jsonp=False, on_revoke=None, token_format=None):
+        """
+        :param on_revoke: An optional function called with the same arguments
+                          as request_validator.revoke_token once a token has
+                          been revoked, e.g. BearerTokenCache.revoke_token.
+        :param token_format: An optional token format, such as
+                             ChecksummedTokenFormat, malformed tokens being
+                             treated as invalid without calling revoke_token.
+        """
         BaseEndpoint.__init__(self)
         self.request_validator = request_validator
         self.supported_token_types = (
             supported_token_types or self.valid_token_types)
         self.enable_jsonp = enable_jsonp
+        self.on_revoke = on_revoke
+        self.token_format = token_format
 
     @catch_errors_and_unavailability
     def create_revocation_response(self, uri, http_method='POST', body=None,
@@ -71,8 +81,14 @@ class RevocationEndpoint(BaseEndpoint):
                 response_body = '%s(%s);' % (request.callback, response_body)
             return {}, response_body, e.status_code
 
-        self.request_validator.revoke_token(request.token,
-                                            request.token_type_hint, request)
+        if (self.token_format is not None and
+                not self.token_format.check(request.token)):
+            log.debug('Ignoring malformed token in %r.', request)
+        else:
+            self.request_validator.revoke_token(
+                request.token, request.token_type_hint, request)
+            if self.on_revoke is not None:
+                self.on_revoke(request.token, request.token_type_hint, request)
 
         response_body = ''
         if self.enable_jsonp and request.callback:
@@ -8,12 +8,14 @@ for consuming and providing OAuth 2.0 RFC6749.
 """
 from __future__ import absolute_import, unicode_literals
 
+import collections
 import logging
 
 from oauthlib.common import Request
 from oauthlib.oauth2.rfc6749 import utils
 
 from .base import BaseEndpoint, catch_errors_and_unavailability
+from .base import catch_batch_errors_and_unavailability
 
 
 log = logging.getLogger(__name__)
@@ -90,6 +92,58 @@ class TokenEndpoint(BaseEndpoint):
                               headers=None, credentials=None, grant_type_for_scope=None,
                               claims=None):
         """Extract grant_type and route to the designated handler."""
+        request = self._create_request(uri, http_method, body, headers,
+                                       credentials, grant_type_for_scope,
+                                       claims)
+        grant_type_handler = self.grant_types.get(request.grant_type,
+                                                  self.default_grant_type_handler)
+        log.debug('Dispatching grant_type %s request to %r.',
+                  request.grant_type, grant_type_handler)
+        return grant_type_handler.create_token_response(
+            request, self.default_token_type)
+
+    @catch_batch_errors_and_unavailability
+    def create_token_responses(self, requests):
+        """Issue tokens for several token requests at once.
+
+        :param requests: A list of dicts of the create_token_response
+                         arguments of each request.
+        :returns: A list of the (headers, body, status) responses, in the
+                  order of the requests.
+
+        Requests are routed to their grant type handler as usual. Handlers
+        providing create_token_responses, such as the client credentials
+        grant, handle all their requests together, saving the tokens with a
+        single save_tokens_bulk call. Every request is still authenticated on
+        its own. Others handle their requests one at a time.
+        """
+        batches = collections.OrderedDict()
+        for index, kwargs in enumerate(requests):
+            request = self._create_request(**kwargs)
+            grant_type_handler = self.grant_types.get(
+                request.grant_type, self.default_grant_type_handler)
+            batches.setdefault(grant_type_handler, []).append((index, request))
+
+        responses = [None] * len(requests)
+        for grant_type_handler, batch in batches.items():
+            log.debug('Dispatching %d grant_type %s requests to %r.',
+                      len(batch), batch[0][1].grant_type, grant_type_handler)
+            batch_requests = [request for _, request in batch]
+            if hasattr(grant_type_handler, 'create_token_responses'):
+                batch_responses = grant_type_handler.create_token_responses(
+                    batch_requests, self.default_token_type)
+            else:
+                batch_responses = [
+                    grant_type_handler.create_token_response(
+                        request, self.default_token_type)
+                    for request in batch_requests]
+            for (index, _), response in zip(batch, batch_responses):
+                responses[index] = response
+        return responses
+
+    def _create_request(self, uri, http_method='GET', body=None, headers=None,
+                        credentials=None, grant_type_for_scope=None,
+                        claims=None):
         request = Request(
             uri, http_method=http_method, body=body, headers=headers)
 
@@ -109,10 +163,4 @@ class TokenEndpoint(BaseEndpoint):
         # as a dict.
         if claims:
             request.claims = claims
-
-        grant_type_handler = self.grant_types.get(request.grant_type,
-                                                  self.default_grant_type_handler)
-        log.debug('Dispatching grant_type %s request to %r.',
-                  request.grant_type, grant_type_handler)
-        return grant_type_handler.create_token_response(
-            request, self.default_token_type)
+        return request
@@ -261,6 +261,7 @@ class AuthorizationCodeGrant(GrantTypeBase):
             'Pragma': 'no-cache',
         }
         try:
+            self.request_validator.prefetch(request, 'authorization_code')
             self.validate_token_request(request)
             log.debug('Token request validation ok for %r.', request)
         except errors.OAuth2Error as e:
@@ -75,6 +75,7 @@ class ClientCredentialsGrant(GrantTypeBase):
             'Pragma': 'no-cache',
         }
         try:
+            self.request_validator.prefetch(request, 'client_credentials')
             log.debug('Validating access token request, %r.', request)
             self.validate_token_request(request)
         except errors.OAuth2Error as e:
@@ -91,7 +92,61 @@ class ClientCredentialsGrant(GrantTypeBase):
                   request.client_id, request.client, token)
         return headers, json.dumps(token), 200
 
+    def create_token_responses(self, requests, token_handler):
+        """Return tokens or errors in JSON format for several requests.
+
+        Behaves as create_token_response for each request, authenticating
+        each of them, except that the tokens issued are saved together
+        through save_tokens_bulk. Token handlers providing create_tokens,
+        such as BearerToken, create the tokens together.
+        """
+        headers = {
+            'Content-Type': 'application/json',
+            'Cache-Control': 'no-store',
+            'Pragma': 'no-cache',
+        }
+        responses = [None] * len(requests)
+        valid = []
+        for index, request in enumerate(requests):
+            try:
+                self.request_validator.prefetch(request, 'client_credentials')
+                log.debug('Validating access token request, %r.', request)
+                self.validate_token_request(request)
+            except errors.OAuth2Error as e:
+                log.debug('Client error in token request. %s.', e)
+                responses[index] = dict(headers), e.json, e.status_code
+                continue
+            valid.append((index, request))
+
+        valid_requests = [request for _, request in valid]
+        if hasattr(token_handler, 'create_tokens'):
+            tokens = token_handler.create_tokens(
+                valid_requests, refresh_token=False, save_token=False)
+        else:
+            tokens = [token_handler.create_token(
+                request, refresh_token=False, save_token=False)
+                for request in valid_requests]
+        issued = []
+        for (index, request), token in zip(valid, tokens):
+            for modifier in self._token_modifiers:
+                token = modifier(token)
+            issued.append((index, token, request))
+
+        if issued:
+            self.request_validator.save_tokens_bulk(
+                [(token, request) for _, token, request in issued])
+        for index, token, request in issued:
+            log.debug('Issuing token to client id %r (%r), %r.',
+                      request.client_id, request.client, token)
+            responses[index] = dict(headers), json.dumps(token), 200
+        return responses
+
     def validate_token_request(self, request):
+        self._validate_token_params(request)
+        self._authenticate_client_credentials(request)
+        self._validate_client_access(request)
+
+    def _validate_token_params(self, request):
         if not getattr(request, 'grant_type', None):
             raise errors.InvalidRequestError('Request is missing grant type.',
                                              request=request)
@@ -104,6 +159,7 @@ class ClientCredentialsGrant(GrantTypeBase):
                 raise errors.InvalidRequestError(description='Duplicate %s parameter.' % param,
                                                  request=request)
 
+    def _authenticate_client_credentials(self, request):
         log.debug('Authenticating client, %r.', request)
         if not self.request_validator.authenticate_client(request):
             log.debug('Client authentication failed, %r.', request)
@@ -113,6 +169,8 @@ class ClientCredentialsGrant(GrantTypeBase):
                 raise NotImplementedError('Authenticate client must set the '
                                           'request.client.client_id attribute '
                                           'in authenticate_client.')
+
+    def _validate_client_access(self, request):
         # Ensure client is authorized use of this grant type
         self.validate_grant_type(request)
 
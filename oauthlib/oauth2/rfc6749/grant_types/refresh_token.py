@@ -55,6 +55,7 @@ class RefreshTokenGrant(GrantTypeBase):
             'Pragma': 'no-cache',
         }
         try:
+            self.request_validator.prefetch(request, 'refresh_token')
             log.debug('Validating refresh token request, %r.', request)
             self.validate_token_request(request)
         except errors.OAuth2Error as e:
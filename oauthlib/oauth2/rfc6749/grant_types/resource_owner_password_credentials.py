@@ -100,6 +100,7 @@ class ResourceOwnerPasswordCredentialsGrant(GrantTypeBase):
             'Pragma': 'no-cache',
         }
         try:
+            self.request_validator.prefetch(request, 'password')
             if self.request_validator.client_authentication_required(request):
                 log.debug('Authenticating client, %r.', request)
                 if not self.request_validator.authenticate_client(request):
@@ -5,7 +5,11 @@ oauthlib.oauth2.rfc6749.grant_types
 """
 from __future__ import unicode_literals, absolute_import
 
+import functools
 import logging
+import threading
+
+from oauthlib.common import Request
 
 log = logging.getLogger(__name__)
 
@@ -178,6 +182,31 @@ class RequestValidator(object):
         """
         raise NotImplementedError('Subclasses must implement this method.')
 
+    def prefetch(self, request, kind, *args, **kwargs):
+        """Load what a token request needs in one go, before validating it.
+
+        Called first by the grant types on every token request, with kind
+        being the grant type: authorization_code, refresh_token, password or
+        client_credentials. Validators which would otherwise query their
+        backend once per validation method may load the client, the
+        authorization code or refresh token and its scopes together here,
+        store them on the request (for instance as request.client) and have
+        the validation methods read them from the request.
+
+        Raising an OAuth2Error such as InvalidClientError rejects the request.
+        Does nothing by default.
+
+        :param request: oauthlib.common.Request
+        :param kind: The grant type of the request.
+
+        Method is used by:
+            - Authorization Code Grant
+            - Resource Owner Password Credentials Grant
+            - Client Credentials Grant
+            - Refresh Token Grant
+        """
+        pass
+
     def revoke_token(self, token, token_type_hint, request, *args, **kwargs):
         """Revoke an access or refresh token.
 
@@ -238,6 +267,22 @@ class RequestValidator(object):
         """
         raise NotImplementedError('Subclasses must implement this method.')
 
+    def save_authorization_codes_bulk(self, codes, *args, **kwargs):
+        """Persist several authorization codes at once.
+
+        :param codes: A list of (client_id, code, request) tuples, see
+                      save_authorization_code.
+
+        Override to store the codes in a single batch, by default each code
+        is saved with save_authorization_code.
+
+        Method is used by:
+            - WriteBehindRequestValidator
+        """
+        for client_id, code, request in codes:
+            self.save_authorization_code(client_id, code, request,
+                                         *args, **kwargs)
+
     def save_token(self, token, request, *args, **kwargs):
         """Persist the token with a token type specific method.
 
@@ -245,6 +290,20 @@ class RequestValidator(object):
         """
         return self.save_bearer_token(token, request, *args, **kwargs)
 
+    def save_tokens_bulk(self, tokens, *args, **kwargs):
+        """Persist several tokens at once.
+
+        :param tokens: A list of (token, request) tuples, see save_token.
+
+        Override to store the tokens in a single batch, by default each token
+        is saved with save_token.
+
+        Method is used by:
+            - WriteBehindRequestValidator
+        """
+        for token, request in tokens:
+            self.save_token(token, request, *args, **kwargs)
+
     def save_bearer_token(self, token, request, *args, **kwargs):
         """Persist the Bearer token.
 
@@ -357,6 +416,11 @@ class RequestValidator(object):
         one provided for django these attributes will be made available
         in all protected views as keyword arguments.
 
+        When the results are cached with a BearerTokenCache, set
+        request.expires_in to the number of seconds the token remains valid
+        for, so that cached results never outlive the token. Valid tokens
+        are not cached otherwise.
+
         :param token: Unicode Bearer token
         :param scopes: List of scopes (defined by you)
         :param request: The HTTP Request (oauthlib.common.Request)
@@ -377,6 +441,10 @@ class RequestValidator(object):
         to set request.client to the client object associated with the
         given client_id.
 
+        Later calls for the same request, such as validate_redirect_uri and
+        get_default_redirect_uri, may then use request.client rather than
+        loading the client again, see MemoizingRequestValidator.
+
         :param request: oauthlib.common.Request
         :rtype: True or False
 
@@ -571,3 +639,201 @@ class RequestValidator(object):
             - OpenIDConnectHybrid
         """
         raise NotImplementedError('Subclasses must implement this method.')
+
+
+class MemoizingRequestValidator(object):
+
+    """Wraps a RequestValidator, memoizing its methods for each request.
+
+    The grant types call the validator several times for the same client,
+    code or token while handling a single request. Calls of the methods
+    named in memoized with the same arguments are answered from a memo
+    stored on the request as request.validator_memo, without calling the
+    wrapped validator again. Every other attribute is looked up on the
+    wrapped validator::
+
+        server = Server(MemoizingRequestValidator(MyValidator()))
+
+    Results are memoized for the lifetime of the request only, which the
+    request attributes set by the first call are part of. To load each
+    client at most once per request, validate_client_id, authenticate_client
+    and authenticate_client_id should set request.client, and the methods
+    called after them should use request.client when it is set rather than
+    loading the client from request.client_id.
+
+    Calls with unhashable arguments and coroutine methods are not memoized.
+    """
+
+    memoized = frozenset((
+        'authenticate_client', 'authenticate_client_id',
+        'client_authentication_required', 'confirm_redirect_uri',
+        'get_default_redirect_uri', 'get_default_scopes',
+        'get_original_scopes', 'is_within_original_scope',
+        'validate_client_id', 'validate_code', 'validate_grant_type',
+        'validate_redirect_uri', 'validate_refresh_token',
+        'validate_response_type', 'validate_scopes', 'validate_user',
+    ))
+
+    def __init__(self, request_validator, memoized=None):
+        self.request_validator = request_validator
+        if memoized is not None:
+            self.memoized = frozenset(memoized)
+
+    def __getattr__(self, name):
+        attr = getattr(self.request_validator, name)
+        if name in self.memoized:
+            return self._memoize(name, attr)
+        return attr
+
+    @staticmethod
+    def _memoize(name, method):
+        @functools.wraps(method)
+        def memoized(*args, **kwargs):
+            request = kwargs.get('request')
+            if request is None:
+                for arg in args:
+                    if isinstance(arg, Request):
+                        request = arg
+                        break
+                else:
+                    return method(*args, **kwargs)
+
+            key = (name, tuple(_freeze(a) for a in args if a is not request),
+                   tuple(sorted((k, _freeze(v)) for k, v in kwargs.items()
+                                if v is not request)))
+            try:
+                hash(key)
+            except TypeError:
+                return method(*args, **kwargs)
+
+            memo = getattr(request, 'validator_memo', None)
+            if memo is None:
+                memo = request.validator_memo = {}
+            if key in memo:
+                return memo[key]
+            result = method(*args, **kwargs)
+            if not hasattr(result, '__await__'):
+                memo[key] = result
+            return result
+        return memoized
+
+
+def _freeze(value):
+    # Scopes are given as lists.
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class WriteBehindRequestValidator(object):
+
+    """Wraps a RequestValidator, saving tokens and codes in batches.
+
+    Tokens and authorization codes given to save_token, save_bearer_token
+    and save_authorization_code are buffered and handed to the
+    save_tokens_bulk and save_authorization_codes_bulk methods of the
+    wrapped validator once max_size saves are pending, or max_delay seconds
+    after the first pending save. Every other attribute is looked up on the
+    wrapped validator::
+
+        validator = WriteBehindRequestValidator(MyValidator())
+        server = BackendApplicationServer(validator)
+
+    Pending saves are flushed before any of the methods named in reads is
+    called, so that tokens and codes issued through this validator are
+    persisted before they are validated, refreshed or revoked through it.
+    Other processes only see them once flushed, within max_delay seconds.
+    Saves which fail to be persisted are logged and retried max_delay
+    seconds later. Call flush when shutting down to persist the remaining
+    saves, it raises should they fail.
+    """
+
+    reads = frozenset((
+        'confirm_redirect_uri', 'get_original_scopes',
+        'invalidate_authorization_code', 'is_within_original_scope',
+        'revoke_token', 'validate_bearer_token', 'validate_code',
+        'validate_refresh_token',
+    ))
+
+    def __init__(self, request_validator, max_size=100, max_delay=1.0):
+        self.request_validator = request_validator
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._tokens = []
+        self._codes = []
+        self._timer = None
+        # Guards the buffers and timer, never held while writing.
+        self._lock = threading.Lock()
+        # Held while writing, so that reads wait for writes in progress.
+        self._write_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name in self.reads and (self.pending or self._write_lock.locked()):
+            self._flush(raise_errors=False)
+        return getattr(self.request_validator, name)
+
+    @property
+    def pending(self):
+        """The number of saves not yet persisted."""
+        return len(self._tokens) + len(self._codes)
+
+    def save_token(self, token, request, *args, **kwargs):
+        self._buffer(self._tokens, (token, request))
+
+    def save_bearer_token(self, token, request, *args, **kwargs):
+        self._buffer(self._tokens, (token, request))
+
+    def save_authorization_code(self, client_id, code, request,
+                                *args, **kwargs):
+        self._buffer(self._codes, (client_id, code, request))
+
+    def _buffer(self, pending, item):
+        with self._lock:
+            pending.append(item)
+            full = self.pending >= self.max_size
+            if not full:
+                self._schedule()
+        if full:
+            self._flush(raise_errors=False)
+
+    def _schedule(self):
+        # Called with _lock held.
+        if self._timer is None:
+            self._timer = threading.Timer(
+                self.max_delay, self._flush, kwargs={'raise_errors': False})
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Persist all pending saves.
+
+        Saves whose batch could not be persisted are kept pending, to be
+        retried after max_delay seconds, and the error raised again.
+        """
+        self._flush(raise_errors=True)
+
+    def _flush(self, raise_errors):
+        # Failures of the flushes triggered by saves, reads or the timer are
+        # only logged, these have nothing to do with the failed saves.
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                tokens, self._tokens = self._tokens, []
+                codes, self._codes = self._codes, []
+            try:
+                if codes:
+                    self.request_validator.save_authorization_codes_bulk(codes)
+                    codes = []
+                if tokens:
+                    self.request_validator.save_tokens_bulk(tokens)
+            except Exception:
+                log.exception('Flushing %d tokens and %d codes failed.',
+                              len(tokens), len(codes))
+                with self._lock:
+                    self._tokens[:0] = tokens
+                    self._codes[:0] = codes
+                    self._schedule()
+                if raise_errors:
+                    raise
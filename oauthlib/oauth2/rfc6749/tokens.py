@@ -9,9 +9,12 @@ This module contains methods for adding two types of access tokens to requests.
 """
 from __future__ import absolute_import, unicode_literals
 
-from binascii import b2a_base64
+from binascii import b2a_base64, hexlify
 import hashlib
 import hmac
+import numbers
+import time
+import zlib
 try:
     from urlparse import urlparse
 except ImportError:
@@ -219,8 +222,89 @@ def signed_token_generator(private_pem, **kwargs):
     return signed_token_generator
 
 
+class ChecksummedTokenFormat(object):
+
+    """Random tokens carrying a type prefix and a checksum.
+
+    Tokens look like ``at_<random characters><checksum>``, the prefix naming
+    the token type, so that malformed tokens may be rejected without asking
+    the request validator. The checksum is a CRC32 of the rest of the token,
+    which only catches garbage, unless a secret key is given, in which case
+    it is a truncated HMAC-SHA256 which cannot be forged without the key::
+
+        token_format = ChecksummedTokenFormat(key=secret)
+        bearer = BearerToken(
+            validator,
+            token_generator=token_format.access_token_generator,
+            refresh_token_generator=token_format.refresh_token_generator,
+            token_format=token_format)
+        revocation = RevocationEndpoint(validator, token_format=token_format)
+    """
+
+    def __init__(self, key=None, length=30,
+                 prefixes=(('access_token', 'at'), ('refresh_token', 'rt'))):
+        if isinstance(key, unicode_type):
+            key = key.encode('utf-8')
+        self.key = key
+        self.prefixes = dict(prefixes)
+        self.generator = common.TokenGenerator(length=length)
+        # A 48 bit MAC or a 32 bit CRC, as base 62 characters.
+        self.checksum_length = 9 if key is not None else 6
+
+    def _checksum(self, body):
+        data = body.encode('utf-8')
+        if self.key is None:
+            value = zlib.crc32(data) & 0xffffffff
+        else:
+            digest = hmac.new(self.key, data, hashlib.sha256).digest()
+            value = int(hexlify(digest[:6]), 16)
+        chars = common.UNICODE_ASCII_CHARACTER_SET
+        checksum = []
+        for _ in range(self.checksum_length):
+            value, remainder = divmod(value, len(chars))
+            checksum.append(chars[remainder])
+        return ''.join(checksum)
+
+    def generate(self, token_type='access_token'):
+        """Return a new token of token_type, one of the configured prefixes."""
+        if token_type not in self.prefixes:
+            raise ValueError('No prefix configured for %r.' % token_type)
+        body = '%s_%s' % (self.prefixes[token_type], self.generator.generate())
+        return body + self._checksum(body)
+
+    def access_token_generator(self, request, refresh_token=False):
+        return self.generate('refresh_token' if refresh_token
+                             else 'access_token')
+
+    def refresh_token_generator(self, request):
+        return self.generate('refresh_token')
+
+    def check(self, token, token_type=None):
+        """Whether token is well formed, of token_type if given."""
+        if not token:
+            return False
+        if token_type is None:
+            prefixes = self.prefixes.values()
+        elif token_type in self.prefixes:
+            prefixes = [self.prefixes[token_type]]
+        else:
+            return False
+        expected_length = self.generator.length + self.checksum_length
+        for prefix in prefixes:
+            if (token.startswith(prefix + '_') and
+                    len(token) == len(prefix) + 1 + expected_length):
+                body = token[:-self.checksum_length]
+                return common.safe_string_equals(
+                    self._checksum(body), token[-self.checksum_length:])
+        return False
+
+
 class TokenBase(object):
 
+    # The Authorization header scheme of the token type, if any, see
+    # ResourceEndpoint.find_token_type.
+    scheme = None
+
     def __call__(self, request, refresh_token=False):
         raise NotImplementedError('Subclasses must implement this method.')
 
@@ -231,24 +315,177 @@ class TokenBase(object):
         raise NotImplementedError('Subclasses must implement this method.')
 
 
+class BearerTokenCache(object):
+
+    """Cache of validate_bearer_token results, keyed by token and scopes.
+
+    Valid tokens are remembered for ttl seconds and invalid ones for
+    negative_ttl seconds, at most maxsize tokens being kept. Entries never
+    outlive the token: validate_bearer_token must set request.expires_in to
+    the number of seconds the token remains valid for, valid tokens being
+    left uncached otherwise. An expires_in parameter sent by the client is
+    ignored.
+
+    The request attributes set by validate_bearer_token, named in
+    attributes, are stored alongside each result and restored on a hit.
+
+    Revoked tokens are evicted by passing revoke_token as the on_revoke hook
+    of the RevocationEndpoint::
+
+        cache = BearerTokenCache()
+        bearer = BearerToken(validator, cache=cache)
+        revocation = RevocationEndpoint(validator,
+                                        on_revoke=cache.revoke_token)
+
+    Access tokens issued from a revoked refresh token are only evicted once
+    their entries expire, keep ttl short if that matters.
+    """
+
+    attributes = ('client', 'client_id', 'user', 'scopes')
+
+    def __init__(self, maxsize=4096, ttl=60, negative_ttl=10):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # Maps tokens to a dict of scopes to (valid, expires, attributes),
+        # so that all entries of a token are evicted at once.
+        self._cache = common.LRUCache(maxsize)
+
+    @staticmethod
+    def _scopes_key(scopes):
+        return None if scopes is None else frozenset(scopes)
+
+    def get(self, token, scopes, request):
+        """Return the cached result, None if the token is not cached.
+
+        The request attributes stored with a result are set on request.
+        """
+        entries = self._cache.get(token)
+        if entries is None:
+            return None
+        entry = entries.get(self._scopes_key(scopes))
+        if entry is None or entry[1] <= time.time():
+            return None
+        valid, _, attributes = entry
+        for name, value in attributes:
+            setattr(request, name, value)
+        return valid
+
+    def set(self, token, scopes, valid, request):
+        """Store the result of validate_bearer_token for token and scopes."""
+        valid = bool(valid)
+        if valid:
+            # Only read a value set on the request, not one of the request
+            # parameters Request falls back to.
+            expires_in = vars(request).get('expires_in')
+            if (not isinstance(expires_in, numbers.Real) or
+                    isinstance(expires_in, bool)):
+                return
+            ttl = min(self.ttl, expires_in)
+        else:
+            ttl = self.negative_ttl
+        if ttl <= 0:
+            return
+        now = time.time()
+        attributes = tuple((name, getattr(request, name))
+                           for name in self.attributes)
+        # Entries are replaced rather than updated in place as other threads
+        # may be reading them.
+        entries = dict((key, entry) for key, entry
+                       in (self._cache.get(token) or {}).items()
+                       if entry[1] > now)
+        entries[self._scopes_key(scopes)] = valid, now + ttl, attributes
+        expires = max(entry[1] for entry in entries.values())
+        self._cache.set(token, entries, expires - now)
+
+    def invalidate(self, token):
+        """Evict all cached results for token."""
+        self._cache.pop(token)
+
+    def revoke_token(self, token, token_type_hint, request):
+        """Evict a revoked token, see RevocationEndpoint on_revoke."""
+        self.invalidate(token)
+
+    def clear(self):
+        self._cache.clear()
+
+
 class BearerToken(TokenBase):
+
+    """Bearer token type, creating and validating tokens.
+
+    Resource servers given the public_pem of signed_token_generator, or its
+    oauthlib.common.KeyRing, verify signed tokens locally, checking their
+    signature, expiry and scope without calling validate_bearer_token. Tokens
+    which are not signed are still validated by the request validator.
+
+    Given a token_format, such as ChecksummedTokenFormat, malformed access
+    tokens are rejected without calling validate_bearer_token.
+    """
+
     __slots__ = (
         'request_validator', 'token_generator',
-        'refresh_token_generator', 'expires_in'
+        'refresh_token_generator', 'expires_in', 'cache', 'public_pem',
+        'token_format'
     )
 
+    scheme = 'Bearer'
+
     def __init__(self, request_validator=None, token_generator=None,
-                 expires_in=None, refresh_token_generator=None):
+                 expires_in=None, refresh_token_generator=None, cache=None,
+                 public_pem=None, token_format=None):
         self.request_validator = request_validator
         self.token_generator = token_generator or random_token_generator
         self.refresh_token_generator = (
             refresh_token_generator or self.token_generator
         )
         self.expires_in = expires_in or 3600
+        self.cache = cache
+        self.public_pem = public_pem
+        self.token_format = token_format
 
     def create_token(self, request, refresh_token=False, save_token=True):
         """Create a BearerToken, by default without refresh token."""
+        return self._create_token(request, refresh_token, save_token)
+
+    def create_tokens(self, requests, refresh_token=False, save_token=True):
+        """Create a BearerToken for each of requests, as create_token does.
+
+        When token_generator provides a generate_many(count) method, such as
+        TokenGenerator.generate_many, the access tokens are generated
+        together through it.
+        """
+        return [self._create_token(request, refresh_token, save_token,
+                                   access_token)
+                for request, access_token
+                in zip(requests, self._access_tokens(requests))]
+
+    def _access_tokens(self, requests):
+        """The access tokens of requests, None when generated one by one."""
+        generate_many = getattr(self.token_generator, 'generate_many', None)
+        if generate_many is None:
+            return [None] * len(requests)
+        return generate_many(len(requests))
+
+    def _create_token(self, request, refresh_token, save_token,
+                      access_token=None):
+        token = self._new_token(request, access_token)
+        if refresh_token:
+            if (request.refresh_token and
+                    not self.request_validator.rotate_refresh_token(request)):
+                token['refresh_token'] = request.refresh_token
+            else:
+                token['refresh_token'] = self.refresh_token_generator(request)
+
+        token.update(request.extra_credentials or {})
+        token = OAuth2Token(token)
+        if save_token:
+            self.request_validator.save_bearer_token(token, request)
+        return token
 
+    def _new_token(self, request, access_token=None):
+        """The token of request but its refresh token and extra credentials,
+        setting request.expires_in.
+        """
         if callable(self.expires_in):
             expires_in = self.expires_in(request)
         else:
@@ -256,8 +493,10 @@ class BearerToken(TokenBase):
 
         request.expires_in = expires_in
 
+        if access_token is None:
+            access_token = self.token_generator(request)
         token = {
-            'access_token': self.token_generator(request),
+            'access_token': access_token,
             'expires_in': expires_in,
             'token_type': 'Bearer',
         }
@@ -270,18 +509,6 @@ class BearerToken(TokenBase):
 
         if request.state is not None:
             token['state'] = request.state
-
-        if refresh_token:
-            if (request.refresh_token and
-                    not self.request_validator.rotate_refresh_token(request)):
-                token['refresh_token'] = request.refresh_token
-            else:
-                token['refresh_token'] = self.refresh_token_generator(request)
-
-        token.update(request.extra_credentials or {})
-        token = OAuth2Token(token)
-        if save_token:
-            self.request_validator.save_bearer_token(token, request)
         return token
 
     def validate_request(self, request):
@@ -290,8 +517,49 @@ class BearerToken(TokenBase):
             token = request.headers.get('Authorization')[7:]
         else:
             token = request.access_token
-        return self.request_validator.validate_bearer_token(
-            token, request.scopes, request)
+        if self.public_pem is not None:
+            valid = self.validate_signed_token(token, request)
+            if valid is not None:
+                return valid
+        if (self.token_format is not None and
+                not self.token_format.check(token, 'access_token')):
+            return False
+        if self.cache is None:
+            return self.request_validator.validate_bearer_token(
+                token, request.scopes, request)
+
+        # validate_bearer_token may replace request.scopes.
+        scopes = request.scopes
+        valid = self.cache.get(token, scopes, request)
+        if valid is None:
+            valid = self.request_validator.validate_bearer_token(
+                token, scopes, request)
+            self.cache.set(token, scopes, valid, request)
+        return valid
+
+    def validate_signed_token(self, token, request):
+        """Verify a signed token with public_pem, None if it is not signed.
+
+        The token must not have expired and must be authorized access to all
+        of request.scopes. The token claims are set as request.claims and its
+        scopes as request.scopes.
+        """
+        import jwt
+
+        if not token or token.count('.') != 2:
+            return None
+        try:
+            claims = common.verify_signed_token(self.public_pem, token)
+        except jwt.InvalidTokenError:
+            return False
+        if 'exp' not in claims:
+            return False
+        scopes = utils.scope_to_list(claims.get('scope')) or []
+        if not set(request.scopes or ()).issubset(scopes):
+            return False
+        request.claims = claims
+        request.scopes = scopes
+        return True
 
     def estimate_type(self, request):
         if request.headers.get('Authorization', '').startswith('Bearer'):
@@ -0,0 +1,148 @@
+from __future__ import unicode_literals, absolute_import
+
+import sys
+
+import mock
+from mock import MagicMock
+from ....unittest import TestCase, skipIf
+
+from oauthlib.oauth1.rfc5849 import Client
+from oauthlib.oauth1 import RequestValidator
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from oauthlib.oauth1.rfc5849.endpoints.aio import (
+        AsyncAccessTokenEndpoint, AsyncRequestTokenEndpoint,
+        AsyncResourceEndpoint, AsyncSignatureOnlyEndpoint)
+
+
+def async_validator(**lookups):
+    """A validator mock whose lookups are coroutines returning the values."""
+    validator = MagicMock(wraps=RequestValidator())
+    validator.check_client_key.return_value = True
+    validator.check_request_token.return_value = True
+    validator.check_access_token.return_value = True
+    validator.check_verifier.return_value = True
+    validator.check_realms.return_value = True
+    validator.allowed_signature_methods = ['HMAC-SHA1']
+    validator.timestamp_lifetime = 600
+    validator.dummy_client = 'dummy'
+    validator.dummy_request_token = 'dummy'
+    validator.dummy_access_token = 'dummy'
+    for name, value in lookups.items():
+        setattr(validator, name, mock.AsyncMock(return_value=value))
+    return validator
+
+
+@skipIf(not hasattr(mock, 'AsyncMock'), 'requires asyncio and AsyncMock')
+class AsyncEndpointTest(TestCase):
+
+    def run_async(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def test_request_token(self):
+        validator = async_validator(
+            get_client_secret='bar', get_default_realms=['foo'],
+            validate_client_key=True, validate_requested_realms=True,
+            validate_redirect_uri=True, validate_timestamp_and_nonce=True,
+            save_request_token=None)
+        endpoint = AsyncRequestTokenEndpoint(validator)
+        client = Client('foo', client_secret='bar', realm='foo',
+                        callback_uri='https://c.b/cb')
+        uri, headers, _ = client.sign('https://i.b/request_token')
+        h, b, s = self.run_async(endpoint.create_request_token_response(
+            uri, headers=headers))
+        self.assertEqual(s, 200)
+        self.assertIn('oauth_token=', b)
+        validator.save_request_token.assert_awaited_once()
+
+        validator.validate_client_key.return_value = False
+        h, b, s = self.run_async(endpoint.create_request_token_response(
+            uri, headers=headers))
+        self.assertEqual(s, 401)
+        validator.get_client_secret.assert_awaited_with('dummy', mock.ANY)
+        validator.validate_requested_realms.assert_awaited_with(
+            'dummy', ['foo'], mock.ANY)
+        validator.validate_redirect_uri.assert_awaited_with(
+            'dummy', 'https://c.b/cb', mock.ANY)
+
+    def test_access_token(self):
+        validator = async_validator(
+            get_client_secret='bar', get_request_token_secret='secret',
+            get_realms=['foo'], validate_client_key=True,
+            validate_request_token=True, validate_verifier=True,
+            validate_timestamp_and_nonce=True, save_access_token=None,
+            invalidate_request_token=None)
+        endpoint = AsyncAccessTokenEndpoint(validator)
+        client = Client('foo', client_secret='bar',
+                        resource_owner_key='token',
+                        resource_owner_secret='secret', verifier='verifier')
+        uri, headers, _ = client.sign('https://i.b/access_token')
+        h, b, s = self.run_async(endpoint.create_access_token_response(
+            uri, headers=headers))
+        self.assertEqual(s, 200)
+        self.assertIn('oauth_authorized_realms=foo', b)
+        validator.save_access_token.assert_awaited_once()
+        validator.invalidate_request_token.assert_awaited_once_with(
+            'foo', 'token', mock.ANY)
+
+        validator.validate_verifier.return_value = False
+        h, b, s = self.run_async(endpoint.create_access_token_response(
+            uri, headers=headers))
+        self.assertEqual(s, 401)
+
+        validator.validate_request_token.return_value = False
+        h, b, s = self.run_async(endpoint.create_access_token_response(
+            uri, headers=headers))
+        self.assertEqual(s, 401)
+        validator.validate_verifier.assert_awaited_with(
+            'foo', 'dummy', 'verifier', mock.ANY)
+
+    def test_resource(self):
+        validator = async_validator(
+            get_client_secret='bar', get_access_token_secret='secret',
+            validate_client_key=True, validate_access_token=True,
+            validate_realms=True, validate_timestamp_and_nonce=True)
+        endpoint = AsyncResourceEndpoint(validator)
+        client = Client('foo', client_secret='bar',
+                        resource_owner_key='token',
+                        resource_owner_secret='secret')
+        uri, headers, _ = client.sign('https://i.b/protected_resource')
+        v, r = self.run_async(endpoint.validate_protected_resource_request(
+            uri, headers=headers, realms=['foo']))
+        self.assertTrue(v)
+        validator.validate_realms.assert_awaited_once_with(
+            'foo', 'token', r, uri=uri, realms=['foo'])
+
+        validator.validate_access_token.return_value = False
+        v, r = self.run_async(endpoint.validate_protected_resource_request(
+            uri, headers=headers))
+        self.assertFalse(v)
+        self.assertTrue(r.validator_log['client'])
+        self.assertFalse(r.validator_log['resource_owner'])
+        validator.get_access_token_secret.assert_awaited_with(
+            'foo', 'dummy', r)
+        validator.validate_realms.assert_awaited_with(
+            'foo', 'dummy', r, uri=uri, realms=None)
+
+    def test_signature_only(self):
+        # Plain validator methods are supported as well.
+        validator = async_validator(
+            validate_client_key=True, validate_timestamp_and_nonce=True)
+        validator.get_client_secret.return_value = 'bar'
+        endpoint = AsyncSignatureOnlyEndpoint(validator)
+        client = Client('foo', client_secret='bar')
+        uri, headers, _ = client.sign('https://i.b/protected_resource')
+        v, r = self.run_async(endpoint.validate_request(uri, headers=headers))
+        self.assertTrue(v)
+
+        v, r = self.run_async(endpoint.validate_request(uri))
+        self.assertFalse(v)
+
+        validator.validate_timestamp_and_nonce.return_value = False
+        v, r = self.run_async(endpoint.validate_request(uri, headers=headers))
+        self.assertFalse(v)
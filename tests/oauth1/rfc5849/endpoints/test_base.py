@@ -4,7 +4,7 @@ from mock import MagicMock
 from re import sub
 from ....unittest import TestCase
 
-from oauthlib.common import safe_string_equals
+from oauthlib.common import LRUCache, safe_string_equals
 from oauthlib.oauth1 import Client, RequestValidator
 from oauthlib.oauth1.rfc5849 import errors, SIGNATURE_RSA, SIGNATURE_HMAC
 from oauthlib.oauth1.rfc5849 import SIGNATURE_PLAINTEXT
@@ -123,6 +123,23 @@ class BaseEndpointTest(TestCase):
                 'https://a.b/', 'GET', 'oauth_version=a&oauth_version=b',
                 URLENCODED)
 
+    def test_params_extraction(self):
+        """Params from every source are collected, oauth_ ones per source."""
+        v = RequestValidator()
+        e = BaseEndpoint(v)
+        headers = {'Authorization': ('OAuth realm="photos", '
+                                     'oauth_signature="a%2Fb", '
+                                     'oauth_consumer_key="foo"')}
+        headers.update(URLENCODED)
+        r = e._create_request('https://a.b/?q=1', 'POST', 'b=2', headers)
+        self.assertEqual(r.signature_type, 'AUTH_HEADER')
+        self.assertEqual(r.signature, 'a/b')
+        self.assertEqual(r.realm, 'photos')
+        self.assertEqual(r.oauth_params,
+                         {'oauth_signature': 'a/b', 'oauth_consumer_key': 'foo'})
+        self.assertItemsEqual(r.params, [('oauth_consumer_key', 'foo'),
+                                         ('b', '2'), ('q', '1')])
+
     def test_mandated_params(self):
         """Ensure all mandatory params are present."""
         v = RequestValidator()
@@ -387,6 +404,19 @@ class SignatureVerificationTest(TestCase):
         r = self.e._create_request(self.uri, 'GET', sig, URLENCODED)
         self.assertTrue(self.e._check_signature(r))
 
+    def test_rsa_key_cache(self):
+        rsa_sig = ("fxFvCx33oKlR9wDquJ%2FPsndFzJphyBa3RFPPIKi3flqK%2BJ7yIrMVbH"
+                   "YTM%2FLHPc7NChWz4F4%2FzRA%2BDN1k08xgYGSBoWJUOW6VvOQ6fbYhMA"
+                   "FkOGYbuGDbje487XMzsAcv6ZjqZHCROSCk5vofgLk2SN7RZ3OrgrFzf4in"
+                   "xetClqA%3D")
+        sig = self.sig % (rsa_sig, "RSA-SHA1")
+        cache = LRUCache()
+        e = BaseEndpoint(ClientValidator(), rsa_key_cache=cache)
+        for _ in range(2):
+            r = e._create_request(self.uri, 'GET', sig, URLENCODED)
+            self.assertTrue(e._check_signature(r))
+            self.assertEqual(len(cache), 1)
+
     def test_plaintext_signature(self):
         plain_sig = "super%252520secret%26even%252520more%252520secret"
         sig = self.sig % (plain_sig, "PLAINTEXT")
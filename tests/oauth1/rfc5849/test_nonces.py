@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+
+import multiprocessing
+import os
+import threading
+
+from mock import patch
+
+from oauthlib.oauth1 import NonceStore, SharedNonceStore, BloomNonceStore
+
+from ...unittest import TestCase, skipIf
+
+
+@patch('time.time', return_value=1500000000)
+class NonceStoreTest(TestCase):
+
+    def test_replay(self, now):
+        store = NonceStore()
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
+        self.assertFalse(store.add('foo', '1500000000', 'abc'))
+        self.assertTrue(store.add('foo', '1500000001', 'abc'))
+        self.assertTrue(store.add('bar', '1500000000', 'abc'))
+        self.assertTrue(store.add('foo', '1500000000', 'abc', 'token'))
+        self.assertFalse(store.add('foo', '1500000000', 'abc', 'token'))
+        self.assertEqual(len(store), 4)
+
+    def test_invalid_timestamp(self, now):
+        store = NonceStore(timestamp_lifetime=600)
+        self.assertFalse(store.add('foo', '1499999399', 'abc'))
+        self.assertFalse(store.add('foo', '1500000601', 'abc'))
+        self.assertFalse(store.add('foo', 'not a timestamp', 'abc'))
+        self.assertFalse(store.add('foo', None, 'abc'))
+        self.assertEqual(len(store), 0)
+
+    def test_expiry(self, now):
+        store = NonceStore(timestamp_lifetime=600, stripes=1)
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
+        now.return_value += 600
+        self.assertFalse(store.add('foo', '1500000000', 'abc'))
+        now.return_value += 1200
+        self.assertTrue(store.add('foo', '1500001800', 'def'))
+        self.assertEqual(len(store), 1)
+
+    def test_concurrent_add(self, now):
+        store = NonceStore()
+        results = []
+
+        def add():
+            for i in range(200):
+                results.append(store.add('foo', '1500000000', str(i)))
+
+        threads = [threading.Thread(target=add) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results.count(True), 200)
+        self.assertEqual(len(store), 200)
+
+    def test_clear(self, now):
+        store = NonceStore()
+        store.add('foo', '1500000000', 'abc')
+        store.clear()
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
+
+
+@patch('time.time', return_value=1500000000)
+class SharedNonceStoreTest(TestCase):
+
+    def test_replay(self, now):
+        store = SharedNonceStore(capacity=64)
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
+        self.assertFalse(store.add('foo', '1500000000', 'abc'))
+        self.assertTrue(store.add('foo', '1500000001', 'abc'))
+        self.assertTrue(store.add('bar', '1500000000', 'abc'))
+        self.assertTrue(store.add('foo', '1500000000', 'abc', 'token'))
+        self.assertFalse(store.add('foo', '1500000000', 'abc', 'token'))
+        self.assertEqual(len(store), 4)
+
+    def test_invalid_timestamp(self, now):
+        store = SharedNonceStore(capacity=64, timestamp_lifetime=600)
+        self.assertFalse(store.add('foo', '1499999399', 'abc'))
+        self.assertFalse(store.add('foo', '1500000601', 'abc'))
+        self.assertFalse(store.add('foo', 'not a timestamp', 'abc'))
+        self.assertEqual(len(store), 0)
+
+    def test_full(self, now):
+        store = SharedNonceStore(capacity=4)
+        for i in range(4):
+            self.assertTrue(store.add('foo', '1500000000', str(i)))
+        self.assertFalse(store.add('foo', '1500000000', 'abc'))
+        for i in range(4):
+            self.assertFalse(store.add('foo', '1500000000', str(i)))
+
+    def test_expired_slots_reused(self, now):
+        store = SharedNonceStore(capacity=4, timestamp_lifetime=600)
+        for i in range(4):
+            self.assertTrue(store.add('foo', '1500000000', str(i)))
+        now.return_value += 601
+        self.assertEqual(len(store), 0)
+        for i in range(4):
+            self.assertTrue(store.add('foo', '1500000601', str(i)))
+        self.assertFalse(store.add('foo', '1500000601', '0'))
+
+    def test_clear(self, now):
+        store = SharedNonceStore(capacity=64)
+        store.add('foo', '1500000000', 'abc')
+        store.clear()
+        self.assertEqual(len(store), 0)
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
+
+    @skipIf(not hasattr(os, 'fork'), 'requires fork')
+    def test_shared_between_processes(self, now):
+        store = SharedNonceStore(capacity=64)
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
+        ctx = multiprocessing.get_context('fork') if hasattr(
+            multiprocessing, 'get_context') else multiprocessing
+        child = ctx.Process(target=store.add,
+                            args=('foo', '1500000000', 'def'))
+        child.start()
+        child.join()
+        self.assertFalse(store.add('foo', '1500000000', 'def'))
+        self.assertEqual(len(store), 2)
+
+
+@patch('time.time', return_value=1500000000)
+class BloomNonceStoreTest(TestCase):
+
+    def test_replay(self, now):
+        store = BloomNonceStore(capacity=1000)
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
+        self.assertFalse(store.add('foo', '1500000000', 'abc'))
+        self.assertTrue(store.add('foo', '1500000001', 'abc'))
+        self.assertTrue(store.add('bar', '1500000000', 'abc'))
+        self.assertTrue(store.add('foo', '1500000000', 'abc', 'token'))
+        self.assertFalse(store.add('foo', '1500000000', 'abc', 'token'))
+
+    def test_invalid_timestamp(self, now):
+        store = BloomNonceStore(capacity=1000, timestamp_lifetime=600)
+        self.assertFalse(store.add('foo', '1499999399', 'abc'))
+        self.assertFalse(store.add('foo', '1500000601', 'abc'))
+        self.assertFalse(store.add('foo', 'not a timestamp', 'abc'))
+
+    def test_false_positive_rate(self, now):
+        store = BloomNonceStore(capacity=2000, false_positive_rate=0.01)
+        added = [store.add('foo', '1500000000', str(i)) for i in range(2000)]
+        self.assertLess(added.count(False), 40)
+        self.assertFalse(any(store.add('foo', '1500000000', str(i))
+                             for i in range(2000)))
+
+    def test_fixed_size(self, now):
+        store = BloomNonceStore(capacity=1000, false_positive_rate=0.01)
+        size = sum(len(f) for f in store._filters)
+        for i in range(5000):
+            store.add('foo', '1500000000', str(i))
+        self.assertEqual(sum(len(f) for f in store._filters), size)
+
+    def test_rotation(self, now):
+        store = BloomNonceStore(capacity=1000, timestamp_lifetime=600)
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
+        now.return_value += 1800
+        self.assertTrue(store.add('foo', '1500001800', 'def'))
+        self.assertFalse(store.add('foo', '1500001800', 'def'))
+        now.return_value -= 1800
+        # The window of the first nonce was cleared when reused.
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
+
+    def test_clear(self, now):
+        store = BloomNonceStore(capacity=1000)
+        store.add('foo', '1500000000', 'abc')
+        store.clear()
+        self.assertTrue(store.add('foo', '1500000000', 'abc'))
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals
+from mock import MagicMock, patch
 from ...unittest import TestCase
 
-from oauthlib.oauth1 import RequestValidator
+from oauthlib.oauth1 import RequestValidator, CachingRequestValidator
 
 
 class RequestValidatorTests(TestCase):
@@ -67,3 +68,69 @@ class RequestValidatorTests(TestCase):
 
         v = FooRealmValidator()
         self.assertTrue(v.check_realms(['foo']))
+
+
+class CachingRequestValidatorTests(TestCase):
+
+    def setUp(self):
+        self.validator = MagicMock(wraps=RequestValidator())
+        self.validator.dummy_client = 'dummy'
+        self.validator.validate_client_key.side_effect = (
+            lambda client_key, request: client_key == 'foo')
+        self.validator.get_client_secret.return_value = 'secret'
+        self.validator.validate_access_token.return_value = True
+        self.validator.get_access_token_secret.return_value = 'token secret'
+        self.cached = CachingRequestValidator(self.validator)
+
+    def test_cached_lookups(self):
+        for _ in range(3):
+            self.assertTrue(self.cached.validate_client_key('foo', None))
+            self.assertEqual(self.cached.get_client_secret('foo', None),
+                             'secret')
+            self.assertTrue(self.cached.validate_access_token(
+                'foo', 'token', None))
+            self.assertEqual(self.cached.get_access_token_secret(
+                'foo', 'token', None), 'token secret')
+        self.assertEqual(self.validator.validate_client_key.call_count, 1)
+        self.assertEqual(self.validator.get_client_secret.call_count, 1)
+        self.assertEqual(self.validator.validate_access_token.call_count, 1)
+        self.assertEqual(self.validator.get_access_token_secret.call_count, 1)
+        self.assertEqual(self.cached.dummy_client, 'dummy')
+
+    @patch('time.time')
+    def test_expiry(self, now):
+        now.return_value = 1000
+        self.assertTrue(self.cached.validate_client_key('foo', None))
+        self.assertFalse(self.cached.validate_client_key('bar', None))
+        now.return_value += 61
+        self.cached.validate_client_key('foo', None)
+        self.cached.validate_client_key('bar', None)
+        self.assertEqual(self.validator.validate_client_key.call_count, 3)
+        now.return_value += 300
+        self.cached.validate_client_key('foo', None)
+        self.assertEqual(self.validator.validate_client_key.call_count, 4)
+
+    def test_invalidation(self):
+        self.cached.validate_client_key('foo', None)
+        self.cached.get_client_secret('foo', None)
+        self.cached.validate_access_token('foo', 'token', None)
+        self.cached.invalidate_client('foo')
+        self.cached.invalidate_token('foo', 'token')
+        self.cached.validate_client_key('foo', None)
+        self.cached.get_client_secret('foo', None)
+        self.cached.validate_access_token('foo', 'token', None)
+        self.assertEqual(self.validator.validate_client_key.call_count, 2)
+        self.assertEqual(self.validator.get_client_secret.call_count, 2)
+        self.assertEqual(self.validator.validate_access_token.call_count, 2)
+
+    def test_invalidate_request_token(self):
+        self.validator.validate_request_token.return_value = True
+        self.validator.invalidate_request_token.return_value = None
+        self.assertTrue(self.cached.validate_request_token(
+            'foo', 'request', None))
+        self.validator.validate_request_token.return_value = False
+        self.cached.invalidate_request_token('foo', 'request', None)
+        self.validator.invalidate_request_token.assert_called_once_with(
+            'foo', 'request', None)
+        self.assertFalse(self.cached.validate_request_token(
+            'foo', 'request', None))
@@ -5,6 +5,10 @@ try:
     from urllib import quote
 except ImportError:
     from urllib.parse import quote
+try:
+    import urlparse
+except ImportError:
+    import urllib.parse as urlparse
 
 from oauthlib.oauth1.rfc5849.signature import collect_parameters
 from oauthlib.oauth1.rfc5849.signature import construct_base_string
@@ -13,7 +17,7 @@ from oauthlib.oauth1.rfc5849.signature import normalize_parameters
 from oauthlib.oauth1.rfc5849.signature import sign_hmac_sha1, sign_hmac_sha1_with_client
 from oauthlib.oauth1.rfc5849.signature import sign_rsa_sha1, sign_rsa_sha1_with_client
 from oauthlib.oauth1.rfc5849.signature import sign_plaintext, sign_plaintext_with_client
-from oauthlib.common import unicode_type
+from oauthlib.common import unicode_type, urldecode, LRUCache
 from ...unittest import TestCase
 
 
@@ -161,6 +165,12 @@ class SignatureTests(TestCase):
         self.assertEquals(normalize_base_string_uri(uri, host),
                           "http://alternatehost.example.com/a-path")
 
+        # test reusing an already parsed URI
+        uri = "HTTP://www.example.com:80/a-path?q=1"
+        self.assertEquals(normalize_base_string_uri(
+            uri, parsed_uri=urlparse.urlparse(uri)),
+            "http://www.example.com/a-path")
+
     def test_collect_parameters(self):
         """We check against parameters multiple times in case things change
         after more parameters are added.
@@ -177,6 +187,10 @@ class SignatureTests(TestCase):
                               ('a3', '2 q')]
         self.assertEqual(sorted(parameters), sorted(correct_parameters))
 
+        # Check against an already decoded uri_query
+        parameters = collect_parameters(uri_query=urldecode(self.uri_query))
+        self.assertEqual(sorted(parameters), sorted(correct_parameters))
+
         headers = {'Authorization': self.authorization_header}
         # check against authorization header as well
         parameters = collect_parameters(
@@ -244,6 +258,15 @@ class SignatureTests(TestCase):
         self.assertEquals(len(sign), 28)
         self.assertEquals(sign, self.control_signature)
 
+        # The keyed HMAC is cached, signing again must give the same result
+        sign = sign_hmac_sha1(self.control_base_string,
+                              self.client_secret.decode('utf-8'),
+                              self.resource_owner_secret.decode('utf-8'))
+        self.assertEquals(sign, self.control_signature)
+        sign = sign_hmac_sha1(self.control_base_string,
+                              self.client_secret.decode('utf-8'), None)
+        self.assertNotEqual(sign, self.control_signature)
+
     def test_sign_hmac_sha1_with_client(self):
         self.assertRaises(ValueError,
             sign_hmac_sha1_with_client,
@@ -313,6 +336,16 @@ Ga6FHdjGPcfajt+nrpB1n8UQBEH9ZxniokR/IPvdMlxqXA==
         sign = sign_rsa_sha1(base_string.decode('utf-8'), private_key)
         self.assertEquals(sign, control_signature)
 
+        # Loaded keys are cached and key objects are accepted as well
+        cache = LRUCache()
+        sign_rsa_sha1(base_string, private_key, key_cache=cache)
+        key, _ = list(cache._items.values())[0]
+        sign = sign_rsa_sha1(base_string, private_key, key_cache=cache)
+        self.assertEquals(sign, control_signature)
+        self.assertEqual(len(cache), 1)
+        sign = sign_rsa_sha1(base_string, key)
+        self.assertEquals(sign, control_signature)
+
 
     def test_sign_rsa_sha1_with_client(self):
         base_string = self.control_base_string_rsa_sha1
@@ -2,10 +2,12 @@
 from __future__ import absolute_import, unicode_literals
 
 from json import loads
+import mock
 from mock import MagicMock
 
 from oauthlib.common import urlencode
 from oauthlib.oauth2 import RequestValidator, RevocationEndpoint
+from oauthlib.oauth2 import ChecksummedTokenFormat
 
 from ....unittest import TestCase
 
@@ -65,6 +67,33 @@ class RevocationEndpointTest(TestCase):
             self.assertEqual(b, '')
             self.assertEqual(s, 200)
 
+    def test_revoke_token_hook(self):
+        on_revoke = MagicMock()
+        endpoint = RevocationEndpoint(self.validator, on_revoke=on_revoke)
+        body = urlencode([('token', 'foo'),
+                          ('token_type_hint', 'access_token')])
+        h, b, s = endpoint.create_revocation_response(self.uri,
+                headers=self.headers, body=body)
+        self.assertEqual(s, 200)
+        on_revoke.assert_called_once_with('foo', 'access_token', mock.ANY)
+
+        on_revoke.reset_mock()
+        self.validator.authenticate_client.return_value = False
+        endpoint.create_revocation_response(self.uri,
+                headers=self.headers, body=body)
+        self.assertFalse(on_revoke.called)
+
+    def test_revoke_token_format(self):
+        token_format = ChecksummedTokenFormat()
+        endpoint = RevocationEndpoint(self.validator, token_format=token_format)
+        for token in ('foo', token_format.generate('refresh_token')):
+            body = urlencode([('token', token)])
+            h, b, s = endpoint.create_revocation_response(self.uri,
+                    headers=self.headers, body=body)
+            self.assertEqual(s, 200)
+        self.validator.revoke_token.assert_called_once_with(
+            token, None, mock.ANY)
+
     def test_revoke_with_callback(self):
         endpoint = RevocationEndpoint(self.validator, enable_jsonp=True)
         callback = 'package.hello_world'
@@ -81,6 +81,8 @@ class AuthorizationCodeGrantTest(TestCase):
         self.assertTrue(self.mock_validator.confirm_redirect_uri.called)
         self.assertTrue(self.mock_validator.validate_grant_type.called)
         self.assertTrue(self.mock_validator.invalidate_authorization_code.called)
+        self.mock_validator.prefetch.assert_called_once_with(
+            self.request, 'authorization_code')
 
     def test_create_token_response_without_refresh_token(self):
         self.auth.refresh_token = False  # Not to issue refresh token.
@@ -4,7 +4,7 @@ from ....unittest import TestCase
 
 import json
 import mock
-from oauthlib.common import Request
+from oauthlib.common import Request, TokenGenerator
 from oauthlib.oauth2.rfc6749.grant_types import ClientCredentialsGrant
 from oauthlib.oauth2.rfc6749.tokens import BearerToken
 
@@ -33,6 +33,47 @@ class ClientCredentialsGrantTest(TestCase):
         self.assertIn('expires_in', token)
         self.assertIn('Content-Type', headers)
         self.assertEqual(headers['Content-Type'], 'application/json')
+        self.mock_validator.prefetch.assert_called_once_with(
+            self.request, 'client_credentials')
+
+    def test_create_token_responses(self):
+        generator = TokenGenerator(length=20)
+        bearer = BearerToken(self.mock_validator, token_generator=generator)
+        with mock.patch.object(generator, 'generate_many',
+                               wraps=generator.generate_many) as generate:
+            responses = self.auth.create_token_responses(
+                [self.request] * 3, bearer)
+        generate.assert_called_once_with(3)
+        tokens = [json.loads(body)['access_token'] for _, body, _ in responses]
+        self.assertEqual(len(set(tokens)), 3)
+        self.assertEqual(len(tokens[0]), 20)
+        self.mock_validator.save_tokens_bulk.assert_called_once_with(
+            [(mock.ANY, self.request)] * 3)
+        self.assertIsNot(responses[0][0], responses[1][0])
+
+    def test_create_token_responses_assertion(self):
+        def authenticate_client(request):
+            params = dict(request.decoded_body)
+            if params.get('client_assertion') != 'valid':
+                return False
+            request.client = mock.MagicMock(client_id='me')
+            return True
+        self.mock_validator.authenticate_client.side_effect = authenticate_client
+
+        requests = []
+        for assertion in ('valid', 'forged'):
+            request = Request('http://a.b/path', body=(
+                'grant_type=client_credentials&client_assertion_type=jwt'
+                '&client_assertion=%s' % assertion))
+            request.scopes = ('mocked', 'scopes')
+            requests.append(request)
+        bearer = BearerToken(self.mock_validator)
+        responses = self.auth.create_token_responses(requests, bearer)
+        self.assertEqual([s for _, _, s in responses], [200, 401])
+        self.assertEqual(json.loads(responses[1][1])['error'],
+                         'invalid_client')
+        self.mock_validator.save_tokens_bulk.assert_called_once_with(
+            [(mock.ANY, requests[0])])
 
     def test_error_response(self):
         bearer = BearerToken(self.mock_validator)
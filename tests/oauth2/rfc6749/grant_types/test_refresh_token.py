@@ -35,6 +35,8 @@ class RefreshTokenGrantTest(TestCase):
         self.assertIn('token_type', token)
         self.assertIn('expires_in', token)
         self.assertEqual(token['scope'], 'foo')
+        self.mock_validator.prefetch.assert_called_once_with(
+            self.request, 'refresh_token')
 
     def test_create_token_inherit_scope(self):
         self.request.scope = None
@@ -40,6 +40,8 @@ class ResourceOwnerPasswordCredentialsGrantTest(TestCase):
         self.assertIn('token_type', token)
         self.assertIn('expires_in', token)
         self.assertIn('refresh_token', token)
+        self.mock_validator.prefetch.assert_called_once_with(
+            self.request, 'password')
         # ensure client_authentication_required() is properly called
         self.mock_validator.client_authentication_required.assert_called_once_with(self.request)
         # fail client authentication
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+
+import json
+import sys
+
+import mock
+
+from oauthlib.common import Request, TokenGenerator
+from oauthlib.oauth2 import BearerTokenCache, Server, RequestValidator
+
+from ...unittest import TestCase, skipIf
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from oauthlib.oauth2.rfc6749.aio import AsyncBearerToken, AsyncServer
+
+
+def validator():
+    def authenticate_client(request):
+        request.client = mock.MagicMock(client_id='me')
+        request.user = 'user'
+        return True
+
+    v = mock.MagicMock(wraps=RequestValidator())
+    for name in ('validate_client_id', 'validate_redirect_uri',
+                 'validate_response_type', 'validate_scopes',
+                 'validate_grant_type', 'validate_code',
+                 'confirm_redirect_uri', 'validate_user',
+                 'validate_refresh_token', 'validate_bearer_token',
+                 'client_authentication_required', 'rotate_refresh_token'):
+        getattr(v, name).return_value = True
+    v.authenticate_client.side_effect = authenticate_client
+    v.get_default_redirect_uri.return_value = 'https://c.b/cb'
+    v.get_default_scopes.return_value = ['all']
+    v.get_original_scopes.return_value = ['all', 'of', 'them']
+    for name in ('save_authorization_code', 'save_token',
+                 'invalidate_authorization_code', 'revoke_token'):
+        getattr(v, name).return_value = None
+    return v
+
+
+@skipIf(not hasattr(mock, 'AsyncMock'), 'requires asyncio and AsyncMock')
+class AsyncServerTest(TestCase):
+
+    token_uri = 'https://i.b/token'
+    auth_uri = ('https://i.b/auth?client_id=me&state=xyz'
+                '&redirect_uri=https%3A%2F%2Fc.b%2Fcb')
+
+    def run_async(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def servers(self, request_validator):
+        generator = lambda request: 'abc'
+        return (Server(request_validator, token_generator=generator),
+                AsyncServer(request_validator, token_generator=generator))
+
+    @mock.patch('oauthlib.common.generate_token', new=lambda: 'abc')
+    def test_same_responses(self):
+        server, async_server = self.servers(validator())
+        calls = [
+            ('create_authorization_response',
+             (self.auth_uri + '&response_type=code',), {'scopes': ['all']}),
+            ('create_authorization_response',
+             (self.auth_uri + '&response_type=token',), {'scopes': ['all']}),
+            ('create_authorization_response',
+             (self.auth_uri + '&response_type=none',), {'scopes': ['all']}),
+            ('create_authorization_response',
+             (self.auth_uri + '&response_type=foo',), {'scopes': ['all']}),
+            ('validate_authorization_request',
+             (self.auth_uri + '&response_type=code',), {}),
+            ('create_token_response', (self.token_uri, 'POST',
+             'grant_type=authorization_code&code=c'), {}),
+            ('create_token_response', (self.token_uri, 'POST',
+             'grant_type=password&username=u&password=p'), {}),
+            ('create_token_response', (self.token_uri, 'POST',
+             'grant_type=client_credentials&scope=all'), {}),
+            ('create_token_response', (self.token_uri, 'POST',
+             'grant_type=refresh_token&refresh_token=r&scope=all'), {}),
+            ('create_token_response', (self.token_uri, 'POST',
+             'grant_type=refresh_token'), {}),
+            ('create_token_response', (self.token_uri, 'POST',
+             'grant_type=foo'), {}),
+            ('verify_request', (self.token_uri,),
+             {'headers': {'Authorization': 'Bearer abc'}}),
+            ('create_revocation_response', (self.token_uri,),
+             {'body': 'token=abc'}),
+            ('create_revocation_response', (self.token_uri,),
+             {'body': 'token=abc&token_type_hint=foo'}),
+            ('create_revocation_response', (self.token_uri,), {}),
+        ]
+        for name, args, kwargs in calls:
+            expected = getattr(server, name)(*args, **kwargs)
+            result = self.run_async(getattr(async_server, name)(
+                *args, **kwargs))
+            if name in ('validate_authorization_request', 'verify_request'):
+                # Compare the results, not the request objects.
+                expected, result = expected[0], result[0]
+            self.assertEqual(result, expected, name)
+
+    def test_async_validator(self):
+        v = validator()
+        for name in ('validate_user', 'validate_grant_type',
+                     'validate_scopes', 'save_token',
+                     'client_authentication_required',
+                     'validate_bearer_token'):
+            setattr(v, name, mock.AsyncMock(
+                return_value=getattr(v, name).return_value))
+        v.authenticate_client = mock.AsyncMock(
+            side_effect=v.authenticate_client.side_effect)
+        _, async_server = self.servers(v)
+
+        h, b, s = self.run_async(async_server.create_token_response(
+            self.token_uri, 'POST',
+            'grant_type=password&username=u&password=p'))
+        self.assertEqual(s, 200)
+        self.assertEqual(json.loads(b)['access_token'], 'abc')
+        v.save_token.assert_awaited_once()
+
+        v.validate_user.return_value = False
+        h, b, s = self.run_async(async_server.create_token_response(
+            self.token_uri, 'POST',
+            'grant_type=password&username=u&password=p'))
+        self.assertEqual(s, 401)
+        self.assertEqual(json.loads(b)['error'], 'invalid_grant')
+
+        valid, r = self.run_async(async_server.verify_request(
+            self.token_uri, headers={'Authorization': 'Bearer abc'},
+            scopes=['all']))
+        self.assertTrue(valid)
+        v.validate_bearer_token.assert_awaited_once_with('abc', ['all'], r)
+
+    def test_bearer_token_cache(self):
+        v = validator()
+        def validate_bearer_token(token, scopes, request):
+            request.expires_in = 3600
+            return True
+        v.validate_bearer_token = mock.AsyncMock(
+            side_effect=validate_bearer_token)
+        cache = BearerTokenCache()
+        async_server = AsyncServer(v)
+        async_server.tokens['Bearer'].cache = cache
+        async_server.on_revoke = cache.revoke_token
+        for _ in range(2):
+            valid, r = self.run_async(async_server.verify_request(
+                self.token_uri, headers={'Authorization': 'Bearer abc'}))
+            self.assertTrue(valid)
+        v.validate_bearer_token.assert_awaited_once()
+
+        self.run_async(async_server.create_revocation_response(
+            self.token_uri, body='token=abc'))
+        self.run_async(async_server.verify_request(
+            self.token_uri, headers={'Authorization': 'Bearer abc'}))
+        self.assertEqual(v.validate_bearer_token.await_count, 2)
+
+    def test_create_token_responses(self):
+        v = validator()
+        v.save_tokens_bulk.return_value = None
+        _, async_server = self.servers(v)
+        body = 'grant_type=client_credentials&scope=all'
+        responses = self.run_async(async_server.create_token_responses(
+            [{'uri': self.token_uri, 'http_method': 'POST', 'body': body}] * 3
+            + [{'uri': self.token_uri, 'body': 'grant_type=foo'}]))
+        self.assertEqual([s for _, _, s in responses], [200, 200, 200, 400])
+        self.assertEqual(v.authenticate_client.call_count, 3)
+        self.assertEqual(len(v.save_tokens_bulk.call_args[0][0]), 3)
+
+    def test_create_tokens(self):
+        generator = TokenGenerator(length=20)
+        bearer = AsyncBearerToken(validator(), token_generator=generator)
+        requests = [Request(self.token_uri) for _ in range(3)]
+        with mock.patch.object(generator, 'generate_many',
+                               wraps=generator.generate_many) as generate:
+            tokens = self.run_async(bearer.create_tokens(
+                requests, refresh_token=True, save_token=False))
+        generate.assert_called_once_with(3)
+        self.assertEqual(len(set(t['access_token'] for t in tokens)), 3)
+        self.assertTrue(all(t['refresh_token'] for t in tokens))
+
+    def test_create_token_responses_assertion(self):
+        # Clients authenticated by an assertion, outside of client_id and
+        # client_secret, are each authenticated.
+        def authenticate_client(request):
+            params = dict(request.decoded_body)
+            if params.get('client_assertion') != 'valid':
+                return False
+            request.client = mock.MagicMock(client_id='me')
+            return True
+
+        v = validator()
+        v.authenticate_client.side_effect = authenticate_client
+        v.save_tokens_bulk.return_value = None
+        _, async_server = self.servers(v)
+        body = ('grant_type=client_credentials&scope=all'
+                '&client_assertion_type=jwt&client_assertion=%s')
+        responses = self.run_async(async_server.create_token_responses([
+            {'uri': self.token_uri, 'http_method': 'POST',
+             'body': body % assertion}
+            for assertion in ('valid', 'forged')]))
+        self.assertEqual([s for _, _, s in responses], [200, 401])
+        self.assertEqual(len(v.save_tokens_bulk.call_args[0][0]), 1)
+
+    def test_unavailable(self):
+        _, async_server = self.servers(validator())
+        async_server.available = False
+        h, b, s = self.run_async(async_server.create_token_response(
+            self.token_uri))
+        self.assertEqual(s, 503)
@@ -1,8 +1,15 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals
+import threading
+
+from mock import MagicMock, patch
+
 from ...unittest import TestCase
 
-from oauthlib.oauth2 import RequestValidator
+from oauthlib.common import Request
+from oauthlib.oauth2 import MemoizingRequestValidator, RequestValidator
+from oauthlib.oauth2 import BackendApplicationServer
+from oauthlib.oauth2 import WriteBehindRequestValidator
 
 class RequestValidatorTest(TestCase):
 
@@ -23,6 +30,7 @@ class RequestValidatorTest(TestCase):
                 ['scope'], 'refresh_token', 'request'))
         self.assertRaises(NotImplementedError, v.invalidate_authorization_code,
                 'client_id', 'code', 'request')
+        self.assertIsNone(v.prefetch('request', 'password'))
         self.assertRaises(NotImplementedError, v.save_authorization_code,
                 'client_id', 'code', 'request')
         self.assertRaises(NotImplementedError, v.save_bearer_token,
@@ -46,3 +54,160 @@ class RequestValidatorTest(TestCase):
         self.assertRaises(NotImplementedError, v.validate_user,
                 'username', 'password', 'client', 'request')
         self.assertTrue(v.client_authentication_required('r'))
+
+    def test_bulk_saves(self):
+        v = RequestValidator()
+        v.save_bearer_token = MagicMock()
+        v.save_authorization_code = MagicMock()
+        v.save_tokens_bulk([('a', 'r'), ('b', 'r')])
+        self.assertEqual(v.save_bearer_token.call_count, 2)
+        v.save_authorization_codes_bulk([('foo', 'c', 'r')])
+        v.save_authorization_code.assert_called_once_with('foo', 'c', 'r')
+
+
+class MemoizingRequestValidatorTest(TestCase):
+
+    def setUp(self):
+        self.validator = MagicMock(wraps=RequestValidator())
+        self.validator.validate_client_id.return_value = True
+        self.validator.validate_scopes.return_value = False
+        self.validator.save_bearer_token.return_value = None
+        self.memoizing = MemoizingRequestValidator(self.validator)
+
+    def test_memoized_per_request(self):
+        request = Request('https://a.b/')
+        for _ in range(2):
+            self.assertTrue(self.memoizing.validate_client_id('foo', request))
+            self.assertFalse(self.memoizing.validate_scopes(
+                'foo', ['a', 'b'], request.client, request=request))
+        self.memoizing.validate_client_id('bar', request)
+        self.assertEqual(self.validator.validate_client_id.call_count, 2)
+        self.assertEqual(self.validator.validate_scopes.call_count, 1)
+
+        self.memoizing.validate_client_id('foo', Request('https://a.b/'))
+        self.assertEqual(self.validator.validate_client_id.call_count, 3)
+
+    def test_not_memoized(self):
+        request = Request('https://a.b/')
+        for _ in range(2):
+            self.memoizing.save_bearer_token({}, request)
+            self.memoizing.validate_client_id('foo', request, {})
+            self.memoizing.validate_client_id('foo', None)
+        self.assertEqual(self.validator.save_bearer_token.call_count, 2)
+        self.assertEqual(self.validator.validate_client_id.call_count, 4)
+
+        memoizing = MemoizingRequestValidator(self.validator,
+                                              memoized=['save_bearer_token'])
+        memoizing.save_bearer_token('token', request)
+        memoizing.save_bearer_token('token', request)
+        self.assertEqual(self.validator.save_bearer_token.call_count, 3)
+
+
+class WriteBehindRequestValidatorTest(TestCase):
+
+    def setUp(self):
+        self.validator = MagicMock(wraps=RequestValidator())
+        self.validator.save_tokens_bulk.return_value = None
+        self.validator.save_authorization_codes_bulk.return_value = None
+        self.validator.validate_bearer_token.return_value = True
+        self.validator.validate_client_id.return_value = True
+        self.write_behind = WriteBehindRequestValidator(
+            self.validator, max_size=3, max_delay=60)
+        self.addCleanup(self.write_behind.flush)
+
+    def test_batches(self):
+        request = Request('https://a.b/')
+        self.write_behind.save_token({'access_token': 'a'}, request)
+        self.write_behind.save_authorization_code('foo', {'code': 'c'}, request)
+        self.assertEqual(self.write_behind.pending, 2)
+        self.assertFalse(self.validator.save_tokens_bulk.called)
+
+        self.write_behind.save_bearer_token({'access_token': 'b'}, request)
+        self.assertEqual(self.write_behind.pending, 0)
+        self.validator.save_tokens_bulk.assert_called_once_with(
+            [({'access_token': 'a'}, request), ({'access_token': 'b'}, request)])
+        self.validator.save_authorization_codes_bulk.assert_called_once_with(
+            [('foo', {'code': 'c'}, request)])
+        self.assertFalse(self.validator.save_bearer_token.called)
+
+    def test_flush_on_read(self):
+        request = Request('https://a.b/')
+        self.write_behind.save_token({'access_token': 'a'}, request)
+        self.write_behind.validate_client_id('foo', request)
+        self.assertEqual(self.write_behind.pending, 1)
+        self.assertTrue(self.write_behind.validate_bearer_token(
+            'a', [], request))
+        self.assertEqual(self.write_behind.pending, 0)
+        self.assertTrue(self.validator.save_tokens_bulk.called)
+
+    def test_flush_on_delay(self):
+        self.write_behind.max_delay = 0.01
+        flushed = threading.Event()
+        self.validator.save_tokens_bulk.side_effect = (
+            lambda tokens: flushed.set())
+        self.write_behind.save_token({'access_token': 'a'}, None)
+        self.assertTrue(flushed.wait(5))
+
+    def test_failed_flush(self):
+        self.validator.save_tokens_bulk.side_effect = ValueError
+        self.write_behind.save_token({'access_token': 'a'}, None)
+        self.assertRaises(ValueError, self.write_behind.flush)
+        self.assertEqual(self.write_behind.pending, 1)
+        self.validator.save_tokens_bulk.side_effect = None
+        self.validator.save_tokens_bulk.return_value = None
+        self.write_behind.flush()
+        self.assertEqual(self.write_behind.pending, 0)
+
+    def test_failed_flush_on_read(self):
+        self.write_behind.max_delay = 0.01
+        flushed = threading.Event()
+        self.validator.save_tokens_bulk.side_effect = ValueError
+        self.write_behind.save_token({'access_token': 'a'}, None)
+        # Reads do not fail because of pending saves.
+        self.assertTrue(self.write_behind.validate_bearer_token(
+            'b', [], None))
+        self.assertEqual(self.write_behind.pending, 1)
+
+        # The failed saves are retried after max_delay.
+        self.validator.save_tokens_bulk.side_effect = (
+            lambda tokens: flushed.set())
+        self.assertTrue(flushed.wait(5))
+        self.assertEqual(self.write_behind.pending, 0)
+
+    def test_read_without_pending_saves(self):
+        with patch.object(self.write_behind, '_flush') as flush:
+            self.write_behind.validate_bearer_token('a', [], None)
+        self.assertFalse(flush.called)
+
+    def test_save_while_flushing(self):
+        saved = []
+
+        def save_tokens_bulk(tokens):
+            # Saves are not blocked by a write in progress.
+            thread = threading.Thread(target=self.write_behind.save_token,
+                                      args=({'access_token': 'b'}, None))
+            thread.start()
+            thread.join(5)
+            saved.append(not thread.is_alive())
+        self.validator.save_tokens_bulk.side_effect = save_tokens_bulk
+        self.write_behind.save_token({'access_token': 'a'}, None)
+        self.write_behind.flush()
+        self.assertEqual(saved, [True])
+        self.assertEqual(self.write_behind.pending, 1)
+        self.validator.save_tokens_bulk.side_effect = None
+
+    def test_server(self):
+        def authenticate_client(request):
+            request.client = MagicMock(client_id='foo')
+            return True
+        self.validator.authenticate_client.side_effect = authenticate_client
+        self.validator.validate_grant_type.return_value = True
+        self.validator.validate_scopes.return_value = True
+        self.validator.get_default_scopes.return_value = ['all']
+        server = BackendApplicationServer(self.write_behind)
+        for _ in range(2):
+            h, b, s = server.create_token_response(
+                'https://i.b/token', 'POST', 'grant_type=client_credentials')
+            self.assertEqual(s, 200)
+        self.assertEqual(self.write_behind.pending, 2)
+        self.assertFalse(self.validator.save_tokens_bulk.called)
@@ -195,6 +195,52 @@ class TokenEndpointTest(TestCase):
         }
         self.assertEqual(json.loads(body), token)
 
+    @mock.patch('oauthlib.common.generate_token', new=lambda: 'abc')
+    def test_create_token_responses(self):
+        def authenticate_client(request):
+            if request.client_secret != 'secret':
+                return False
+            request.client = mock.MagicMock(client_id=request.client_id)
+            return True
+        self.mock_validator.authenticate_client.side_effect = authenticate_client
+
+        def client_credentials(client_id, secret='secret', scope='all'):
+            return {'uri': '', 'body': 'grant_type=client_credentials&scope=%s'
+                    '&client_id=%s&client_secret=%s' % (scope, client_id, secret)}
+
+        responses = self.endpoint.create_token_responses([
+            client_credentials('a'),
+            client_credentials('a', scope='other'),
+            client_credentials('b', secret='wrong'),
+            {'uri': '', 'body': 'grant_type=password&username=a&password=p'
+                     '&client_id=c&client_secret=secret'},
+            client_credentials('b', secret='wrong'),
+            client_credentials('b'),
+        ])
+        self.assertEqual([s for _, _, s in responses],
+                         [200, 200, 401, 200, 401, 200])
+        self.assertEqual(json.loads(responses[1][1])['scope'], 'other')
+        self.assertEqual(json.loads(responses[2][1])['error'], 'invalid_client')
+
+        # Every request is authenticated.
+        self.assertEqual(self.mock_validator.authenticate_client.call_count, 6)
+        self.mock_validator.save_tokens_bulk.assert_called_once_with([
+            (json.loads(responses[i][1]), mock.ANY) for i in (0, 1, 5)])
+        self.assertEqual(self.mock_validator.save_token.call_count, 1)
+
+        self.endpoint.available = False
+        responses = self.endpoint.create_token_responses([{'uri': ''}] * 2)
+        self.assertEqual([s for _, _, s in responses], [503, 503])
+        self.assertIsNot(responses[0][0], responses[1][0])
+
+        self.endpoint.available = True
+        self.endpoint.catch_errors = True
+        self.mock_validator.authenticate_client.side_effect = ValueError
+        responses = self.endpoint.create_token_responses(
+            [client_credentials('a')] * 2)
+        self.assertEqual([s for _, _, s in responses], [500, 500])
+        self.assertIsNot(responses[0][0], responses[1][0])
+
     def test_missing_type(self):
         _, body, _ = self.endpoint.create_token_response('', body='')
         token = {'error': 'unsupported_grant_type'}
@@ -330,6 +376,48 @@ twIDAQAB
         self.assertEqual(claims['scope'], 'all of them')
         self.assertEqual(claims['user_id'], 123)
 
+    @mock.patch('oauthlib.common.generate_token', new=lambda: 'abc')
+    def test_local_verification(self):
+        body = 'grant_type=password&username=a&password=hello&scope=all+of+them'
+        headers, body, status_code = self.endpoint.create_token_response(
+                '', body=body)
+        access_token = json.loads(body)['access_token']
+
+        bearer = tokens.BearerToken(self.mock_validator,
+                                    public_pem=self.public_pem)
+        endpoint = ResourceEndpoint(default_token='Bearer',
+                                    token_types={'Bearer': bearer})
+
+        def verify(token, scopes):
+            return endpoint.verify_request(
+                '', headers={'Authorization': 'Bearer ' + token},
+                scopes=scopes)
+
+        valid, request = verify(access_token, ['all', 'of'])
+        self.assertTrue(valid)
+        self.assertEqual(request.scopes, ['all', 'of', 'them'])
+        self.assertEqual(request.claims['user_id'], 123)
+
+        valid, request = verify(access_token, ['other'])
+        self.assertFalse(valid)
+        valid, request = verify(access_token[:-2], ['all'])
+        self.assertFalse(valid)
+        request = common.Request('')
+        request.scope = 'all'
+        request.claims = {}
+        request.expires_in = -60
+        expired_token = common.generate_signed_token(self.private_pem, request)
+        valid, request = verify(expired_token, ['all'])
+        self.assertFalse(valid)
+        self.assertFalse(self.mock_validator.validate_bearer_token.called)
+
+        # Tokens which are not signed are left to the request validator.
+        self.mock_validator.validate_bearer_token.return_value = True
+        valid, request = verify('abc', ['all'])
+        self.assertTrue(valid)
+        self.mock_validator.validate_bearer_token.assert_called_once_with(
+            'abc', ['all'], request)
+
     @mock.patch('oauthlib.common.generate_token', new=lambda: 'abc')
     def test_client_grant(self):
         body = 'grant_type=client_credentials&scope=all+of+them'
@@ -371,3 +459,41 @@ class ResourceEndpointTest(TestCase):
         valid, request = self.endpoint.verify_request(uri)
         self.assertFalse(valid)
         self.assertEqual(request.token_type, 'Bearer')
+
+    def test_find_token_type(self):
+        bearer = tokens.BearerToken(request_validator=self.mock_validator)
+        other = mock.MagicMock(spec=['estimate_type', 'validate_request'])
+        other.estimate_type.return_value = 1
+        mac = mock.MagicMock(scheme='MAC')
+        endpoint = ResourceEndpoint(default_token='Bearer',
+                token_types={'Bearer': bearer, 'MAC': mac, 'Other': other})
+
+        for header, name in (('Bearer abc', 'Bearer'), ('bearer abc', 'Bearer'),
+                             ('MAC id="abc"', 'MAC')):
+            request = common.Request('http://a.b/path',
+                                     headers={'Authorization': header})
+            self.assertEqual(endpoint.find_token_type(request), name)
+        self.assertFalse(other.estimate_type.called)
+        self.assertFalse(mac.estimate_type.called)
+
+        # Estimated otherwise.
+        mac.estimate_type.return_value = 2
+        request = common.Request('http://a.b/path',
+                                 headers={'Authorization': 'Basic abc'})
+        self.assertEqual(endpoint.find_token_type(request), 'Bearer')
+        self.assertTrue(other.estimate_type.called)
+
+    def test_find_token_type_added(self):
+        bearer = tokens.BearerToken(request_validator=self.mock_validator)
+        endpoint = ResourceEndpoint(default_token='Bearer',
+                                    token_types={'Bearer': bearer})
+        request = common.Request('http://a.b/path',
+                                 headers={'Authorization': 'MAC id="abc"'})
+        self.assertEqual(endpoint.find_token_type(request), 'Bearer')
+
+        # Token types added or replaced after construction are dispatched to.
+        endpoint.tokens['MAC'] = mock.MagicMock(scheme='MAC')
+        self.assertEqual(endpoint.find_token_type(request), 'MAC')
+        endpoint.tokens['MAC'] = mock.MagicMock(scheme='Other')
+        endpoint.tokens['MAC'].estimate_type.return_value = 1
+        self.assertEqual(endpoint.find_token_type(request), 'Bearer')
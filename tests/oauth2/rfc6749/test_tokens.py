@@ -1,7 +1,11 @@
 from __future__ import absolute_import, unicode_literals
 
+from mock import MagicMock, patch
+
 from ...unittest import TestCase
 
+from oauthlib.common import Request
+from oauthlib.oauth2.rfc6749.request_validator import RequestValidator
 from oauthlib.oauth2.rfc6749.tokens import *
 
 
@@ -80,3 +84,187 @@ class TokenTest(TestCase):
         self.assertEqual(prepare_bearer_headers(self.token), self.bearer_headers)
         self.assertEqual(prepare_bearer_body(self.token), self.bearer_body)
         self.assertEqual(prepare_bearer_uri(self.token, uri=self.uri), self.bearer_uri)
+
+
+class BearerTokenTest(TestCase):
+
+    def test_create_tokens(self):
+        class Generator(object):
+            def __call__(self, request):
+                return 'one'
+
+            def generate_many(self, count):
+                return ['many%d' % i for i in range(count)]
+
+        requests = [Request('https://a.b/token') for _ in range(2)]
+        for request in requests:
+            request.scopes = ['all']
+        bearer = BearerToken(MagicMock(), token_generator=Generator(),
+                             expires_in=60)
+        tokens = bearer.create_tokens(requests, save_token=False)
+        self.assertEqual([t['access_token'] for t in tokens],
+                         ['many0', 'many1'])
+        self.assertEqual(tokens[0]['scope'], 'all')
+        self.assertEqual(requests[1].expires_in, 60)
+
+        bearer.token_generator = lambda request: 'one'
+        tokens = bearer.create_tokens(requests, save_token=False)
+        self.assertEqual([t['access_token'] for t in tokens], ['one', 'one'])
+
+
+class BearerTokenCacheTest(TestCase):
+
+    def setUp(self):
+        def validate_bearer_token(token, scopes, request):
+            request.user = 'user'
+            request.scopes = ['all']
+            request.expires_in = 3600
+            return token == 'valid'
+
+        self.validator = MagicMock(wraps=RequestValidator())
+        self.validator.validate_bearer_token.side_effect = validate_bearer_token
+        self.cache = BearerTokenCache(ttl=60, negative_ttl=10)
+        self.bearer = BearerToken(self.validator, cache=self.cache)
+
+    def validate(self, token, scopes=None):
+        request = Request('https://a.b/resource',
+                          headers={'Authorization': 'Bearer ' + token})
+        request.scopes = scopes
+        return self.bearer.validate_request(request), request
+
+    @patch('time.time')
+    def test_cache(self, time):
+        time.return_value = 1000
+        for _ in range(3):
+            valid, request = self.validate('valid', ['read'])
+            self.assertTrue(valid)
+            self.assertEqual(request.user, 'user')
+            self.assertEqual(request.scopes, ['all'])
+            valid, request = self.validate('invalid', ['read'])
+            self.assertFalse(valid)
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 2)
+
+        # Scopes are part of the key.
+        self.validate('valid', ['write'])
+        self.validate('valid')
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 4)
+        self.validate('valid', ['write'])
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 4)
+
+        # Negative results expire first.
+        time.return_value = 1010
+        self.validate('valid', ['read'])
+        self.validate('invalid', ['read'])
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 5)
+        time.return_value = 1060
+        self.validate('valid', ['read'])
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 6)
+
+    @patch('time.time')
+    def test_token_expiry(self, time):
+        def validate_bearer_token(token, scopes, request):
+            request.expires_in = 5
+            return True
+        self.validator.validate_bearer_token.side_effect = validate_bearer_token
+
+        time.return_value = 1000
+        self.validate('valid')
+        time.return_value = 1004
+        self.validate('valid')
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 1)
+        time.return_value = 1005
+        self.validate('valid')
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 2)
+
+    def test_unknown_expiry(self):
+        self.validator.validate_bearer_token.side_effect = None
+        self.validator.validate_bearer_token.return_value = True
+        for _ in range(2):
+            self.assertTrue(self.validate('valid')[0])
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 2)
+
+        self.validator.validate_bearer_token.return_value = False
+        for _ in range(2):
+            self.assertFalse(self.validate('invalid')[0])
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 3)
+
+    def test_client_expiry(self):
+        # An expires_in request parameter is not taken for the token expiry.
+        self.validator.validate_bearer_token.side_effect = None
+        self.validator.validate_bearer_token.return_value = True
+        request = Request('https://a.b/resource?expires_in=100000',
+                          headers={'Authorization': 'Bearer valid'})
+        request.scopes = None
+        for _ in range(2):
+            self.assertTrue(self.bearer.validate_request(request))
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 2)
+
+        # Nor is a value which is not a number.
+        def validate_bearer_token(token, scopes, request):
+            request.expires_in = '100000'
+            return True
+        self.validator.validate_bearer_token.side_effect = validate_bearer_token
+        for _ in range(2):
+            self.assertTrue(self.validate('valid')[0])
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 4)
+
+    def test_invalidate(self):
+        self.validate('valid', ['read'])
+        self.validate('valid', ['write'])
+        self.cache.revoke_token('valid', 'access_token', None)
+        self.validate('valid', ['read'])
+        self.validate('valid', ['write'])
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 4)
+
+    def test_maxsize(self):
+        self.bearer.cache = BearerTokenCache(maxsize=1)
+        self.validate('valid')
+        self.validate('invalid')
+        self.validate('valid')
+        self.assertEqual(self.validator.validate_bearer_token.call_count, 3)
+
+
+class ChecksummedTokenFormatTest(TestCase):
+
+    def test_check(self):
+        for token_format in (ChecksummedTokenFormat(),
+                             ChecksummedTokenFormat(key='secret')):
+            token = token_format.access_token_generator(None)
+            refresh_token = token_format.refresh_token_generator(None)
+            self.assertTrue(token.startswith('at_'))
+            self.assertTrue(refresh_token.startswith('rt_'))
+            self.assertTrue(token_format.check(token))
+            self.assertTrue(token_format.check(token, 'access_token'))
+            self.assertTrue(token_format.check(refresh_token))
+            self.assertFalse(token_format.check(refresh_token, 'access_token'))
+            for invalid in (None, '', 'garbage', token[:-1], token + 'a',
+                            token[:5] + ('a' if token[5] != 'a' else 'b')
+                            + token[6:], 'xx' + token[2:]):
+                self.assertFalse(token_format.check(invalid), invalid)
+
+        # Tokens cannot be forged without the key.
+        token = ChecksummedTokenFormat(key='other').generate()
+        self.assertFalse(ChecksummedTokenFormat(key='secret').check(token))
+        self.assertTrue(ChecksummedTokenFormat(key='other').check(token))
+
+    def test_unknown_token_type(self):
+        token_format = ChecksummedTokenFormat(prefixes=[('access_token', 'at')])
+        token = token_format.generate()
+        self.assertTrue(token_format.check(token))
+        self.assertFalse(token_format.check(token, 'refresh_token'))
+        self.assertRaises(ValueError, token_format.generate, 'refresh_token')
+        self.assertRaises(ValueError, token_format.refresh_token_generator,
+                          None)
+
+    def test_validate_request(self):
+        validator = MagicMock(wraps=RequestValidator())
+        validator.validate_bearer_token.return_value = True
+        token_format = ChecksummedTokenFormat(key='secret')
+        bearer = BearerToken(validator, token_format=token_format)
+        for token, valid in ((token_format.generate(), True),
+                             ('garbage', False),
+                             (token_format.generate('refresh_token'), False)):
+            request = Request('https://a.b/resource',
+                              headers={'Authorization': 'Bearer ' + token})
+            self.assertEqual(bearer.validate_request(request), valid)
+        self.assertEqual(validator.validate_bearer_token.call_count, 1)
@@ -1,6 +1,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals
+import json
+import os
+import shutil
 import sys
+import tempfile
+
+import jwt
+from mock import patch
 
 from .unittest import TestCase
 
@@ -8,12 +15,19 @@ from oauthlib.common import add_params_to_uri
 from oauthlib.common import CaseInsensitiveDict
 from oauthlib.common import extract_params
 from oauthlib.common import generate_client_id
+from oauthlib.common import generate_signed_token
 from oauthlib.common import generate_nonce
 from oauthlib.common import generate_timestamp
 from oauthlib.common import generate_token
+from oauthlib.common import KeyRing
+from oauthlib.common import load_rsa_key
+from oauthlib.common import LRUCache
 from oauthlib.common import Request
+from oauthlib.common import TokenGenerator
+from oauthlib.common import to_unicode
 from oauthlib.common import unicode_type
 from oauthlib.common import urldecode
+from oauthlib.common import verify_signed_token
 
 
 if sys.version_info[0] == 3:
@@ -45,11 +59,20 @@ class EncodingTest(TestCase):
         self.assertItemsEqual(urldecode('foo=bar@spam'), [('foo', 'bar@spam')])
         self.assertItemsEqual(urldecode('foo=bar/baz'), [('foo', 'bar/baz')])
         self.assertItemsEqual(urldecode('foo=bar?baz'), [('foo', 'bar?baz')])
+        self.assertItemsEqual(urldecode('foo=bar+baz'), [('foo', 'bar baz')])
+        self.assertItemsEqual(urldecode('foo=1&&bar'), [('foo', '1'), ('bar', '')])
+        self.assertItemsEqual(urldecode('foo==bar'), [('foo', '=bar')])
+        self.assertItemsEqual(urldecode('foo=%'), [('foo', '%')])
+        self.assertItemsEqual(urldecode('foo=%A'), [('foo', '%A')])
+        self.assertItemsEqual(urldecode('%E5%95%A6=%E5%95%A6'),
+                              [('\u5566', '\u5566')])
         self.assertRaises(ValueError, urldecode, 'foo bar')
         self.assertRaises(ValueError, urldecode, '%R')
         self.assertRaises(ValueError, urldecode, '%RA')
         self.assertRaises(ValueError, urldecode, '%AR')
         self.assertRaises(ValueError, urldecode, '%RR')
+        self.assertRaises(ValueError, urldecode, '%A%20')
+        self.assertRaises(ValueError, urldecode, 'foo=%%41')
 
 
 class ParameterTest(TestCase):
@@ -109,6 +132,13 @@ class GeneratorTest(TestCase):
         for c in token:
             self.assertIn(c, "python")
 
+        # Character sets TokenGenerator does not support.
+        self.assertEqual(generate_token(length=4, chars='a'), 'aaaa')
+        chars = ['%03d' % i for i in range(300)]
+        token = generate_token(length=8, chars=chars)
+        self.assertEqual(len(token), 24)
+        self.assertTrue(token.isdigit())
+
     def test_generate_client_id(self):
         client_id = generate_client_id()
         self.assertEqual(len(client_id), 30)
@@ -121,6 +151,37 @@ class GeneratorTest(TestCase):
         for c in client_id:
             self.assertIn(c, "python")
 
+    def test_token_generator(self):
+        generator = TokenGenerator(length=10, chars='ab', buffer_size=64)
+        self.assertEqual(len(generator()), 10)
+        self.assertEqual(len(generator(None, refresh_token=True)), 10)
+        self.assertEqual(len(generator.generate(length=100)), 100)
+        tokens = generator.generate_many(50)
+        self.assertEqual(len(tokens), 50)
+        for token in tokens:
+            self.assertEqual(len(token), 10)
+            self.assertTrue(set(token).issubset('ab'))
+        tokens = TokenGenerator().generate_many(50)
+        self.assertEqual(len(set(tokens)), 50)
+        self.assertRaises(ValueError, TokenGenerator, chars='a')
+
+    def test_token_generator_bias(self):
+        # Bytes beyond the largest multiple of 3 are rejected.
+        generator = TokenGenerator(chars='abc')
+        with patch('os.urandom', side_effect=[b'\xff\x00\x01\x02' * 2,
+                                              b'\x04' * 4096]):
+            self.assertEqual(generator.generate(length=7), 'abcabcb')
+
+    def test_token_generator_fork(self):
+        generator = TokenGenerator(chars='0123456789abcdef')
+        with patch('os.getpid', return_value=1):
+            generator.generate()
+        buffered = bytes(generator._buffer)
+        with patch('os.getpid', return_value=2):
+            with patch('os.urandom', return_value=b'\x00' * 4096):
+                self.assertEqual(generator.generate(length=4), '0000')
+        self.assertNotEqual(bytes(generator._buffer[:10]), buffered[:10])
+
 
 class RequestTest(TestCase):
 
@@ -139,6 +200,21 @@ class RequestTest(TestCase):
         self.assertEqual(r.decoded_body, [('you', 'shall pass')])
         self.assertEqual(r.headers, {'a': 'b'})
 
+    def test_bytes_like_body(self):
+        for body in (b'you=shall+pass', bytearray(b'you=shall+pass'),
+                     memoryview(b'you=shall+pass')):
+            r = Request(URI, body=body)
+            self.assertEqual(r.body, 'you=shall+pass')
+            self.assertEqual(r.decoded_body, [('you', 'shall pass')])
+
+        r = Request(URI, body=memoryview(b'you=shall+pass'), encoding=None)
+        self.assertIsInstance(r.body, memoryview)
+
+    def test_unicode_headers_not_copied(self):
+        headers = {'Authorization': 'Bearer abc'}
+        self.assertIs(to_unicode(headers), headers)
+        self.assertEqual(to_unicode({b'a': b'b'}), {'a': 'b'})
+
     def test_none_body(self):
         r = Request(URI)
         self.assertEqual(r.decoded_body, None)
@@ -187,6 +263,50 @@ class RequestTest(TestCase):
         with self.assertRaises(AttributeError):
             getattr(r, 'does_not_exist')
 
+    def test_lazy_parsing(self):
+        r = Request(URI + '?foo=%ZZ', body='a=b',
+                    headers={'Authorization': 'Bearer abc'})
+        self.assertEqual(r.headers['Authorization'], 'Bearer abc')
+        self.assertRaises(ValueError, getattr, r, 'client_id')
+
+        r = Request(URI + '?client_id=foo', body='scope=bar')
+        self.assertIs(r.decoded_body, r.decoded_body)
+        self.assertEqual(r.client_id, 'foo')
+        self.assertEqual(r.scope, 'bar')
+        r.scope = 'baz'
+        self.assertEqual(r.scope, 'baz')
+
+    def test_parsed_uri_cache(self):
+        r = Request(URI + '/path?a=b&c=d')
+        self.assertIs(r.parsed_uri, r.parsed_uri)
+        self.assertEqual(r.parsed_uri.path, '/path')
+        self.assertEqual(r.uri_query, 'a=b&c=d')
+        self.assertEqual(r.decoded_query, [('a', 'b'), ('c', 'd')])
+        self.assertEqual(r.uri_query_params, [('a', 'b'), ('c', 'd')])
+
+        r.uri = URI + '?e=f'
+        self.assertEqual(r.parsed_uri.path, '')
+        self.assertEqual(r.decoded_query, [('e', 'f')])
+        self.assertEqual(r.uri_query_params, [('e', 'f')])
+
+    def test_slotted_attributes(self):
+        r = Request(URI + '?code=foo')
+        self.assertIsNone(r.client_id)
+        self.assertEqual(r.code, 'foo')
+        r.code = 'bar'
+        self.assertEqual(r.code, 'bar')
+        del r.code
+        self.assertEqual(r.code, 'foo')
+
+        with self.assertRaises(AttributeError):
+            r.realms
+        r.realms = ['photos']
+        self.assertEqual(r.realms, ['photos'])
+        r.something_else = 'baz'
+        self.assertEqual(r.something_else, 'baz')
+        self.assertEqual(r.__dict__, {'realms': ['photos'],
+                                      'something_else': 'baz'})
+
     def test_sanitizing_authorization_header(self):
         r = Request(URI, headers={'Accept': 'application/json',
                                   'Authorization': 'Basic Zm9vOmJhcg=='}
@@ -228,3 +348,185 @@ class CaseInsensitiveDictTest(TestCase):
         del cid['c']
         self.assertEqual(cid['A'], 'b')
         self.assertEqual(cid['a'], 'b')
+
+    def test_normalized_keys(self):
+        cid = CaseInsensitiveDict({'Content-Type': 'text/plain'})
+        self.assertEqual(cid.get('content-type'), 'text/plain')
+        self.assertEqual(cid.get('Accept', 'x'), 'x')
+        cid['CONTENT-TYPE'] = 'application/json'
+        self.assertEqual(cid, {'CONTENT-TYPE': 'application/json'})
+        self.assertEqual(cid['Content-Type'], 'application/json')
+        self.assertFalse(hasattr(cid, '__dict__'))
+
+
+class LRUCacheTest(TestCase):
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache.get('a'), 1)
+        cache['c'] = 3
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('b', 'default'), 'default')
+        self.assertEqual(cache.pop('a'), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    @patch('time.time', return_value=1000)
+    def test_ttl(self, now):
+        cache = LRUCache(ttl=10)
+        cache['a'] = 1
+        cache.set('b', 2, ttl=20)
+        cache.set('c', None)
+        self.assertIn('c', cache)
+        now.return_value += 10
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.get('a', 'default'), 'default')
+        self.assertEqual(cache.get('b'), 2)
+        now.return_value += 10
+        self.assertIsNone(cache.pop('b'))
+
+
+class KeyRingTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        cls.private_pems = []
+        for _ in range(2):
+            key = rsa.generate_private_key(65537, 2048, default_backend())
+            cls.private_pems.append(key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption()))
+
+    def setUp(self):
+        self.request = Request(URI)
+        self.request.scope = 'all'
+        self.request.expires_in = 60
+        self.request.claims = {'user_id': 123}
+
+    def test_rotation(self):
+        signer = KeyRing()
+        signer.add_key('a', self.private_pems[0], active=True)
+        old_token = generate_signed_token(signer, self.request)
+        self.assertEqual(jwt.get_unverified_header(old_token)['kid'], 'a')
+
+        signer.add_key('b', self.private_pems[1], active=True)
+        token = generate_signed_token(signer, self.request)
+        self.assertEqual(jwt.get_unverified_header(token)['kid'], 'b')
+        self.assertEqual(verify_signed_token(signer, old_token)['user_id'], 123)
+        self.assertEqual(verify_signed_token(signer, token)['user_id'], 123)
+
+        signer.remove_key('a')
+        self.assertRaises(jwt.InvalidTokenError,
+                          verify_signed_token, signer, old_token)
+        self.assertRaises(jwt.InvalidTokenError,
+                          verify_signed_token, signer, token[:-2])
+
+        # Tokens signed with a PEM have no kid.
+        token = generate_signed_token(self.private_pems[1], self.request)
+        self.assertRaises(jwt.InvalidTokenError,
+                          verify_signed_token, signer, token)
+
+    def test_load_rsa_key(self):
+        cache = LRUCache()
+        key = load_rsa_key(self.private_pems[0], cache)
+        self.assertIs(load_rsa_key(self.private_pems[0].decode('utf-8'),
+                                   cache), key)
+        self.assertIs(load_rsa_key(key, cache), key)
+        # PEMs are keyed by digest, private keys are not kept in the cache.
+        self.assertEqual(len(cache._items), 1)
+        self.assertNotIn(self.private_pems[0].decode('utf-8'), cache)
+
+    def test_invalid_keys(self):
+        keys = KeyRing()
+        self.assertRaises(ValueError, keys.add_key, 'a')
+        self.assertRaises(ValueError, keys.sign, {})
+        keys.add_key('a', self.private_pems[0])
+        self.assertIsNone(keys.active_kid)
+        self.assertNotIn('d', keys.jwks()['keys'][0])
+
+    @patch('time.time', return_value=1000)
+    def test_jwks_file(self, now):
+        signer = KeyRing()
+        signer.add_key('a', self.private_pems[0], active=True)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        jwks_file = os.path.join(directory, 'jwks.json')
+        with open(jwks_file, 'w') as f:
+            json.dump(signer.jwks(), f)
+
+        verifier = KeyRing(jwks_file, reload_interval=60)
+        self.assertIn('a', verifier)
+        token = signer.sign({'user_id': 123})
+        self.assertEqual(verifier.verify(token)['user_id'], 123)
+
+        # Keys are picked up from the file, at most once per interval.
+        signer.add_key('b', self.private_pems[1], active=True)
+        with open(jwks_file, 'w') as f:
+            json.dump(signer.jwks(), f)
+        token = signer.sign({'user_id': 123})
+        self.assertRaises(jwt.InvalidTokenError, verifier.verify, token)
+        now.return_value += 60
+        self.assertEqual(verifier.verify(token)['user_id'], 123)
+        self.assertEqual(len(verifier), 2)
+        self.assertRaises(ValueError, verifier.sign, {})
+
+        # Keys withdrawn from the file are dropped, added keys are kept.
+        verifier.add_key('c', public_pem=self.public_pem(1))
+        signer.remove_key('a')
+        with open(jwks_file, 'w') as f:
+            json.dump(signer.jwks(), f)
+        old_token = jwt.encode({'user_id': 123}, self.private_pems[0],
+                               'RS256', headers={'kid': 'a'})
+        self.assertEqual(verifier.verify(old_token)['user_id'], 123)
+        now.return_value += 60
+        self.assertRaises(jwt.InvalidTokenError, verifier.verify, old_token)
+        self.assertNotIn('a', verifier)
+        self.assertIn('b', verifier)
+        self.assertIn('c', verifier)
+
+    @patch('time.time', return_value=1000)
+    def test_jwks_file_errors(self, now):
+        signer = KeyRing()
+        signer.add_key('a', self.private_pems[0], active=True)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        jwks_file = os.path.join(directory, 'jwks.json')
+        with open(jwks_file, 'w') as f:
+            json.dump(signer.jwks(), f)
+        verifier = KeyRing(jwks_file, reload_interval=60)
+        token = signer.sign({'user_id': 123})
+
+        # A half written file keeps the current keys.
+        with open(jwks_file, 'w') as f:
+            f.write(json.dumps(signer.jwks())[:20])
+        now.return_value += 60
+        with patch('oauthlib.common.open', create=True,
+                   side_effect=open) as read:
+            self.assertEqual(verifier.verify(token)['user_id'], 123)
+            # The next attempt waits for the reload interval.
+            self.assertEqual(verifier.verify(token)['user_id'], 123)
+        self.assertEqual(read.call_count, 1)
+
+        # So does a missing file.
+        os.remove(jwks_file)
+        now.return_value += 60
+        self.assertEqual(verifier.verify(token)['user_id'], 123)
+        self.assertIn('a', verifier)
+
+    def public_pem(self, index):
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import serialization
+
+        key = serialization.load_pem_private_key(
+            self.private_pems[index], None, default_backend())
+        return key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo)